@@ -0,0 +1,242 @@
+"""In-process stand-in for the RemoteRelay daemon ``/ha/v1/`` API.
+
+One server hosts any number of simulated devices; device ``n`` lives under the
+``/d/<n>`` prefix, so its base URL is ``http://<host>:<port>/d/<n>``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any
+
+from aiohttp import web
+
+ACCESS_TOKEN = "bench-token"
+TOKEN_LIFETIME_SECONDS = 86400
+
+
+@dataclass
+class FakeDevice:
+    """State of one simulated PC."""
+
+    index: int
+    source_count: int
+    proto_version: str = "3"
+    power_state: str = "on"
+    selected_source_id: str = "src-0"
+    revision: int = 1
+    # Bumped only when names, MACs or sources change; reported by /state.
+    profile_revision: int = 1
+    volume: int = 50
+    muted: bool = False
+    commands_received: int = 0
+    last_command_at: float = 0.0
+
+    @property
+    def device_id(self) -> str:
+        return f"bench-device-{self.index}"
+
+    def profile(self) -> dict[str, Any]:
+        return {
+            "deviceId": self.device_id,
+            "displayName": f"Bench PC {self.index}",
+            "protoVersion": self.proto_version,
+            "revision": self.revision,
+            "powerState": self.power_state,
+            "selectedSourceId": self.selected_source_id,
+            "volume": self.volume,
+            "muted": self.muted,
+            "macAddresses": [{"value": f"02:00:00:00:{self.index // 256:02x}:{self.index % 256:02x}"}],
+            "inputSources": [
+                {"id": f"src-{n}", "name": f"Source {n}", "type": "hdmi"} for n in range(self.source_count)
+            ],
+        }
+
+    def state(self) -> dict[str, Any]:
+        return {
+            "powerState": self.power_state,
+            "selectedSourceId": self.selected_source_id,
+            "volume": self.volume,
+            "muted": self.muted,
+            "profileRevision": self.profile_revision,
+        }
+
+
+@dataclass
+class FakeDaemon:
+    """aiohttp application serving the simulated devices."""
+
+    device_count: int = 1
+    source_count: int = 8
+    latency_seconds: float = 0.0
+    stream: bool = False
+    channel: bool = True
+    state_endpoint: bool = True
+    fail_commands: bool = False
+    devices: list[FakeDevice] = field(default_factory=list)
+    # (path below /ha/v1, HTTP status) of the most recent requests, for tests.
+    request_log: deque[tuple[str, int]] = field(default_factory=lambda: deque(maxlen=1000))
+    _runner: web.AppRunner | None = None
+    port: int = 0
+
+    def __post_init__(self) -> None:
+        self.devices = [FakeDevice(index, self.source_count) for index in range(self.device_count)]
+
+    def base_url(self, index: int) -> str:
+        return f"http://127.0.0.1:{self.port}/d/{index}"
+
+    async def start(self) -> None:
+        app = web.Application(middlewares=[self._log_request])
+        prefix = "/d/{device}/ha/v1"
+        app.router.add_get(f"{prefix}/health", self._health)
+        app.router.add_post(f"{prefix}/pairing/exchange", self._pairing_exchange)
+        app.router.add_post(f"{prefix}/pairing/refresh", self._pairing_refresh)
+        app.router.add_get(f"{prefix}/device", self._device)
+        app.router.add_get(f"{prefix}/state", self._state)
+        app.router.add_post(f"{prefix}/commands", self._command)
+        app.router.add_post(f"{prefix}/commands/batch", self._command_batch)
+        app.router.add_get(f"{prefix}/commands/ws", self._command_channel)
+        app.router.add_get(f"{prefix}/events", self._events)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        self.port = site._server.sockets[0].getsockname()[1]  # noqa: SLF001
+
+    async def stop(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+
+    @web.middleware
+    async def _log_request(self, request: web.Request, handler: Any) -> web.StreamResponse:
+        path = request.path.partition("/ha/v1")[2]
+        try:
+            response = await handler(request)
+        except web.HTTPException as err:
+            self.request_log.append((path, err.status))
+            raise
+        self.request_log.append((path, response.status))
+        return response
+
+    def _device_for(self, request: web.Request) -> FakeDevice:
+        try:
+            return self.devices[int(request.match_info["device"])]
+        except (IndexError, ValueError) as err:
+            raise web.HTTPNotFound() from err
+
+    async def _delay(self) -> None:
+        if self.latency_seconds > 0:
+            await asyncio.sleep(self.latency_seconds)
+
+    @staticmethod
+    def _authorized(request: web.Request) -> bool:
+        return request.headers.get("Authorization") == f"Bearer {ACCESS_TOKEN}"
+
+    async def _health(self, request: web.Request) -> web.Response:
+        await self._delay()
+        return web.json_response({"status": "ok"})
+
+    async def _pairing_exchange(self, request: web.Request) -> web.Response:
+        device = self._device_for(request)
+        await self._delay()
+        return web.json_response(
+            {"accessToken": ACCESS_TOKEN, "expiresIn": TOKEN_LIFETIME_SECONDS, "device": device.profile()}
+        )
+
+    async def _pairing_refresh(self, request: web.Request) -> web.Response:
+        self._device_for(request)
+        await self._delay()
+        if not self._authorized(request):
+            return web.json_response({"message": "Unauthorized"}, status=401)
+        return web.json_response({"accessToken": ACCESS_TOKEN, "expiresIn": TOKEN_LIFETIME_SECONDS})
+
+    async def _device(self, request: web.Request) -> web.Response:
+        device = self._device_for(request)
+        await self._delay()
+        if not self._authorized(request):
+            return web.json_response({"message": "Unauthorized"}, status=401)
+        etag = f'"{device.revision}"'
+        if request.headers.get("If-None-Match") == etag:
+            return web.Response(status=304, headers={"ETag": etag})
+        return web.json_response(device.profile(), headers={"ETag": etag})
+
+    async def _state(self, request: web.Request) -> web.Response:
+        if not self.state_endpoint:
+            raise web.HTTPNotFound()
+        device = self._device_for(request)
+        await self._delay()
+        if not self._authorized(request):
+            return web.json_response({"message": "Unauthorized"}, status=401)
+        return web.json_response(device.state())
+
+    async def _command(self, request: web.Request) -> web.Response:
+        device = self._device_for(request)
+        payload = await request.json()
+        await self._delay()
+        if self.fail_commands:
+            return web.json_response({"message": "Command failed."}, status=500)
+        self._apply(device, payload)
+        return web.json_response({"accepted": True})
+
+    async def _command_batch(self, request: web.Request) -> web.Response:
+        device = self._device_for(request)
+        payload = await request.json()
+        await self._delay()
+        for command in payload.get("commands", []):
+            self._apply(device, command)
+        return web.json_response({"accepted": True})
+
+    async def _command_channel(self, request: web.Request) -> web.WebSocketResponse:
+        if not self.channel:
+            raise web.HTTPNotFound()
+        device = self._device_for(request)
+        if not self._authorized(request):
+            raise web.HTTPUnauthorized()
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        async for message in ws:
+            if message.type is not web.WSMsgType.TEXT:
+                continue
+            frame = json.loads(message.data)
+            await self._delay()
+            self._apply(device, frame.get("command") or {})
+            await ws.send_json({"id": frame.get("id"), "ok": True, "result": {"accepted": True}})
+        return ws
+
+    async def _events(self, request: web.Request) -> web.StreamResponse:
+        if not self.stream:
+            raise web.HTTPNotFound()
+        device = self._device_for(request)
+        response = web.StreamResponse(headers={"Content-Type": "text/event-stream"})
+        await response.prepare(request)
+        await response.write(f"event: device\ndata: {json.dumps(device.profile())}\n\n".encode())
+        try:
+            while True:
+                await asyncio.sleep(15)
+                await response.write(b": keepalive\n\n")
+        except ConnectionResetError:
+            pass
+        return response
+
+    @staticmethod
+    def _apply(device: FakeDevice, payload: dict[str, Any]) -> None:
+        device.commands_received += int(payload.get("count", 1) or 1)
+        device.last_command_at = time.perf_counter()
+        command = payload.get("command")
+        if command == "select_source":
+            device.selected_source_id = str(payload.get("sourceId") or "")
+            device.revision += 1
+        elif command == "power_off":
+            device.power_state = "off"
+            device.revision += 1
+        elif command in ("volume_up", "volume_down"):
+            step = int(payload.get("count", 1) or 1) * (2 if command == "volume_up" else -2)
+            device.volume = max(0, min(100, device.volume + step))
+            device.revision += 1
+        elif command == "mute_toggle":
+            device.muted = not device.muted
+            device.revision += 1
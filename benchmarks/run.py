@@ -0,0 +1,241 @@
+"""Benchmark the RemoteRelay integration against the in-process fake daemon.
+
+Usage::
+
+    python -m benchmarks.run [--entries 1 10 100] [--latency-ms 0] [--sources 8] [--no-channel] [--output bench.json]
+
+Importing the integration package requires Home Assistant. Coordinator and entity benchmarks
+additionally need ``pytest-homeassistant-custom-component`` and are skipped, with a note in the
+report, when it is not installed. Results are written as JSON.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import json
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from benchmarks.fake_daemon import ACCESS_TOKEN, FakeDaemon  # noqa: E402
+from custom_components.remoterelay.api import (  # noqa: E402
+    RemoteRelayLocalApiClient,
+    async_create_daemon_session,
+)
+
+COMMAND_SAMPLES = 200
+CONCURRENT_COMMANDS = 50
+KEY_PRESS_SAMPLES = 50
+
+
+def _summary_ms(samples: list[float]) -> dict[str, float]:
+    ordered = sorted(samples)
+    return {
+        "mean_ms": round(statistics.fmean(ordered) * 1000, 3),
+        "p50_ms": round(ordered[len(ordered) // 2] * 1000, 3),
+        "p95_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1000, 3),
+        "max_ms": round(ordered[-1] * 1000, 3),
+    }
+
+
+async def bench_client(daemon: FakeDaemon) -> dict[str, Any]:
+    """Raw client throughput on one pooled session."""
+    session = async_create_daemon_session()
+    api = RemoteRelayLocalApiClient(session, daemon.base_url(0), ACCESS_TOKEN, "3", owns_session=True)
+    try:
+        await api.async_warm_up()
+        payload = {"command": "navigate", "key": "down"}
+
+        samples: list[float] = []
+        started = time.perf_counter()
+        for _ in range(COMMAND_SAMPLES):
+            t0 = time.perf_counter()
+            await api.async_send_command(payload)
+            samples.append(time.perf_counter() - t0)
+        sequential_elapsed = time.perf_counter() - started
+
+        started = time.perf_counter()
+        await asyncio.gather(*(api.async_send_command(payload) for _ in range(CONCURRENT_COMMANDS)))
+        concurrent_elapsed = time.perf_counter() - started
+
+        started = time.perf_counter()
+        await api.async_send_commands([payload] * 10 + [{"command": "navigate", "key": "ok"}])
+        batch_elapsed = time.perf_counter() - started
+
+        profile_samples: list[float] = []
+        for conditional in (False, True):
+            t0 = time.perf_counter()
+            await api.async_get_device_profile(conditional=conditional)
+            profile_samples.append(time.perf_counter() - t0)
+
+        t0 = time.perf_counter()
+        await api.async_get_device_state()
+        state_elapsed = time.perf_counter() - t0
+
+        return {
+            "commands_per_sec_sequential": round(COMMAND_SAMPLES / sequential_elapsed, 1),
+            "commands_per_sec_concurrent": round(CONCURRENT_COMMANDS / concurrent_elapsed, 1),
+            "command_rtt": _summary_ms(samples),
+            "command_channel": api.channel_connected,
+            "batch_11_commands_ms": round(batch_elapsed * 1000, 3),
+            "profile_fetch_full_ms": round(profile_samples[0] * 1000, 3),
+            "profile_fetch_not_modified_ms": round(profile_samples[1] * 1000, 3),
+            "state_fetch_ms": round(state_elapsed * 1000, 3),
+            "profile_bytes": len(json.dumps(daemon.devices[0].profile())),
+            "state_bytes": len(json.dumps(daemon.devices[0].state())),
+        }
+    finally:
+        await api.async_close()
+
+
+async def bench_integration(daemon: FakeDaemon, entry_count: int) -> dict[str, Any]:
+    """Set up ``entry_count`` config entries and drive coordinators and entities."""
+    from homeassistant import loader
+    from homeassistant.helpers import entity_registry as er
+    from pytest_homeassistant_custom_component.common import MockConfigEntry, async_test_home_assistant
+
+    from custom_components.remoterelay.const import (
+        CONF_ACCESS_TOKEN,
+        CONF_API_BASE_URL,
+        CONF_DEVICE_ID,
+        CONF_DISPLAY_NAME,
+        CONF_PROTO_VERSION,
+        DOMAIN,
+    )
+
+    def mock_entry(index: int, unique_id: str) -> MockConfigEntry:
+        device = daemon.devices[index]
+        return MockConfigEntry(
+            domain=DOMAIN,
+            unique_id=unique_id,
+            title=f"Bench PC {index}",
+            data={
+                CONF_API_BASE_URL: daemon.base_url(index),
+                CONF_ACCESS_TOKEN: ACCESS_TOKEN,
+                CONF_DEVICE_ID: device.device_id,
+                CONF_DISPLAY_NAME: f"Bench PC {index}",
+                CONF_PROTO_VERSION: "3",
+            },
+        )
+
+    async with async_test_home_assistant() as hass:
+        hass.data.pop(loader.DATA_CUSTOM_COMPONENTS, None)
+
+        # Load the integration and its platforms once so their import cost is not counted per entry.
+        warm_up = mock_entry(0, "bench-warm-up")
+        warm_up.add_to_hass(hass)
+        await hass.config_entries.async_setup(warm_up.entry_id)
+        await hass.async_block_till_done()
+        await hass.config_entries.async_remove(warm_up.entry_id)
+        await hass.async_block_till_done()
+
+        gc.collect()
+        tracemalloc.start()
+        baseline, _ = tracemalloc.get_traced_memory()
+        setup_started = time.perf_counter()
+        entries = []
+        for index in range(entry_count):
+            entry = mock_entry(index, daemon.devices[index].device_id)
+            entry.add_to_hass(hass)
+            entries.append(entry)
+            await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+        setup_elapsed = time.perf_counter() - setup_started
+        gc.collect()
+        loaded, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        # Refresh cost: fast-window refreshes bypass fleet pacing so only request and parse time is measured.
+        refresh_samples: list[float] = []
+        cpu_started = time.process_time()
+        for entry in entries:
+            coordinator = entry.runtime_data.coordinator
+            coordinator.async_note_activity()
+            t0 = time.perf_counter()
+            await coordinator.async_refresh()
+            refresh_samples.append(time.perf_counter() - t0)
+        refresh_cpu = time.process_time() - cpu_started
+
+        registry = er.async_get(hass)
+        first_device = daemon.devices[0]
+        button_entity_id = registry.async_get_entity_id("button", DOMAIN, f"{first_device.device_id}-button-down")
+        key_press_samples: list[float] = []
+        for _ in range(KEY_PRESS_SAMPLES):
+            t0 = time.perf_counter()
+            await hass.services.async_call("button", "press", {"entity_id": button_entity_id}, blocking=True)
+            key_press_samples.append(first_device.last_command_at - t0)
+
+        for entry in entries:
+            await hass.config_entries.async_unload(entry.entry_id)
+        await hass.async_block_till_done()
+
+    return {
+        "entries": entry_count,
+        "setup_total_ms": round(setup_elapsed * 1000, 3),
+        "memory_per_entry_kib": round((loaded - baseline) / entry_count / 1024, 1),
+        "refresh_per_device": _summary_ms(refresh_samples),
+        "refresh_cpu_per_device_ms": round(refresh_cpu / entry_count * 1000, 3),
+        "key_press_to_daemon": _summary_ms(key_press_samples),
+    }
+
+
+async def main(args: argparse.Namespace) -> dict[str, Any]:
+    daemon = FakeDaemon(
+        device_count=max(args.entries),
+        source_count=args.sources,
+        latency_seconds=args.latency_ms / 1000,
+        stream=args.stream,
+        channel=not args.no_channel,
+    )
+    await daemon.start()
+    report: dict[str, Any] = {
+        "config": {
+            "latency_ms": args.latency_ms,
+            "sources": args.sources,
+            "stream": args.stream,
+            "channel": not args.no_channel,
+            "python": sys.version.split()[0],
+        },
+    }
+    try:
+        report["client"] = await bench_client(daemon)
+        try:
+            import pytest_homeassistant_custom_component  # noqa: F401
+        except ImportError:
+            report["integration"] = {"skipped": "pytest-homeassistant-custom-component is not installed"}
+        else:
+            report["integration"] = [await bench_integration(daemon, count) for count in args.entries]
+    finally:
+        await daemon.stop()
+    return report
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entries", type=int, nargs="+", default=[1, 10, 100])
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Simulated daemon processing latency.")
+    parser.add_argument("--sources", type=int, default=8, help="Input sources per device profile.")
+    parser.add_argument("--stream", action="store_true", help="Serve the /ha/v1/events stream.")
+    parser.add_argument(
+        "--no-channel", action="store_true", help="Refuse the /ha/v1/commands/ws channel so keys use HTTP POST."
+    )
+    parser.add_argument("--output", type=Path, help="Write the JSON report here instead of stdout.")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    cli_args = _parse_args()
+    result = json.dumps(asyncio.run(main(cli_args)), indent=2)
+    if cli_args.output:
+        cli_args.output.write_text(result + "\n")
+    else:
+        print(result)
@@ -4,16 +4,36 @@ from __future__ import annotations
 
 import logging
 
-from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.core import HomeAssistant, callback
 
-from .api import RemoteRelayLocalApiClient
-from .const import CONF_ACCESS_TOKEN, CONF_API_BASE_URL, DOMAIN
+from .api import RemoteRelayLocalApiClient, async_create_daemon_session
+from .const import (
+    CONF_ACCESS_TOKEN,
+    CONF_API_BASE_URL,
+    CONF_COLLECT_METRICS,
+    CONF_PROTO_VERSION,
+    CONF_TOKEN_EXPIRES_AT,
+    CONF_TOKEN_ISSUED_AT,
+    DEFAULT_COLLECT_METRICS,
+    DOMAIN,
+)
 from .coordinator import RemoteRelayCoordinator
+from .dispatcher import RemoteRelayCommandDispatcher
+from .endpoint import RemoteRelayEndpointTracker
+from .fleet import async_get_fleet
+from .metrics import RemoteRelayApiMetrics
+from .models import RemoteRelayConfigEntry, RemoteRelayRuntimeData
+from .store import RemoteRelayProfileStore
+from .auth import RemoteRelayTokenManager
 
-PLATFORMS: list[Platform] = [Platform.MEDIA_PLAYER, Platform.REMOTE, Platform.BUTTON, Platform.SELECT]
+PLATFORMS: list[Platform] = [
+    Platform.MEDIA_PLAYER,
+    Platform.REMOTE,
+    Platform.BUTTON,
+    Platform.SELECT,
+    Platform.SENSOR,
+]
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -25,18 +45,53 @@ async def async_setup(hass: HomeAssistant, config: dict) -> bool:
     return True
 
 
-async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+async def async_setup_entry(hass: HomeAssistant, entry: RemoteRelayConfigEntry) -> bool:
     """Set up RemoteRelay from a config entry."""
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN].setdefault("logger", _LOGGER)
 
-    session = async_get_clientsession(hass)
     api = RemoteRelayLocalApiClient(
-        session=session,
+        session=async_create_daemon_session(),
         base_url=entry.data[CONF_API_BASE_URL],
         token=entry.data.get(CONF_ACCESS_TOKEN),
+        proto_version=entry.data.get(CONF_PROTO_VERSION),
+        token_issued_at=entry.data.get(CONF_TOKEN_ISSUED_AT),
+        token_expires_at=entry.data.get(CONF_TOKEN_EXPIRES_AT),
+        owns_session=True,
     )
-    coordinator = RemoteRelayCoordinator(hass, entry, api)
+    entry.async_on_unload(api.async_close)
+    token = RemoteRelayTokenManager(hass, entry, api)
+    token.async_start()
+    _async_apply_metrics_option(entry, api)
+    fleet = async_get_fleet(hass)
+    coordinator = RemoteRelayCoordinator(hass, entry, api, fleet, RemoteRelayProfileStore(hass, entry.entry_id))
+    entry.async_on_unload(coordinator.async_shutdown)
+    entry.async_on_unload(fleet.async_register(coordinator))
+    # Entities load from the cached profile; a sleeping PC must not hold up Home Assistant startup.
+    await coordinator.async_load_cached_profile()
+
+    dispatcher = RemoteRelayCommandDispatcher(hass, entry, api, coordinator)
+    dispatcher.async_start()
+    entry.async_on_unload(dispatcher.async_shutdown)
+
+    endpoint = RemoteRelayEndpointTracker(hass, entry, api, coordinator)
+    endpoint.async_start()
+
+    entry.runtime_data = RemoteRelayRuntimeData(
+        api=api, coordinator=coordinator, dispatcher=dispatcher, endpoint=endpoint, token=token
+    )
+
+    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    entry.async_create_background_task(
+        hass, _async_first_refresh(entry, coordinator), name=f"{DOMAIN}_first_refresh_{entry.entry_id}"
+    )
+    coordinator.async_start_event_stream()
+    coordinator.async_start_keep_warm()
+    entry.async_on_unload(entry.add_update_listener(_async_entry_updated))
+    return True
+
+
+async def _async_first_refresh(entry: RemoteRelayConfigEntry, coordinator: RemoteRelayCoordinator) -> None:
     await coordinator.async_refresh()
     if not coordinator.last_update_success:
         _LOGGER.warning(
@@ -45,19 +100,30 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             entry.title,
         )
 
-    hass.data[DOMAIN][entry.entry_id] = {
-        "api": api,
-        "coordinator": coordinator,
-        "logger": _LOGGER,
-    }
 
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
-    return True
+async def _async_entry_updated(hass: HomeAssistant, entry: RemoteRelayConfigEntry) -> None:
+    """Apply option and address changes to the running entry without reloading."""
+    await entry.runtime_data.endpoint.async_apply_entry()
+    entry.runtime_data.endpoint.async_apply_options()
+    entry.runtime_data.coordinator.async_apply_options()
+    entry.runtime_data.dispatcher.async_apply_options()
+    _async_apply_metrics_option(entry, entry.runtime_data.api)
 
 
-async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+@callback
+def _async_apply_metrics_option(entry: RemoteRelayConfigEntry, api: RemoteRelayLocalApiClient) -> None:
+    enabled = entry.options.get(CONF_COLLECT_METRICS, DEFAULT_COLLECT_METRICS)
+    if not enabled:
+        api.metrics = None
+    elif api.metrics is None:
+        api.metrics = RemoteRelayApiMetrics()
+
+
+async def async_unload_entry(hass: HomeAssistant, entry: RemoteRelayConfigEntry) -> bool:
     """Unload a config entry."""
-    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
-    if unload_ok:
-        hass.data.get(DOMAIN, {}).pop(entry.entry_id, None)
-    return unload_ok
+    return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: RemoteRelayConfigEntry) -> None:
+    """Delete the cached profile of a removed config entry."""
+    await RemoteRelayProfileStore(hass, entry.entry_id).async_remove()
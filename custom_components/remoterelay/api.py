@@ -2,11 +2,114 @@
 
 from __future__ import annotations
 
+import asyncio
+import json as jsonlib
+import time
+from collections.abc import AsyncIterator, Callable, Iterable, Mapping, Sequence
+from contextlib import suppress
+from datetime import datetime
+from ipaddress import ip_address
 from typing import Any
 
 import aiohttp
 
-from .const import API_HEADER_AUTHORIZATION, API_TIMEOUT_SECONDS
+from .const import (
+    API_CONNECT_TIMEOUT_SECONDS,
+    API_DNS_CACHE_SECONDS,
+    API_HEADER_AUTHORIZATION,
+    API_KEEPALIVE_SECONDS,
+    API_MAX_CONNECTIONS,
+    API_READ_TIMEOUT_SECONDS,
+    API_TIMEOUT_SECONDS,
+    API_WARM_UP_IDLE_SECONDS,
+    CHANNEL_ACK_TIMEOUT_SECONDS,
+    CHANNEL_COMMANDS,
+    CHANNEL_RETRY_SECONDS,
+    CHANNEL_UNSUPPORTED_RETRY_SECONDS,
+    HAPPY_EYEBALLS_DELAY_SECONDS,
+    STREAM_EVENT_OPEN,
+    STREAM_IDLE_TIMEOUT_SECONDS,
+    TOKEN_RENEW_MARGIN_SECONDS,
+    TOKEN_STATE_EXPIRED,
+    TOKEN_STATE_EXPIRING,
+    TOKEN_STATE_NO_EXPIRY,
+    TOKEN_STATE_REJECTED,
+    TOKEN_STATE_VALID,
+    WAKE_PROBE_TIMEOUT_SECONDS,
+)
+from .breaker import RemoteRelayCircuitBreaker
+from .metrics import RemoteRelayApiMetrics
+
+
+_REQUEST_TIMEOUT = aiohttp.ClientTimeout(
+    total=API_TIMEOUT_SECONDS,
+    connect=API_CONNECT_TIMEOUT_SECONDS,
+    sock_read=API_READ_TIMEOUT_SECONDS,
+)
+_STREAM_TIMEOUT = aiohttp.ClientTimeout(
+    total=None,
+    connect=API_CONNECT_TIMEOUT_SECONDS,
+    sock_read=STREAM_IDLE_TIMEOUT_SECONDS,
+)
+_PROBE_TIMEOUT = aiohttp.ClientTimeout(total=WAKE_PROBE_TIMEOUT_SECONDS)
+_CHANNEL_PATH = "/ha/v1/commands/ws"
+
+
+def async_create_daemon_session() -> aiohttp.ClientSession:
+    """Create a session with a keep-alive connection pool dedicated to one daemon."""
+    connector = aiohttp.TCPConnector(
+        limit=API_MAX_CONNECTIONS,
+        limit_per_host=API_MAX_CONNECTIONS,
+        keepalive_timeout=API_KEEPALIVE_SECONDS,
+        use_dns_cache=True,
+        ttl_dns_cache=API_DNS_CACHE_SECONDS,
+    )
+    return aiohttp.ClientSession(connector=connector, timeout=_REQUEST_TIMEOUT)
+
+
+def format_base_url(host: str, port: int) -> str:
+    """Return the daemon base URL for ``host``, bracketing IPv6 literals."""
+    if ":" in host and not host.startswith("["):
+        host = f"[{host}]"
+    return f"http://{host}:{port}"
+
+
+def usable_addresses(addresses: Iterable[Any] | None) -> list[str]:
+    """Return the distinct advertised addresses a URL can be built from.
+
+    Link-local IPv6 addresses are dropped: they only work with a zone index, which
+    mDNS does not carry.
+    """
+    usable: list[str] = []
+    for address in addresses or ():
+        try:
+            parsed = ip_address(str(address))
+        except ValueError:
+            continue
+        if parsed.version == 6 and parsed.is_link_local:
+            continue
+        if str(parsed) not in usable:
+            usable.append(str(parsed))
+    return usable
+
+
+def parse_token_expiry(data: Mapping[str, Any]) -> float | None:
+    """Return the token expiry of a pairing or refresh response as a Unix timestamp.
+
+    Accepts ``expiresAt`` (ISO 8601 or Unix seconds) or ``expiresIn`` (seconds from now).
+    """
+    expires_at = data.get("expiresAt")
+    if isinstance(expires_at, str):
+        try:
+            return datetime.fromisoformat(expires_at.replace("Z", "+00:00")).timestamp()
+        except ValueError:
+            return None
+    if isinstance(expires_at, (int, float)) and not isinstance(expires_at, bool):
+        return float(expires_at)
+    expires_in = data.get("expiresIn")
+    if isinstance(expires_in, (int, float)) and not isinstance(expires_in, bool):
+        return time.time() + float(expires_in)
+    return None
 
 
 class RemoteRelayApiError(Exception):
@@ -17,24 +120,221 @@ class RemoteRelayPairingError(RemoteRelayApiError):
     """Pairing-specific error."""
 
 
+class RemoteRelayAuthError(RemoteRelayApiError):
+    """The daemon rejected the access token."""
+
+
+class RemoteRelayNotSupportedError(RemoteRelayApiError):
+    """The daemon does not implement the requested endpoint."""
+
+
+class RemoteRelayConnectionError(RemoteRelayApiError):
+    """The daemon could not be reached; counts toward opening the circuit breaker."""
+
+
+class RemoteRelayTimeoutError(RemoteRelayConnectionError):
+    """The daemon did not answer within the request timeout."""
+
+
+class RemoteRelayCircuitOpenError(RemoteRelayApiError):
+    """Request refused without contacting the daemon because the circuit breaker is open."""
+
+
+class RemoteRelayChannelError(RemoteRelayApiError):
+    """The WebSocket command channel is unavailable; the command falls back to HTTP."""
+
+
 class RemoteRelayLocalApiClient:
     """Minimal client for the local daemon API."""
 
-    def __init__(self, session: aiohttp.ClientSession, base_url: str, token: str | None = None) -> None:
+    def __init__(
+        self,
+        session: aiohttp.ClientSession,
+        base_url: str,
+        token: str | None = None,
+        proto_version: Any = None,
+        *,
+        token_issued_at: float | None = None,
+        token_expires_at: float | None = None,
+        owns_session: bool = False,
+    ) -> None:
         self._session = session
+        self._owns_session = owns_session
         self._base_url = base_url.rstrip("/")
         self._token = token
+        self._token_issued_at = token_issued_at
+        self._token_expires_at = token_expires_at
+        self._token_rejected = False
+        self._token_refresh: asyncio.Task[None] | None = None
+        self.token_refreshes = 0
+        self.last_token_refresh_ms: float | None = None
+        # Called with the new token, its issue time and its expiry after every successful refresh.
+        self.token_listener: Callable[[str, float, float | None], None] | None = None
+        self._proto_version = self._parse_proto_version(proto_version)
+        self._profile_etag: str | None = None
+        self._channel: aiohttp.ClientWebSocketResponse | None = None
+        self._channel_lock = asyncio.Lock()
+        self._channel_retry_at = 0.0
+        self._channel_seq = 0
+        self._last_answer_at = 0.0
+        self.metrics: RemoteRelayApiMetrics | None = None
+        self.breaker = RemoteRelayCircuitBreaker()
 
     @property
     def base_url(self) -> str:
         return self._base_url
 
+    @property
+    def proto_version(self) -> int:
+        return self._proto_version
+
+    @property
+    def channel_connected(self) -> bool:
+        """Return True while the WebSocket command channel is open."""
+        return self._channel is not None and not self._channel.closed
+
+    @property
+    def needs_warm_up(self) -> bool:
+        """Return True if the pooled connection may idle out soon or the command channel can be opened."""
+        now = time.monotonic()
+        if now - self._last_answer_at >= API_WARM_UP_IDLE_SECONDS:
+            return True
+        return not self.channel_connected and now >= self._channel_retry_at
+
+    @property
+    def token_expires_at(self) -> float | None:
+        return self._token_expires_at
+
+    @property
+    def token_renew_margin(self) -> float:
+        """Return how long before expiry the token is due for renewal.
+
+        ``TOKEN_RENEW_MARGIN_SECONDS``, or half the lifetime of tokens that live shorter than
+        twice that. Without a known issue time the full margin applies.
+        """
+        if self._token_expires_at is not None and self._token_issued_at is not None:
+            return min(TOKEN_RENEW_MARGIN_SECONDS, (self._token_expires_at - self._token_issued_at) / 2)
+        return TOKEN_RENEW_MARGIN_SECONDS
+
+    @property
+    def token_state(self) -> str:
+        """Return the access token state: valid, expiring, expired, rejected or no_expiry."""
+        if self._token_rejected:
+            return TOKEN_STATE_REJECTED
+        if self._token_expires_at is None:
+            return TOKEN_STATE_NO_EXPIRY
+        remaining = self._token_expires_at - time.time()
+        if remaining <= 0:
+            return TOKEN_STATE_EXPIRED
+        if remaining <= self.token_renew_margin:
+            return TOKEN_STATE_EXPIRING
+        return TOKEN_STATE_VALID
+
+    def set_proto_version(self, value: Any) -> None:
+        """Record the protoVersion advertised by the daemon profile."""
+        self._proto_version = self._parse_proto_version(value)
+
+    def supports(self, min_proto_version: int) -> bool:
+        """Return True if the daemon advertises at least the given protoVersion."""
+        return self._proto_version >= min_proto_version
+
     def with_token(self, token: str) -> "RemoteRelayLocalApiClient":
-        return RemoteRelayLocalApiClient(self._session, self._base_url, token)
+        return RemoteRelayLocalApiClient(self._session, self._base_url, token, self._proto_version)
+
+    async def async_close(self) -> None:
+        """Close the command channel, and the connection pool if this client created it."""
+        await self._async_close_channel()
+        if self._owns_session and not self._session.closed:
+            await self._session.close()
+
+    async def async_rebind(self, base_url: str) -> bool:
+        """Point the client at a new daemon address with a fresh connection pool.
+
+        Returns False if ``base_url`` is already in use. Connections to the old address,
+        including the command channel, are closed and the circuit breaker is reset.
+        """
+        base_url = base_url.rstrip("/")
+        if base_url == self._base_url:
+            return False
+        async with self._channel_lock:
+            await self._async_close_channel()
+        self._base_url = base_url
+        self._profile_etag = None
+        self._channel_retry_at = 0.0
+        self._last_answer_at = 0.0
+        self.breaker.record_success()
+        if self._owns_session:
+            old_session, self._session = self._session, async_create_daemon_session()
+            await old_session.close()
+        return True
+
+    async def async_race(self, base_urls: Sequence[str]) -> str | None:
+        """Race health probes across candidate base URLs and return the first that answers.
+
+        Attempts start in the given order, each ``HAPPY_EYEBALLS_DELAY_SECONDS`` after the
+        previous one or as soon as it fails, so a preferred address that answers promptly wins
+        without opening connections to the others.
+        """
+        failed = [asyncio.Event() for _ in base_urls]
+
+        async def attempt(index: int, base_url: str) -> str | None:
+            if index:
+                with suppress(TimeoutError):
+                    async with asyncio.timeout(HAPPY_EYEBALLS_DELAY_SECONDS):
+                        await failed[index - 1].wait()
+            try:
+                async with self._session.get(f"{base_url}/ha/v1/health", timeout=_PROBE_TIMEOUT) as resp:
+                    if resp.status < 400:
+                        return base_url
+            except (aiohttp.ClientError, TimeoutError):
+                pass
+            failed[index].set()
+            return None
+
+        tasks = [asyncio.create_task(attempt(index, url)) for index, url in enumerate(base_urls)]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                if (winner := await next_done) is not None:
+                    return winner
+            return None
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def async_warm_up(self) -> None:
+        """Open a pooled keep-alive connection and the command channel ahead of the next command.
+
+        The health request is skipped while a recent answer shows the pooled connection is live.
+        """
+        if time.monotonic() - self._last_answer_at >= API_WARM_UP_IDLE_SECONDS:
+            try:
+                await self.async_health()
+            except RemoteRelayApiError:
+                return
+        if time.monotonic() < self._channel_retry_at:
+            return
+        async with self._channel_lock:
+            try:
+                await self._async_open_channel()
+            except RemoteRelayChannelError:
+                pass
 
     async def async_health(self) -> dict[str, Any]:
         return await self._request_json("GET", "/ha/v1/health", authenticated=False)
 
+    async def async_probe(self) -> bool:
+        """Return True if the daemon answers a health check within the short probe timeout.
+
+        Probes bypass the circuit breaker and skip request metrics so a booting PC does not
+        skew failure rates; a successful probe closes the breaker.
+        """
+        try:
+            await self._async_perform("GET", "/ha/v1/health", None, False, None, _PROBE_TIMEOUT)
+        except RemoteRelayApiError:
+            return False
+        self.breaker.record_success()
+        return True
+
     async def async_exchange_pairing_code(
         self,
         pairing_code: str,
@@ -57,12 +357,240 @@ class RemoteRelayLocalApiClient:
         except RemoteRelayApiError as err:
             raise RemoteRelayPairingError(str(err)) from err
 
-    async def async_get_device_profile(self) -> dict[str, Any]:
-        return await self._request_json("GET", "/ha/v1/device")
+    async def async_refresh_token(self) -> None:
+        """Renew the access token over the local API.
+
+        Concurrent callers share one in-flight request. Raises ``RemoteRelayAuthError`` if the
+        daemon no longer accepts the token and the device has to be paired again.
+        """
+        if self._token_refresh is None:
+            self._token_refresh = asyncio.create_task(self._async_refresh_token())
+            self._token_refresh.add_done_callback(self._token_refresh_done)
+        await asyncio.shield(self._token_refresh)
+
+    def _token_refresh_done(self, task: asyncio.Task[None]) -> None:
+        self._token_refresh = None
+        if not task.cancelled():
+            # Retrieved by the waiting callers; avoids "exception never retrieved" if they are gone.
+            task.exception()
+
+    async def _async_refresh_token(self) -> None:
+        started = time.perf_counter()
+        try:
+            _, _, data = await self._async_perform(
+                "POST", "/ha/v1/pairing/refresh", None, True, None, _REQUEST_TIMEOUT
+            )
+        except RemoteRelayAuthError:
+            self._token_rejected = True
+            raise
+        token = data.get("accessToken") if data else None
+        if not isinstance(token, str) or not token:
+            raise RemoteRelayApiError("Token refresh returned no accessToken.")
+        self._token = token
+        self._token_issued_at = time.time()
+        self._token_expires_at = parse_token_expiry(data)
+        self._token_rejected = False
+        self.token_refreshes += 1
+        self.last_token_refresh_ms = round((time.perf_counter() - started) * 1000, 1)
+        if self.token_listener is not None:
+            self.token_listener(token, self._token_issued_at, self._token_expires_at)
+
+    async def async_get_device_profile(self, *, conditional: bool = False) -> dict[str, Any] | None:
+        """Fetch the device profile.
+
+        With ``conditional`` the last seen ETag is sent as ``If-None-Match`` and ``None`` is
+        returned when the daemon answers 304 Not Modified.
+        """
+        headers: dict[str, str] = {}
+        if conditional and self._profile_etag:
+            headers["If-None-Match"] = self._profile_etag
+
+        _, response_headers, data = await self._request("GET", "/ha/v1/device", headers=headers)
+        if data is None:
+            return None
+        self._profile_etag = response_headers.get("ETag")
+        return data
+
+    async def async_get_device_state(self) -> dict[str, Any]:
+        """Fetch the lightweight live state: power, selected source, volume and ``profileRevision``.
+
+        Requires ``PROTO_VERSION_STATE_ENDPOINT``.
+        """
+        return await self._request_json("GET", "/ha/v1/state")
 
     async def async_send_command(self, payload: dict[str, Any]) -> dict[str, Any]:
+        """Send one command, over the WebSocket channel for navigation and media keys.
+
+        Falls back to a regular HTTP POST only if the frame could not be sent; once it has
+        been sent the daemon may have run the command, so a missing ack is an error.
+        """
+        if (
+            payload.get("command") in CHANNEL_COMMANDS
+            and self.breaker.closed
+            and time.monotonic() >= self._channel_retry_at
+        ):
+            try:
+                return await self._async_send_over_channel(payload)
+            except RemoteRelayChannelError:
+                pass
         return await self._request_json("POST", "/ha/v1/commands", json=payload)
 
+    async def async_send_commands(self, commands: list[dict[str, Any]]) -> dict[str, Any]:
+        """Send an ordered command sequence in one request.
+
+        Each step is a regular command payload; an optional ``delayMs`` is applied by the
+        daemon after that step. Requires ``PROTO_VERSION_BATCH_COMMANDS``.
+        """
+        return await self._request_json("POST", "/ha/v1/commands/batch", json={"commands": commands})
+
+    async def async_stream_events(self) -> AsyncIterator[tuple[str, dict[str, Any]]]:
+        """Subscribe to the daemon server-sent event stream.
+
+        Yields ``(event, payload)`` tuples. A synthetic ``open`` event is yielded once the
+        daemon accepts the subscription so callers can tell a live stream from a pending one.
+        """
+        headers = {"Accept": "text/event-stream"}
+        if self._token:
+            headers[API_HEADER_AUTHORIZATION] = f"Bearer {self._token}"
+
+        url = f"{self._base_url}/ha/v1/events"
+        try:
+            async with self._session.get(url, headers=headers, timeout=_STREAM_TIMEOUT) as resp:
+                if resp.status in (404, 405, 501):
+                    raise RemoteRelayNotSupportedError(f"Event stream not supported (HTTP {resp.status}).")
+                if resp.status == 401:
+                    raise RemoteRelayAuthError("Event stream rejected the access token.")
+                if resp.status >= 400:
+                    raise RemoteRelayApiError(f"HTTP {resp.status}")
+
+                self.breaker.record_success()
+                yield STREAM_EVENT_OPEN, {}
+
+                event = "message"
+                data_lines: list[str] = []
+                async for raw_line in resp.content:
+                    line = raw_line.decode(errors="ignore").rstrip("\r\n")
+                    if not line:
+                        if data_lines:
+                            payload = self._parse_event_data(data_lines)
+                            if payload is not None:
+                                yield event, payload
+                        event = "message"
+                        data_lines = []
+                        continue
+                    if line.startswith(":"):
+                        continue
+                    field, _, value = line.partition(":")
+                    value = value[1:] if value.startswith(" ") else value
+                    if field == "event":
+                        event = value or "message"
+                    elif field == "data":
+                        data_lines.append(value)
+        except (aiohttp.ClientError, TimeoutError) as err:
+            raise RemoteRelayApiError(str(err) or "Event stream interrupted.") from err
+
+    async def _async_send_over_channel(self, payload: dict[str, Any]) -> dict[str, Any]:
+        """Send one framed command and wait for the daemon's ack with the same ``id``.
+
+        Raises ``RemoteRelayChannelError`` only while nothing was sent, so the caller can
+        safely retry over HTTP; failures after the frame went out are not retryable.
+        """
+        async with self._channel_lock:
+            channel = await self._async_open_channel()
+            self._channel_seq += 1
+            message_id = self._channel_seq
+            started = time.perf_counter()
+            try:
+                await channel.send_json({"id": message_id, "command": payload})
+            except (aiohttp.ClientError, ConnectionResetError) as err:
+                self._record(_CHANNEL_PATH, started, error=True)
+                await self._async_close_channel(CHANNEL_RETRY_SECONDS)
+                raise RemoteRelayChannelError(str(err) or "Command channel failed.") from err
+            try:
+                async with asyncio.timeout(CHANNEL_ACK_TIMEOUT_SECONDS):
+                    ack = await self._async_receive_ack(channel, message_id)
+            except TimeoutError as err:
+                self._record(_CHANNEL_PATH, started, error=True, timeout=True)
+                await self._async_close_channel(CHANNEL_RETRY_SECONDS)
+                raise RemoteRelayTimeoutError(
+                    f"No ack for {payload.get('command')} within {CHANNEL_ACK_TIMEOUT_SECONDS}s."
+                ) from err
+            except (aiohttp.ClientError, ConnectionResetError, RemoteRelayChannelError) as err:
+                self._record(_CHANNEL_PATH, started, error=True)
+                await self._async_close_channel(CHANNEL_RETRY_SECONDS)
+                raise RemoteRelayConnectionError(str(err) or "Command channel closed before the ack.") from err
+
+        rejected = ack.get("ok") is False
+        self._record(_CHANNEL_PATH, started, error=rejected)
+        if rejected:
+            raise RemoteRelayApiError(str(ack.get("message") or "Command rejected."))
+        result = ack.get("result")
+        return result if isinstance(result, dict) else {}
+
+    @staticmethod
+    async def _async_receive_ack(channel: aiohttp.ClientWebSocketResponse, message_id: int) -> dict[str, Any]:
+        while True:
+            message = await channel.receive()
+            if message.type is not aiohttp.WSMsgType.TEXT:
+                raise RemoteRelayChannelError(f"Command channel closed ({message.type.name}).")
+            try:
+                ack = jsonlib.loads(message.data)
+            except ValueError:
+                continue
+            # Acks for commands that already timed out are skipped.
+            if isinstance(ack, dict) and ack.get("id") == message_id:
+                return ack
+
+    async def _async_open_channel(self) -> aiohttp.ClientWebSocketResponse:
+        """Return the open command channel, connecting first if needed. Call with the lock held."""
+        if self._channel is not None and not self._channel.closed:
+            return self._channel
+
+        headers: dict[str, str] = {}
+        if self._token:
+            headers[API_HEADER_AUTHORIZATION] = f"Bearer {self._token}"
+        try:
+            async with asyncio.timeout(API_CONNECT_TIMEOUT_SECONDS):
+                self._channel = await self._session.ws_connect(
+                    f"{self._base_url}{_CHANNEL_PATH}", headers=headers, autoping=True
+                )
+        except aiohttp.WSServerHandshakeError as err:
+            unsupported = err.status in (404, 405, 501)
+            self._channel_retry_at = time.monotonic() + (
+                CHANNEL_UNSUPPORTED_RETRY_SECONDS if unsupported else CHANNEL_RETRY_SECONDS
+            )
+            raise RemoteRelayChannelError(f"Command channel refused (HTTP {err.status}).") from err
+        except (aiohttp.ClientError, TimeoutError) as err:
+            self._channel_retry_at = time.monotonic() + CHANNEL_RETRY_SECONDS
+            raise RemoteRelayChannelError(str(err) or "Command channel connect timed out.") from err
+        return self._channel
+
+    async def _async_close_channel(self, retry_after: float = 0) -> None:
+        channel, self._channel = self._channel, None
+        if retry_after:
+            self._channel_retry_at = time.monotonic() + retry_after
+        if channel is not None and not channel.closed:
+            await channel.close()
+
+    def _record(self, path: str, started: float, *, error: bool = False, timeout: bool = False) -> None:
+        if self.metrics is not None:
+            self.metrics.record(path, time.perf_counter() - started, error=error, timeout=timeout)
+
+    @staticmethod
+    def _parse_proto_version(value: Any) -> int:
+        try:
+            return int(str(value).strip().split(".", 1)[0])
+        except (TypeError, ValueError):
+            return 1
+
+    @staticmethod
+    def _parse_event_data(data_lines: list[str]) -> dict[str, Any] | None:
+        try:
+            payload = jsonlib.loads("\n".join(data_lines))
+        except ValueError:
+            return None
+        return payload if isinstance(payload, dict) else None
+
     async def _request_json(
         self,
         method: str,
@@ -71,19 +599,113 @@ class RemoteRelayLocalApiClient:
         json: dict[str, Any] | None = None,
         authenticated: bool = True,
     ) -> dict[str, Any]:
-        headers: dict[str, str] = {}
+        _, _, data = await self._request(method, path, json=json, authenticated=authenticated)
+        if data is None:
+            raise RemoteRelayApiError("Empty response.")
+        return data
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        *,
+        json: dict[str, Any] | None = None,
+        authenticated: bool = True,
+        headers: dict[str, str] | None = None,
+    ) -> tuple[int, Mapping[str, str], dict[str, Any] | None]:
+        """Perform a request; a 304 response yields ``None`` data without reading the body.
+
+        Raises ``RemoteRelayCircuitOpenError`` at once while the circuit breaker is open.
+        """
+        breaker = self.breaker
+        if not breaker.allow():
+            raise RemoteRelayCircuitOpenError(
+                f"RemoteRelay daemon unreachable; retrying in {breaker.retry_in:.0f}s."
+            )
+
+        started = time.perf_counter()
+        try:
+            result = await self._async_perform_authorized(method, path, json, authenticated, headers)
+        except RemoteRelayConnectionError as err:
+            breaker.record_failure()
+            self._record(path, started, error=True, timeout=isinstance(err, RemoteRelayTimeoutError))
+            raise
+        except RemoteRelayApiError:
+            # The daemon answered, even if with an error.
+            breaker.record_success()
+            self._last_answer_at = time.monotonic()
+            self._record(path, started, error=True)
+            raise
+        except BaseException:
+            breaker.release()
+            raise
+        breaker.record_success()
+        self._last_answer_at = time.monotonic()
+        self._record(path, started)
+        return result
+
+    async def _async_perform_authorized(
+        self,
+        method: str,
+        path: str,
+        json: dict[str, Any] | None,
+        authenticated: bool,
+        headers: dict[str, str] | None,
+    ) -> tuple[int, Mapping[str, str], dict[str, Any] | None]:
+        """Perform a request, renewing the token and retrying once if the daemon answers 401.
+
+        Requests rejected while a refresh is in flight wait for it instead of starting another;
+        requests sent with a token that has since been replaced are simply retried.
+        """
+        token = self._token
+        try:
+            return await self._async_perform(method, path, json, authenticated, headers, _REQUEST_TIMEOUT)
+        except RemoteRelayAuthError:
+            if not authenticated or not token:
+                raise
+        if self._token == token:
+            try:
+                await self.async_refresh_token()
+            except RemoteRelayNotSupportedError as err:
+                self._token_rejected = True
+                raise RemoteRelayAuthError("Access token rejected and the daemon cannot renew it.") from err
+        return await self._async_perform(method, path, json, authenticated, headers, _REQUEST_TIMEOUT)
+
+    async def _async_perform(
+        self,
+        method: str,
+        path: str,
+        json: dict[str, Any] | None,
+        authenticated: bool,
+        headers: dict[str, str] | None,
+        timeout: aiohttp.ClientTimeout,
+    ) -> tuple[int, Mapping[str, str], dict[str, Any] | None]:
+        request_headers: dict[str, str] = dict(headers) if headers else {}
         if authenticated and self._token:
-            headers[API_HEADER_AUTHORIZATION] = f"Bearer {self._token}"
+            request_headers[API_HEADER_AUTHORIZATION] = f"Bearer {self._token}"
 
         url = f"{self._base_url}{path}"
-        timeout = aiohttp.ClientTimeout(total=API_TIMEOUT_SECONDS)
         try:
-            async with self._session.request(method, url, json=json, headers=headers, timeout=timeout) as resp:
+            async with self._session.request(
+                method, url, json=json, headers=request_headers, timeout=timeout
+            ) as resp:
+                if resp.status == 304:
+                    return resp.status, resp.headers, None
+                if resp.status in (404, 405, 501):
+                    raise RemoteRelayNotSupportedError(f"{path} not supported (HTTP {resp.status}).")
                 data = await resp.json(content_type=None)
                 if resp.status >= 400:
-                    raise RemoteRelayApiError(data.get("message", f"HTTP {resp.status}"))
+                    message = data.get("message") if isinstance(data, dict) else None
+                    if resp.status == 401:
+                        raise RemoteRelayAuthError(message or "HTTP 401")
+                    raise RemoteRelayApiError(message or f"HTTP {resp.status}")
                 if not isinstance(data, dict):
                     raise RemoteRelayApiError("Invalid JSON response type.")
-                return data
+                return resp.status, resp.headers, data
+        except TimeoutError as err:
+            # Before ClientConnectionError: aiohttp's connect and read timeouts subclass both.
+            raise RemoteRelayTimeoutError(str(err) or f"Timed out after {timeout.total}s.") from err
+        except aiohttp.ClientConnectionError as err:
+            raise RemoteRelayConnectionError(str(err) or type(err).__name__) from err
         except aiohttp.ClientError as err:
             raise RemoteRelayApiError(str(err)) from err
@@ -0,0 +1,115 @@
+"""Access token lifecycle for RemoteRelay."""
+
+from __future__ import annotations
+
+import logging
+import time
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.util import dt as dt_util
+
+from .api import (
+    RemoteRelayApiError,
+    RemoteRelayAuthError,
+    RemoteRelayLocalApiClient,
+    RemoteRelayNotSupportedError,
+)
+from .const import (
+    CONF_ACCESS_TOKEN,
+    CONF_TOKEN_EXPIRES_AT,
+    CONF_TOKEN_ISSUED_AT,
+    DOMAIN,
+    TOKEN_RENEW_RETRY_SECONDS,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class RemoteRelayTokenManager:
+    """Renew the daemon access token ahead of its expiry and persist every renewed token.
+
+    Renewal is due ``token_renew_margin`` before expiry, the same point from which the token
+    reads as expiring, and is retried while the PC is unreachable. Tokens renewed by the client after
+    a 401 are persisted the same way.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry: ConfigEntry, api: RemoteRelayLocalApiClient) -> None:
+        self.hass = hass
+        self.entry = entry
+        self._api = api
+        self._unsub_renew: Any = None
+        self._renew_at: float | None = None
+        self._renew_supported = True
+
+    @callback
+    def async_start(self) -> None:
+        self._api.token_listener = self._async_token_refreshed
+        self.entry.async_on_unload(self._async_cancel_renew)
+        self._async_schedule_renew()
+
+    @callback
+    def _async_cancel_renew(self) -> None:
+        if self._unsub_renew is not None:
+            self._unsub_renew()
+            self._unsub_renew = None
+        self._renew_at = None
+
+    @callback
+    def _async_schedule_renew(self, delay: float | None = None) -> None:
+        self._async_cancel_renew()
+        if delay is None:
+            expires_at = self._api.token_expires_at
+            if expires_at is None or not self._renew_supported:
+                return
+            remaining = expires_at - time.time()
+            delay = max(remaining - self._api.token_renew_margin, 0)
+        self._renew_at = time.time() + delay
+        self._unsub_renew = async_call_later(self.hass, delay, self._async_renew_due)
+
+    @callback
+    def _async_renew_due(self, _now: Any) -> None:
+        self._unsub_renew = None
+        self.entry.async_create_background_task(
+            self.hass, self._async_renew(), name=f"{DOMAIN}_token_renew_{self.entry.entry_id}"
+        )
+
+    async def _async_renew(self) -> None:
+        try:
+            await self._api.async_refresh_token()
+        except RemoteRelayAuthError:
+            self._renew_at = None
+            _LOGGER.warning("%s: RemoteRelay rejected the access token; pair the device again", self.entry.title)
+        except RemoteRelayNotSupportedError:
+            self._renew_supported = False
+            self._renew_at = None
+            _LOGGER.debug("%s: RemoteRelay daemon cannot renew access tokens", self.entry.title)
+        except RemoteRelayApiError as err:
+            _LOGGER.debug("%s: access token renewal failed, retrying: %s", self.entry.title, err)
+            self._async_schedule_renew(TOKEN_RENEW_RETRY_SECONDS)
+
+    @callback
+    def _async_token_refreshed(self, token: str, issued_at: float, expires_at: float | None) -> None:
+        """Store a renewed token so a restart does not fall back to the old one."""
+        self.hass.config_entries.async_update_entry(
+            self.entry,
+            data={
+                **self.entry.data,
+                CONF_ACCESS_TOKEN: token,
+                CONF_TOKEN_ISSUED_AT: issued_at,
+                CONF_TOKEN_EXPIRES_AT: expires_at,
+            },
+        )
+        self._async_schedule_renew()
+
+    def as_dict(self) -> dict[str, Any]:
+        expires_at = self._api.token_expires_at
+        return {
+            "state": self._api.token_state,
+            "expires_at": dt_util.utc_from_timestamp(expires_at).isoformat() if expires_at else None,
+            "next_renewal": dt_util.utc_from_timestamp(self._renew_at).isoformat() if self._renew_at else None,
+            "refreshes": self._api.token_refreshes,
+            "last_refresh_ms": self._api.last_token_refresh_ms,
+        }
@@ -0,0 +1,92 @@
+"""Circuit breaker guarding requests to one RemoteRelay daemon."""
+
+from __future__ import annotations
+
+import time
+from typing import Any
+
+from .const import (
+    BREAKER_CLOSED,
+    BREAKER_COOLDOWN_SECONDS,
+    BREAKER_FAILURE_THRESHOLD,
+    BREAKER_HALF_OPEN,
+    BREAKER_MAX_COOLDOWN_SECONDS,
+    BREAKER_OPEN,
+)
+
+
+class RemoteRelayCircuitBreaker:
+    """Fail fast while a daemon keeps refusing or timing out connections.
+
+    After ``BREAKER_FAILURE_THRESHOLD`` consecutive connection failures the breaker opens
+    for a cool-down, then lets a single half-open request through. Success closes it; another
+    failure reopens it with a doubled cool-down.
+    """
+
+    __slots__ = ("_state", "_failures", "_cooldown", "_open_until", "_trips")
+
+    def __init__(self) -> None:
+        self._state = BREAKER_CLOSED
+        self._failures = 0
+        self._cooldown = float(BREAKER_COOLDOWN_SECONDS)
+        self._open_until = 0.0
+        self._trips = 0
+
+    @property
+    def state(self) -> str:
+        """Return closed, open or half_open; an expired cool-down reads as half_open."""
+        if self._state == BREAKER_OPEN and time.monotonic() >= self._open_until:
+            return BREAKER_HALF_OPEN
+        return self._state
+
+    @property
+    def closed(self) -> bool:
+        return self._state == BREAKER_CLOSED
+
+    @property
+    def retry_in(self) -> float:
+        """Return seconds until the next half-open request is allowed."""
+        if self._state != BREAKER_OPEN:
+            return 0.0
+        return max(0.0, self._open_until - time.monotonic())
+
+    def allow(self) -> bool:
+        """Return True if a request may go out; claims the half-open slot when it is due."""
+        if self._state == BREAKER_CLOSED:
+            return True
+        if self._state == BREAKER_OPEN and time.monotonic() >= self._open_until:
+            self._state = BREAKER_HALF_OPEN
+            return True
+        return False
+
+    def record_success(self) -> None:
+        self._state = BREAKER_CLOSED
+        self._failures = 0
+        self._cooldown = float(BREAKER_COOLDOWN_SECONDS)
+
+    def record_failure(self) -> None:
+        if self._state == BREAKER_HALF_OPEN:
+            self._cooldown = min(self._cooldown * 2, BREAKER_MAX_COOLDOWN_SECONDS)
+            self._trip()
+            return
+        self._failures += 1
+        if self._state == BREAKER_CLOSED and self._failures >= BREAKER_FAILURE_THRESHOLD:
+            self._trip()
+
+    def release(self) -> None:
+        """Give back a half-open slot whose request was cancelled before it finished."""
+        if self._state == BREAKER_HALF_OPEN:
+            self._state = BREAKER_OPEN
+
+    def _trip(self) -> None:
+        self._state = BREAKER_OPEN
+        self._open_until = time.monotonic() + self._cooldown
+        self._trips += 1
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "state": self.state,
+            "consecutive_failures": self._failures,
+            "retry_in_seconds": round(self.retry_in, 1),
+            "trips": self._trips,
+        }
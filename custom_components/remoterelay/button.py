@@ -11,6 +11,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import CONF_DEVICE_ID, CONF_DISPLAY_NAME, DOMAIN, REMOTE_BUTTONS, REMOTE_DIRECT_COMMANDS, REMOTE_NAV_KEYS
+from .models import RemoteRelayConfigEntry
 
 NAV_KEYS = set(REMOTE_NAV_KEYS)
 DIRECT_COMMANDS = set(REMOTE_DIRECT_COMMANDS)
@@ -18,15 +19,15 @@ DIRECT_COMMANDS = set(REMOTE_DIRECT_COMMANDS)
 
 async def async_setup_entry(
     hass: HomeAssistant,
-    entry: ConfigEntry,
+    entry: RemoteRelayConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up RemoteRelay buttons from config entry."""
-    runtime = hass.data[DOMAIN][entry.entry_id]
-    coordinator = runtime["coordinator"]
-    api = runtime["api"]
+    runtime = entry.runtime_data
+    coordinator = runtime.coordinator
+    dispatcher = runtime.dispatcher
     entities = [
-        RemoteRelayCommandButton(entry, coordinator, api, definition)
+        RemoteRelayCommandButton(entry, coordinator, dispatcher, definition)
         for definition in REMOTE_BUTTONS
     ]
     async_add_entities(entities)
@@ -37,10 +38,10 @@ class RemoteRelayCommandButton(CoordinatorEntity, ButtonEntity):
 
     _attr_should_poll = False
 
-    def __init__(self, entry: ConfigEntry, coordinator, api, definition: dict[str, Any]) -> None:
+    def __init__(self, entry: ConfigEntry, coordinator, dispatcher, definition: dict[str, Any]) -> None:
         super().__init__(coordinator)
         self._entry = entry
-        self._api = api
+        self._dispatcher = dispatcher
         self._command_key = str(definition["key"])
         self._label = str(definition["label"])
         self._attr_icon = str(definition.get("icon") or "mdi:remote")
@@ -67,13 +68,15 @@ class RemoteRelayCommandButton(CoordinatorEntity, ButtonEntity):
 
     async def async_press(self) -> None:
         if self._command_key in NAV_KEYS:
-            await self._api.async_send_command({"command": "navigate", "key": self._command_key})
+            await self._dispatcher.async_send_command({"command": "navigate", "key": self._command_key})
+            return
+
+        if self._command_key == "power_off":
+            await self._dispatcher.async_send_command({"command": "power_off"}, optimistic={"power_state": "off"})
             return
 
         if self._command_key in DIRECT_COMMANDS:
-            await self._api.async_send_command({"command": self._command_key})
-            if self._command_key == "power_off":
-                await self.coordinator.async_request_refresh()
+            await self._dispatcher.async_send_command({"command": self._command_key})
             return
 
         raise ValueError(f"Unsupported button command: {self._command_key}")
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import time
 from typing import Any
 from uuid import uuid4
 
@@ -11,21 +12,59 @@ from homeassistant import config_entries
 from homeassistant.const import CONF_HOST, CONF_NAME, CONF_PORT
 from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
+from homeassistant.helpers import selector
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
-from .api import RemoteRelayLocalApiClient, RemoteRelayPairingError
+from .api import (
+    RemoteRelayLocalApiClient,
+    RemoteRelayPairingError,
+    format_base_url,
+    parse_token_expiry,
+    usable_addresses,
+)
 from .const import (
     CONF_ACCESS_TOKEN,
     CONF_API_BASE_URL,
+    CONF_BUFFER_OFFLINE_COMMANDS,
+    CONF_COLLECT_METRICS,
     CONF_DEVICE_ID,
     CONF_DISPLAY_NAME,
+    CONF_FAST_POLL_INTERVAL,
+    CONF_FAST_POLL_WINDOW,
+    CONF_HOST_ADDRESSES,
     CONF_INPUT_SOURCES,
+    CONF_MACROS,
     CONF_MAC_ADDRESSES,
+    CONF_MAX_POLL_BACKOFF,
+    CONF_MDNS_RERESOLVE,
+    CONF_OFF_POLL_INTERVAL,
+    CONF_OFFLINE_COMMAND_TTL,
+    CONF_POLL_INTERVAL,
     CONF_PROTO_VERSION,
     CONF_SELECTED_SOURCE_ID,
+    CONF_TOKEN_EXPIRES_AT,
+    CONF_TOKEN_ISSUED_AT,
+    CONF_WOL_BROADCAST_ADDRESSES,
+    CONF_WOL_BURST_COUNT,
+    CONF_WOL_BURST_SPACING_MS,
+    CONF_WOL_INTERFACES,
+    CONF_ZEROCONF_NAME,
     DEFAULT_API_PORT,
+    DEFAULT_BUFFER_OFFLINE_COMMANDS,
+    DEFAULT_COLLECT_METRICS,
+    DEFAULT_FAST_POLL_INTERVAL_SECONDS,
+    DEFAULT_FAST_POLL_WINDOW_SECONDS,
+    DEFAULT_MAX_POLL_BACKOFF_SECONDS,
+    DEFAULT_MDNS_RERESOLVE,
+    DEFAULT_OFF_POLL_INTERVAL_SECONDS,
+    DEFAULT_OFFLINE_COMMAND_TTL_SECONDS,
+    DEFAULT_POLL_INTERVAL_SECONDS,
+    DEFAULT_WOL_BURST_COUNT,
+    DEFAULT_WOL_BURST_SPACING_MS,
     DOMAIN,
 )
+from .macros import format_macros_text, parse_macros_text
+from .models import normalize_input_sources
 
 CONF_PAIRING_CODE = "pairing_code"
 
@@ -41,6 +80,8 @@ class RemoteRelayConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         self._discovered_device_id: str | None = None
         self._discovered_display_name: str | None = None
         self._discovered_proto: str = "1"
+        self._discovered_zeroconf_name: str | None = None
+        self._discovered_addresses: list[str] = []
 
     async def async_step_user(self, user_input: dict[str, Any] | None = None) -> FlowResult:
         """Zeroconf-first entry point."""
@@ -88,22 +129,28 @@ class RemoteRelayConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         self._discovered_display_name = self._txt_get(txt, "display_name") or discovery_info.name.rstrip(".")
         self._discovered_proto = self._txt_get(txt, "proto") or "1"
 
-        await self.async_set_unique_id(device_id)
-        self._abort_if_unique_id_configured(
-            updates={
-                CONF_HOST: str(getattr(discovery_info, "host", getattr(discovery_info, "hostname", ""))),
-                CONF_PORT: int(getattr(discovery_info, "port", DEFAULT_API_PORT)),
-            }
-        )
-
         host = getattr(discovery_info, "host", None)
         if host is None and getattr(discovery_info, "ip_address", None) is not None:
             host = str(discovery_info.ip_address)
-        if not host:
+        port = int(getattr(discovery_info, "port", None) or DEFAULT_API_PORT)
+        self._discovered_zeroconf_name = str(discovery_info.name)
+        self._discovered_addresses = usable_addresses(
+            getattr(discovery_info, "ip_addresses", None) or ([host] if host else [])
+        )
+
+        await self.async_set_unique_id(device_id)
+        if host:
+            # The running entry re-binds its client and races the advertised addresses; no reload needed.
+            self._abort_if_unique_id_configured(
+                updates=self._discovery_updates(device_id, str(host), port),
+                reload_on_update=False,
+            )
+        else:
+            self._abort_if_unique_id_configured()
             return self.async_abort(reason="cannot_connect")
 
         self._pending_host = str(host)
-        self._pending_port = int(getattr(discovery_info, "port", DEFAULT_API_PORT))
+        self._pending_port = port
 
         return await self.async_step_pair()
 
@@ -116,7 +163,7 @@ class RemoteRelayConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         if user_input is not None:
             session = async_get_clientsession(self.hass)
-            base_url = f"http://{self._pending_host}:{self._pending_port}"
+            base_url = format_base_url(self._pending_host, self._pending_port)
             api = RemoteRelayLocalApiClient(session=session, base_url=base_url)
             try:
                 await api.async_health()
@@ -142,15 +189,21 @@ class RemoteRelayConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 data = {
                     CONF_API_BASE_URL: base_url,
                     CONF_ACCESS_TOKEN: paired.get("accessToken"),
+                    CONF_TOKEN_ISSUED_AT: time.time(),
+                    CONF_TOKEN_EXPIRES_AT: parse_token_expiry(paired),
                     CONF_DEVICE_ID: device_id,
                     CONF_DISPLAY_NAME: title,
                     CONF_MAC_ADDRESSES: [m.get("value") for m in device.get("macAddresses", []) if isinstance(m, dict)],
-                    CONF_INPUT_SOURCES: self._normalize_profile_sources(device.get("inputSources")),
+                    CONF_INPUT_SOURCES: normalize_input_sources(device.get("inputSources")),
                     CONF_SELECTED_SOURCE_ID: str(device.get("selectedSourceId") or "").strip(),
                     CONF_PROTO_VERSION: str(device.get("protoVersion") or self._discovered_proto or "1"),
                     CONF_HOST: self._pending_host,
                     CONF_PORT: self._pending_port,
                 }
+                if self._discovered_zeroconf_name:
+                    data[CONF_ZEROCONF_NAME] = self._discovered_zeroconf_name
+                if self._discovered_addresses:
+                    data[CONF_HOST_ADDRESSES] = self._discovered_addresses
                 return self.async_create_entry(title=title, data=data)
 
         schema = vol.Schema({vol.Required(CONF_PAIRING_CODE): str})
@@ -169,8 +222,28 @@ class RemoteRelayConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     @staticmethod
     @callback
     def async_get_options_flow(config_entry: config_entries.ConfigEntry) -> config_entries.OptionsFlow:
-        """Return options flow (placeholder for future settings)."""
-        return RemoteRelayOptionsFlow()
+        """Return options flow for polling and instrumentation settings."""
+        return RemoteRelayOptionsFlow(config_entry)
+
+    def _discovery_updates(self, device_id: str, host: str, port: int) -> dict[str, Any]:
+        """Return entry data to refresh from a rediscovery.
+
+        The address the running entry already uses is kept while it is still advertised,
+        so a periodic re-announcement does not undo the winner of the last race.
+        """
+        updates: dict[str, Any] = {CONF_PORT: port, CONF_ZEROCONF_NAME: self._discovered_zeroconf_name}
+        if self._discovered_addresses:
+            updates[CONF_HOST_ADDRESSES] = self._discovered_addresses
+        entry = next(
+            (entry for entry in self._async_current_entries(include_ignore=False) if entry.unique_id == device_id),
+            None,
+        )
+        current = entry.data.get(CONF_API_BASE_URL) if entry is not None else None
+        advertised = {format_base_url(address, port) for address in self._discovered_addresses}
+        if current not in advertised:
+            updates[CONF_HOST] = host
+            updates[CONF_API_BASE_URL] = format_base_url(host, port)
+        return updates
 
     @staticmethod
     def _txt_get(txt: dict[Any, Any], key: str) -> str | None:
@@ -184,41 +257,88 @@ class RemoteRelayConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             return value.decode(errors="ignore")
         return str(value)
 
-    @staticmethod
-    def _normalize_profile_sources(value: Any) -> list[dict[str, str]]:
-        if not isinstance(value, list):
-            return []
-
-        normalized: list[dict[str, str]] = []
-        seen_ids: set[str] = set()
-        for item in value:
-            if not isinstance(item, dict):
-                continue
-
-            source_id = str(item.get("id") or "").strip()
-            if not source_id:
-                continue
-
-            source_id_key = source_id.lower()
-            if source_id_key in seen_ids:
-                continue
-            seen_ids.add(source_id_key)
-
-            source_name = str(item.get("name") or "").strip() or "Unknown"
-            source_type = str(item.get("type") or "").strip()
-            normalized.append(
-                {
-                    "id": source_id,
-                    "name": source_name,
-                    "type": source_type,
-                }
-            )
-
-        return normalized
-
 
 class RemoteRelayOptionsFlow(config_entries.OptionsFlow):
-    """Placeholder options flow."""
+    """Options flow for RemoteRelay polling, instrumentation, Wake-on-LAN, buffering, discovery and macros."""
+
+    def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
+        # OptionsFlow.config_entry only exists from Home Assistant 2024.11.
+        self._entry = config_entry
 
     async def async_step_init(self, user_input: dict[str, Any] | None = None) -> FlowResult:
-        return self.async_create_entry(title="", data={})
+        errors: dict[str, str] = {}
+        if user_input is not None:
+            try:
+                macros = parse_macros_text(user_input.get(CONF_MACROS, ""))
+            except ValueError:
+                errors[CONF_MACROS] = "invalid_macro"
+            else:
+                return self.async_create_entry(
+                    title="", data={**self._entry.options, **user_input, CONF_MACROS: macros}
+                )
+
+        options = {**self._entry.options, **(user_input or {})}
+        macros_text = options.get(CONF_MACROS) or ""
+        if not isinstance(macros_text, str):
+            macros_text = format_macros_text(macros_text)
+        schema = vol.Schema(
+            {
+                vol.Required(
+                    CONF_POLL_INTERVAL,
+                    default=options.get(CONF_POLL_INTERVAL, DEFAULT_POLL_INTERVAL_SECONDS),
+                ): vol.All(vol.Coerce(float), vol.Range(min=1, max=300)),
+                vol.Required(
+                    CONF_FAST_POLL_INTERVAL,
+                    default=options.get(CONF_FAST_POLL_INTERVAL, DEFAULT_FAST_POLL_INTERVAL_SECONDS),
+                ): vol.All(vol.Coerce(float), vol.Range(min=0.2, max=5)),
+                vol.Required(
+                    CONF_FAST_POLL_WINDOW,
+                    default=options.get(CONF_FAST_POLL_WINDOW, DEFAULT_FAST_POLL_WINDOW_SECONDS),
+                ): vol.All(vol.Coerce(float), vol.Range(min=0, max=120)),
+                vol.Required(
+                    CONF_OFF_POLL_INTERVAL,
+                    default=options.get(CONF_OFF_POLL_INTERVAL, DEFAULT_OFF_POLL_INTERVAL_SECONDS),
+                ): vol.All(vol.Coerce(float), vol.Range(min=5, max=600)),
+                vol.Required(
+                    CONF_MAX_POLL_BACKOFF,
+                    default=options.get(CONF_MAX_POLL_BACKOFF, DEFAULT_MAX_POLL_BACKOFF_SECONDS),
+                ): vol.All(vol.Coerce(float), vol.Range(min=5, max=3600)),
+                vol.Required(
+                    CONF_COLLECT_METRICS,
+                    default=options.get(CONF_COLLECT_METRICS, DEFAULT_COLLECT_METRICS),
+                ): bool,
+                vol.Required(
+                    CONF_WOL_BURST_COUNT,
+                    default=options.get(CONF_WOL_BURST_COUNT, DEFAULT_WOL_BURST_COUNT),
+                ): vol.All(vol.Coerce(int), vol.Range(min=1, max=10)),
+                vol.Required(
+                    CONF_WOL_BURST_SPACING_MS,
+                    default=options.get(CONF_WOL_BURST_SPACING_MS, DEFAULT_WOL_BURST_SPACING_MS),
+                ): vol.All(vol.Coerce(int), vol.Range(min=0, max=2000)),
+                vol.Optional(
+                    CONF_WOL_BROADCAST_ADDRESSES,
+                    default=options.get(CONF_WOL_BROADCAST_ADDRESSES, ""),
+                ): str,
+                vol.Optional(
+                    CONF_WOL_INTERFACES,
+                    default=options.get(CONF_WOL_INTERFACES, ""),
+                ): str,
+                vol.Required(
+                    CONF_BUFFER_OFFLINE_COMMANDS,
+                    default=options.get(CONF_BUFFER_OFFLINE_COMMANDS, DEFAULT_BUFFER_OFFLINE_COMMANDS),
+                ): bool,
+                vol.Required(
+                    CONF_OFFLINE_COMMAND_TTL,
+                    default=options.get(CONF_OFFLINE_COMMAND_TTL, DEFAULT_OFFLINE_COMMAND_TTL_SECONDS),
+                ): vol.All(vol.Coerce(float), vol.Range(min=1, max=600)),
+                vol.Required(
+                    CONF_MDNS_RERESOLVE,
+                    default=options.get(CONF_MDNS_RERESOLVE, DEFAULT_MDNS_RERESOLVE),
+                ): bool,
+                vol.Optional(
+                    CONF_MACROS,
+                    default=macros_text,
+                ): selector.TextSelector(selector.TextSelectorConfig(multiline=True)),
+            }
+        )
+        return self.async_show_form(step_id="init", data_schema=schema, errors=errors)
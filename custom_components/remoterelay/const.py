@@ -7,21 +7,113 @@ DOMAIN = "remoterelay"
 ZEROCONF_SERVICE_TYPE = "_remoterelay._tcp.local."
 DEFAULT_API_PORT = 49171
 DEFAULT_POLL_INTERVAL_SECONDS = 5
+DEFAULT_FAST_POLL_INTERVAL_SECONDS = 0.5
+DEFAULT_FAST_POLL_WINDOW_SECONDS = 10
+DEFAULT_OFF_POLL_INTERVAL_SECONDS = 30
+DEFAULT_MAX_POLL_BACKOFF_SECONDS = 300
+POLL_BACKOFF_JITTER = 0.2
 
 CONF_DEVICE_ID = "device_id"
 CONF_DISPLAY_NAME = "display_name"
 CONF_ACCESS_TOKEN = "access_token"
 CONF_TOKEN_EXPIRES_AT = "token_expires_at"
+CONF_TOKEN_ISSUED_AT = "token_issued_at"
 CONF_MAC_ADDRESSES = "mac_addresses"
 CONF_INPUT_SOURCES = "input_sources"
 CONF_SELECTED_SOURCE_ID = "selected_source_id"
 CONF_BROADCAST_ADDRESS = "broadcast_address"
 CONF_PROTO_VERSION = "proto_version"
 CONF_API_BASE_URL = "api_base_url"
+CONF_ZEROCONF_NAME = "zeroconf_name"
+CONF_HOST_ADDRESSES = "host_addresses"
+
+# Options flow.
+CONF_POLL_INTERVAL = "poll_interval"
+CONF_FAST_POLL_INTERVAL = "fast_poll_interval"
+CONF_FAST_POLL_WINDOW = "fast_poll_window"
+CONF_OFF_POLL_INTERVAL = "off_poll_interval"
+CONF_MAX_POLL_BACKOFF = "max_poll_backoff"
+CONF_COLLECT_METRICS = "collect_metrics"
+CONF_WOL_BROADCAST_ADDRESSES = "wol_broadcast_addresses"
+CONF_WOL_INTERFACES = "wol_interfaces"
+CONF_WOL_BURST_COUNT = "wol_burst_count"
+CONF_WOL_BURST_SPACING_MS = "wol_burst_spacing_ms"
+CONF_BUFFER_OFFLINE_COMMANDS = "buffer_offline_commands"
+CONF_OFFLINE_COMMAND_TTL = "offline_command_ttl"
+CONF_MDNS_RERESOLVE = "mdns_reresolve"
+CONF_MACROS = "macros"
+
+# Minimum daemon protoVersion for optional API features.
+PROTO_VERSION_BATCH_COMMANDS = 2
+PROTO_VERSION_COMMAND_COUNT = 2
+PROTO_VERSION_HOLD_KEYS = 3
+PROTO_VERSION_STATE_ENDPOINT = 3
+
+# Two-tier polling: /ha/v1/state every tick, the full profile only when its revision moves.
+FULL_PROFILE_REFRESH_SECONDS = 600
 
 API_TIMEOUT_SECONDS = 5
+API_CONNECT_TIMEOUT_SECONDS = 2
+# Shorter than the total so a daemon that stalls mid-response fails before the request budget.
+API_READ_TIMEOUT_SECONDS = 3
 API_HEADER_AUTHORIZATION = "Authorization"
 
+# Dedicated connection pool per daemon.
+API_MAX_CONNECTIONS = 4
+API_KEEPALIVE_SECONDS = 300
+API_DNS_CACHE_SECONDS = 300
+# Connections idle this long are re-warmed before the keep-alive closes them; checked every minute.
+API_WARM_UP_IDLE_SECONDS = 240
+API_WARM_UP_CHECK_SECONDS = 60
+
+# Circuit breaker: fail fast after repeated connection failures instead of waiting out timeouts.
+BREAKER_FAILURE_THRESHOLD = 3
+BREAKER_COOLDOWN_SECONDS = 15
+BREAKER_MAX_COOLDOWN_SECONDS = 120
+BREAKER_CLOSED = "closed"
+BREAKER_OPEN = "open"
+BREAKER_HALF_OPEN = "half_open"
+
+# Server-sent event stream; the daemon emits a heartbeat comment well within the idle timeout.
+STREAM_IDLE_TIMEOUT_SECONDS = 45
+STREAM_RECONNECT_MIN_SECONDS = 1
+STREAM_RECONNECT_MAX_SECONDS = 60
+STREAM_EVENT_OPEN = "open"
+STREAM_EVENT_DEVICE = "device"
+STREAM_EVENT_STATE = "state"
+
+# Endpoint tracking: while the daemon is unreachable, re-race its known addresses and
+# optionally re-resolve it over mDNS.
+DEFAULT_MDNS_RERESOLVE = False
+ENDPOINT_RECHECK_INTERVAL_SECONDS = 60
+MDNS_RESOLVE_TIMEOUT_MS = 3000
+# Happy-eyeballs: stagger health probes across advertised addresses, first answer wins.
+HAPPY_EYEBALLS_DELAY_SECONDS = 0.25
+ENDPOINT_RACE_MIN_INTERVAL_SECONDS = 30
+
+# Access token lifecycle: renew ahead of expiry over the local API; a 401 triggers one shared refresh.
+TOKEN_RENEW_MARGIN_SECONDS = 21600
+TOKEN_RENEW_RETRY_SECONDS = 300
+TOKEN_STATE_VALID = "valid"
+TOKEN_STATE_EXPIRING = "expiring"
+TOKEN_STATE_EXPIRED = "expired"
+TOKEN_STATE_REJECTED = "rejected"
+TOKEN_STATE_NO_EXPIRY = "no_expiry"
+
+# Persistent WebSocket command channel for latency-sensitive keys; HTTP POST is the fallback.
+CHANNEL_COMMANDS = (
+    "navigate",
+    "play_pause",
+    "next_track",
+    "previous_track",
+    "volume_up",
+    "volume_down",
+    "mute_toggle",
+)
+CHANNEL_ACK_TIMEOUT_SECONDS = 2
+CHANNEL_RETRY_SECONDS = 30
+CHANNEL_UNSUPPORTED_RETRY_SECONDS = 600
+
 REMOTE_NAV_KEYS = ("up", "down", "left", "right", "ok", "back", "home", "info")
 REMOTE_DIRECT_COMMANDS = (
     "play_pause",
@@ -33,6 +125,82 @@ REMOTE_DIRECT_COMMANDS = (
     "power_off",
 )
 
+# Aliases accepted wherever a remote command name is (remote.send_command, macros).
+REMOTE_COMMAND_ALIASES = {
+    "enter": "ok",
+    "select": "ok",
+    "return": "back",
+    "playpause": "play_pause",
+    "play-pause": "play_pause",
+    "next": "next_track",
+    "previous": "previous_track",
+    "prev": "previous_track",
+    "vol_up": "volume_up",
+    "vol_down": "volume_down",
+    "mute": "mute_toggle",
+    "off": "power_off",
+}
+
+# Named macros: stored per device in the entry options, compiled into one batch plan.
+MACRO_MAX_STEPS = 100
+MACRO_MAX_REPEAT = 50
+MACRO_MAX_WAIT_MS = 10000
+
+# Press-and-hold: the daemon repeats the key itself until a stop or its safety timeout.
+HOLDABLE_NAV_KEYS = ("up", "down", "left", "right")
+HOLDABLE_COMMANDS = ("volume_up", "volume_down")
+HOLD_REPEAT_INTERVAL_MS = 100
+HOLD_SAFETY_TIMEOUT_SECONDS = 10
+HOLD_START = "start"
+HOLD_STOP = "stop"
+
+# Wake-on-LAN.
+DEFAULT_WOL_BROADCAST_ADDRESS = "255.255.255.255"
+DEFAULT_WOL_PORT = 9
+DEFAULT_WOL_BURST_COUNT = 3
+DEFAULT_WOL_BURST_SPACING_MS = 100
+
+# Wake readiness: probe /ha/v1/health quickly after Wake-on-LAN until the daemon answers.
+WAKE_PROBE_INTERVAL_SECONDS = 0.5
+WAKE_PROBE_TIMEOUT_SECONDS = 1
+WAKE_READY_TIMEOUT_SECONDS = 180
+WAKE_COMMAND_HOLD_SECONDS = 60
+
+# Request instrumentation.
+METRICS_HISTOGRAM_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+METRICS_FAILURE_WINDOW = 100
+DEFAULT_COLLECT_METRICS = True
+
+# Fleet-wide refresh pacing across all config entries.
+FLEET_MAX_CONCURRENT_REFRESHES = 4
+FLEET_LATENCY_SAMPLES = 200
+
+# Profile changes are written to the config entry at most once per cooldown.
+CONFIG_ENTRY_SYNC_COOLDOWN_SECONDS = 30
+
+# Last confirmed profile per entry, so entities load instantly before the first refresh.
+PROFILE_STORE_VERSION = 1
+PROFILE_STORE_SAVE_DELAY_SECONDS = 10
+
+# Profile fields that commands update optimistically, and how long to wait for confirmation.
+OPTIMISTIC_STATE_FIELDS = {"powerState": "power_state", "selectedSourceId": "selected_source_id"}
+OPTIMISTIC_STATE_GRACE_SECONDS = 5
+
+# Per-device command queue; repeatable keys are merged into one counted command.
+COMMAND_QUEUE_MAX_DEPTH = 32
+COMMAND_COALESCE_MAX_COUNT = 20
+COALESCIBLE_COMMANDS = ("volume_up", "volume_down")
+COALESCIBLE_NAV_KEYS = ("up", "down", "left", "right")
+
+# Offline command buffer: commands issued while the daemon is unreachable are replayed later.
+DEFAULT_BUFFER_OFFLINE_COMMANDS = False
+DEFAULT_OFFLINE_COMMAND_TTL_SECONDS = 30
+OFFLINE_BUFFER_MAX_DEPTH = 16
+# Replaying these after the PC comes back would undo the wake-up.
+OFFLINE_UNBUFFERED_COMMANDS = ("power_off",)
+# Setting commands; repeating one with nothing else of its kind in between changes nothing.
+OFFLINE_IDEMPOTENT_COMMANDS = ("select_source",)
+
 # Button entities exposed for plug-and-play control on the HA Device page.
 REMOTE_BUTTONS = (
     {"key": "home", "label": "Home", "icon": "mdi:home"},
@@ -2,51 +2,548 @@
 
 from __future__ import annotations
 
+import asyncio
+import random
+import time
 from datetime import timedelta
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .api import RemoteRelayApiError, RemoteRelayLocalApiClient
+from .api import RemoteRelayApiError, RemoteRelayLocalApiClient, RemoteRelayNotSupportedError
 from .const import (
+    API_WARM_UP_CHECK_SECONDS,
+    CONF_BROADCAST_ADDRESS,
     CONF_DEVICE_ID,
     CONF_DISPLAY_NAME,
+    CONF_FAST_POLL_INTERVAL,
+    CONF_FAST_POLL_WINDOW,
     CONF_INPUT_SOURCES,
     CONF_MAC_ADDRESSES,
+    CONF_MAX_POLL_BACKOFF,
+    CONF_OFF_POLL_INTERVAL,
+    CONF_POLL_INTERVAL,
+    CONF_PROTO_VERSION,
     CONF_SELECTED_SOURCE_ID,
+    CONF_WOL_BROADCAST_ADDRESSES,
+    CONF_WOL_BURST_COUNT,
+    CONF_WOL_BURST_SPACING_MS,
+    CONF_WOL_INTERFACES,
+    CONFIG_ENTRY_SYNC_COOLDOWN_SECONDS,
+    DEFAULT_FAST_POLL_INTERVAL_SECONDS,
+    DEFAULT_FAST_POLL_WINDOW_SECONDS,
+    DEFAULT_MAX_POLL_BACKOFF_SECONDS,
+    DEFAULT_OFF_POLL_INTERVAL_SECONDS,
     DEFAULT_POLL_INTERVAL_SECONDS,
+    DEFAULT_WOL_BROADCAST_ADDRESS,
+    DEFAULT_WOL_BURST_COUNT,
+    DEFAULT_WOL_BURST_SPACING_MS,
     DOMAIN,
+    FULL_PROFILE_REFRESH_SECONDS,
+    OPTIMISTIC_STATE_GRACE_SECONDS,
+    OPTIMISTIC_STATE_FIELDS,
+    POLL_BACKOFF_JITTER,
+    PROTO_VERSION_STATE_ENDPOINT,
+    STREAM_EVENT_DEVICE,
+    STREAM_EVENT_OPEN,
+    STREAM_EVENT_STATE,
+    STREAM_RECONNECT_MAX_SECONDS,
+    STREAM_RECONNECT_MIN_SECONDS,
+    WAKE_COMMAND_HOLD_SECONDS,
+    WAKE_PROBE_INTERVAL_SECONDS,
+    WAKE_READY_TIMEOUT_SECONDS,
+)
+from .fleet import RemoteRelayFleetScheduler
+from .store import RemoteRelayProfileStore
+from .models import (
+    RemoteRelayProfile,
+    RemoteRelaySourceIndex,
+    normalize_input_sources,
+    normalize_mac_addresses,
+    normalize_selected_source_id,
+)
+from .wol import async_send_magic_packets, split_address_list
+
+_SYNCED_PROFILE_KEYS = (
+    "deviceId",
+    "displayName",
+    "macAddresses",
+    "inputSources",
+    "selectedSourceId",
+    "protoVersion",
 )
 
 
-class RemoteRelayCoordinator(DataUpdateCoordinator[dict[str, Any]]):
-    """Coordinator that polls the local daemon device profile."""
+class RemoteRelayCoordinator(DataUpdateCoordinator[RemoteRelayProfile]):
+    """Coordinator fed by the daemon event stream, polling the device profile as fallback."""
 
-    def __init__(self, hass: HomeAssistant, entry: ConfigEntry, api: RemoteRelayLocalApiClient) -> None:
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        api: RemoteRelayLocalApiClient,
+        fleet: RemoteRelayFleetScheduler,
+        store: RemoteRelayProfileStore,
+    ) -> None:
         super().__init__(
             hass,
             logger=hass.data[DOMAIN]["logger"],
             name=f"{DOMAIN}_device_profile",
             update_interval=timedelta(seconds=DEFAULT_POLL_INTERVAL_SECONDS),
+            always_update=False,
         )
         self.entry = entry
         self.api = api
+        self.fleet = fleet
+        self.store = store
+        # Entities render the profile stored at pairing time until the daemon answers.
+        self.data = RemoteRelayProfile.from_entry_data(entry.data)
+        self._stream_connected = False
+        self._fast_poll_until = 0.0
+        self._consecutive_failures = 0
+        self._confirmed: RemoteRelayProfile | None = None
+        self._optimistic: dict[str, Any] = {}
+        self._optimistic_until = 0.0
+        self._synced_fingerprint: int | None = None
+        self._pending_sync_profile: dict[str, Any] | None = None
+        self._state_endpoint_missing = False
+        self._profile_revision: Any = None
+        self._full_profile_due = 0.0
+        self._stream_retry = asyncio.Event()
+        self._outage_started: float | None = None
+        self._last_outage_seconds: float | None = None
+        self._wake_task: asyncio.Task[None] | None = None
+        self._wake_done = asyncio.Event()
+        self._wake_done.set()
+        self._time_to_ready: float | None = None
+        self._warm_up_task: asyncio.Task[None] | None = None
+        self._config_entry_sync_debouncer = Debouncer(
+            hass,
+            self.logger,
+            cooldown=CONFIG_ENTRY_SYNC_COOLDOWN_SECONDS,
+            immediate=False,
+            function=self._async_write_config_entry,
+        )
+        self.async_apply_options()
+
+    async def async_load_cached_profile(self) -> None:
+        """Start from the last confirmed profile, if one was cached, instead of the pairing data."""
+        if (cached := await self.store.async_load()) is not None:
+            self.data = cached
+
+    @property
+    def source_index(self) -> RemoteRelaySourceIndex:
+        """Return the input source index of the current profile."""
+        return self.data.source_index
+
+    @callback
+    def async_apply_options(self) -> None:
+        """Load polling intervals from the config entry options."""
+        options = self.entry.options
+        self._poll_interval = float(options.get(CONF_POLL_INTERVAL, DEFAULT_POLL_INTERVAL_SECONDS))
+        self._fast_poll_interval = float(options.get(CONF_FAST_POLL_INTERVAL, DEFAULT_FAST_POLL_INTERVAL_SECONDS))
+        self._fast_poll_window = float(options.get(CONF_FAST_POLL_WINDOW, DEFAULT_FAST_POLL_WINDOW_SECONDS))
+        self._off_poll_interval = float(options.get(CONF_OFF_POLL_INTERVAL, DEFAULT_OFF_POLL_INTERVAL_SECONDS))
+        self._max_poll_backoff = float(options.get(CONF_MAX_POLL_BACKOFF, DEFAULT_MAX_POLL_BACKOFF_SECONDS))
+        self._wol_burst_count = int(options.get(CONF_WOL_BURST_COUNT, DEFAULT_WOL_BURST_COUNT))
+        self._wol_burst_spacing = float(options.get(CONF_WOL_BURST_SPACING_MS, DEFAULT_WOL_BURST_SPACING_MS)) / 1000
+        self._wol_interfaces = split_address_list(options.get(CONF_WOL_INTERFACES))
+        broadcast_addresses = split_address_list(options.get(CONF_WOL_BROADCAST_ADDRESSES))
+        if not broadcast_addresses:
+            broadcast_addresses = split_address_list(self.entry.data.get(CONF_BROADCAST_ADDRESS)) or [
+                DEFAULT_WOL_BROADCAST_ADDRESS
+            ]
+        self._wol_broadcast_addresses = broadcast_addresses
+        self.update_interval = self._next_update_interval()
+
+    @callback
+    def async_note_activity(self) -> None:
+        """Poll quickly for a short window after a command or Wake-on-LAN."""
+        self._fast_poll_until = time.monotonic() + self._fast_poll_window
+        if self._stream_connected:
+            return
+        self.update_interval = self._next_update_interval()
+        self._schedule_refresh()
+
+    async def async_wake_on_lan(self) -> None:
+        """Send Wake-on-LAN bursts for every known MAC address, then poll quickly."""
+        mac_addresses = self.data.mac_addresses
+        if not mac_addresses:
+            raise ValueError("No MAC addresses configured for Wake-on-LAN.")
 
-    async def _async_update_data(self) -> dict[str, Any]:
         try:
-            profile = await self.api.async_get_device_profile()
-            await self._async_maybe_sync_config_entry(profile)
+            sent = await async_send_magic_packets(
+                mac_addresses,
+                self._wol_broadcast_addresses,
+                interface_addresses=self._wol_interfaces,
+                burst_count=self._wol_burst_count,
+                burst_spacing=self._wol_burst_spacing,
+            )
+        except OSError as err:
+            raise HomeAssistantError(f"Could not send Wake-on-LAN packets: {err}") from err
+        self.logger.debug(
+            "Sent %s Wake-on-LAN packet(s) for %s MAC address(es).", sent, len(mac_addresses)
+        )
+        self.async_note_activity()
+        if self._wake_task is None and not (self.last_update_success and self.data.power_state == "on"):
+            self._wake_done.clear()
+            self._wake_task = self.entry.async_create_background_task(
+                self.hass,
+                self._async_wait_for_wake(time.monotonic()),
+                name=f"{DOMAIN}_wake_probe_{self.entry.entry_id}",
+            )
+
+    @property
+    def waking(self) -> bool:
+        """Return True while waiting for the daemon to answer after Wake-on-LAN."""
+        return not self._wake_done.is_set()
+
+    @property
+    def time_to_ready(self) -> float | None:
+        """Return seconds between the last Wake-on-LAN and the daemon's first answer."""
+        return self._time_to_ready
+
+    async def async_wait_until_ready(self) -> None:
+        """Hold commands while a woken PC boots instead of letting each one time out."""
+        if self._wake_done.is_set():
+            return
+        try:
+            async with asyncio.timeout(WAKE_COMMAND_HOLD_SECONDS):
+                await self._wake_done.wait()
+        except TimeoutError:
+            pass
+
+    async def _async_wait_for_wake(self, started: float) -> None:
+        """Probe the daemon health endpoint until it answers, then refresh right away."""
+        deadline = started + WAKE_READY_TIMEOUT_SECONDS
+        try:
+            while time.monotonic() < deadline:
+                if await self.api.async_probe():
+                    self._time_to_ready = round(time.monotonic() - started, 2)
+                    self.logger.debug(
+                        "%s: daemon ready %.2fs after Wake-on-LAN", self.entry.title, self._time_to_ready
+                    )
+                    self._consecutive_failures = 0
+                    self._wake_done.set()
+                    self.async_note_activity()
+                    await self.async_refresh()
+                    return
+                await asyncio.sleep(WAKE_PROBE_INTERVAL_SECONDS)
+            self.logger.debug(
+                "%s: daemon not ready %ss after Wake-on-LAN", self.entry.title, WAKE_READY_TIMEOUT_SECONDS
+            )
+        finally:
+            self._wake_task = None
+            self._wake_done.set()
+
+    @callback
+    def async_set_optimistic(self, changes: dict[str, Any]) -> bool:
+        """Show expected profile fields right away until the daemon confirms or contradicts them.
+
+        ``changes`` maps ``RemoteRelayProfile`` field names to values. Returns False when there
+        is no live profile to overlay.
+        """
+        if self._confirmed is None or not self.last_update_success:
+            return False
+        self._optimistic = {**self._optimistic, **changes}
+        self._optimistic_until = time.monotonic() + OPTIMISTIC_STATE_GRACE_SECONDS
+        self._async_publish(self.data.with_state(**changes))
+        return True
+
+    @callback
+    def async_rollback_optimistic(self, changes: dict[str, Any]) -> None:
+        """Drop optimistic fields after the command that implied them failed."""
+        for key in changes:
+            self._optimistic.pop(key, None)
+        if self._confirmed is not None:
+            self._async_publish(self._resolve_optimistic(self._confirmed))
+
+    @callback
+    def async_confirm_from_response(self, response: dict[str, Any]) -> None:
+        """Apply state carried by a command response as authoritative."""
+        state = response.get("state") if isinstance(response.get("state"), dict) else response
+        confirmed = {
+            field_name: str(state[key] or "").strip()
+            for key, field_name in OPTIMISTIC_STATE_FIELDS.items()
+            if key in state
+        }
+        if not confirmed or self._confirmed is None:
+            return
+        for field_name in confirmed:
+            self._optimistic.pop(field_name, None)
+        self._set_confirmed(self._confirmed.with_state(**confirmed))
+        self._async_publish(self._resolve_optimistic(self._confirmed))
+
+    def _resolve_optimistic(self, profile: RemoteRelayProfile) -> RemoteRelayProfile:
+        """Overlay optimistic fields the daemon has not reported yet, while the grace period lasts."""
+        if not self._optimistic:
             return profile
+        pending = {key: value for key, value in self._optimistic.items() if getattr(profile, key) != value}
+        if not pending or time.monotonic() >= self._optimistic_until:
+            self._optimistic = {}
+            return profile
+        self._optimistic = pending
+        return profile.with_state(**pending)
+
+    @callback
+    def _async_publish(self, data: RemoteRelayProfile) -> None:
+        if data == self.data:
+            return
+        self.data = data
+        self.async_update_listeners()
+
+    def _next_update_interval(self, profile: RemoteRelayProfile | None = None) -> timedelta | None:
+        if profile is None:
+            profile = self.data
+        if self._stream_connected:
+            return None
+        if time.monotonic() < self._fast_poll_until:
+            return timedelta(seconds=self._fast_poll_interval)
+        if self._consecutive_failures:
+            backoff = self._off_poll_interval * 2 ** (self._consecutive_failures - 1)
+            return self._jittered(min(backoff, self._max_poll_backoff))
+        if profile is not None and profile.power_state == "off":
+            return self._jittered(self._off_poll_interval)
+        return timedelta(seconds=self._poll_interval)
+
+    @staticmethod
+    def _jittered(seconds: float) -> timedelta:
+        return timedelta(seconds=seconds * random.uniform(1 - POLL_BACKOFF_JITTER, 1 + POLL_BACKOFF_JITTER))
+
+    @property
+    def stream_connected(self) -> bool:
+        """Return True while the daemon event stream is delivering updates."""
+        return self._stream_connected
+
+    @callback
+    def async_start_event_stream(self) -> None:
+        """Subscribe to daemon push updates for the lifetime of the config entry."""
+        self.entry.async_create_background_task(
+            self.hass,
+            self._async_run_event_stream(),
+            name=f"{DOMAIN}_event_stream_{self.entry.entry_id}",
+        )
+
+    async def _async_run_event_stream(self) -> None:
+        backoff = STREAM_RECONNECT_MIN_SECONDS
+        while True:
+            try:
+                async for event, payload in self.api.async_stream_events():
+                    if event == STREAM_EVENT_OPEN:
+                        self._set_stream_connected(True)
+                        backoff = STREAM_RECONNECT_MIN_SECONDS
+                        # Polling stops while streaming; keep a pooled command connection ready.
+                        self._async_schedule_warm_up()
+                        # Events only carry changes from now on: catch up on anything missed while
+                        # unsubscribed, recover availability and confirm a profile loaded from cache.
+                        await self.async_request_refresh()
+                    elif event == STREAM_EVENT_DEVICE and not self._is_unchanged(payload):
+                        self.async_set_updated_data(await self._async_accept_profile(payload))
+                    elif event == STREAM_EVENT_STATE and self._confirmed is not None:
+                        if (profile := self._accept_state(payload)) is not None:
+                            self.async_set_updated_data(profile)
+            except RemoteRelayNotSupportedError:
+                self.logger.debug("%s: daemon has no event stream, staying on polling", self.entry.title)
+                await self._async_handle_stream_lost()
+                return
+            except RemoteRelayApiError as err:
+                self.logger.debug("%s: event stream dropped: %s", self.entry.title, err)
+
+            await self._async_handle_stream_lost()
+            self._stream_retry.clear()
+            try:
+                async with asyncio.timeout(backoff):
+                    await self._stream_retry.wait()
+            except TimeoutError:
+                backoff = min(backoff * 2, STREAM_RECONNECT_MAX_SECONDS)
+            else:
+                backoff = STREAM_RECONNECT_MIN_SECONDS
+
+    @callback
+    def async_start_keep_warm(self) -> None:
+        """Re-warm command connections that idle toward the keep-alive limit while the daemon is up."""
+        self.entry.async_on_unload(
+            async_track_time_interval(
+                self.hass,
+                self._async_keep_warm,
+                timedelta(seconds=API_WARM_UP_CHECK_SECONDS),
+                name=f"{DOMAIN}_keep_warm_{self.entry.entry_id}",
+                cancel_on_shutdown=True,
+            )
+        )
+
+    @callback
+    def _async_keep_warm(self, _now: Any = None) -> None:
+        if self.last_update_success and self.api.needs_warm_up:
+            self._async_schedule_warm_up()
+
+    @callback
+    def _async_schedule_warm_up(self) -> None:
+        if self._warm_up_task is None:
+            self._warm_up_task = self.entry.async_create_background_task(
+                self.hass,
+                self._async_warm_up(),
+                name=f"{DOMAIN}_warm_up_{self.entry.entry_id}",
+            )
+
+    async def _async_warm_up(self) -> None:
+        try:
+            await self.api.async_warm_up()
+        finally:
+            self._warm_up_task = None
+
+    @callback
+    def async_endpoint_changed(self) -> None:
+        """Reconnect the event stream and refresh now that the daemon has a new address."""
+        self._stream_retry.set()
+        self._consecutive_failures = 0
+        self.async_note_activity()
+        self.entry.async_create_background_task(
+            self.hass,
+            self.async_refresh(),
+            name=f"{DOMAIN}_endpoint_refresh_{self.entry.entry_id}",
+        )
+
+    @property
+    def last_outage_seconds(self) -> float | None:
+        """Return how long the daemon was unreachable before the most recent recovery."""
+        return self._last_outage_seconds
+
+    async def _async_handle_stream_lost(self) -> None:
+        if not self._stream_connected:
+            return
+        self._set_stream_connected(False)
+        # Polling was suspended while streaming; refresh now so the fallback timer is rescheduled.
+        await self.async_refresh()
+
+    def _set_stream_connected(self, connected: bool) -> None:
+        self._stream_connected = connected
+        self.update_interval = self._next_update_interval()
+
+    async def _async_update_data(self) -> RemoteRelayProfile:
+        # Polls in the post-command fast window skip fleet pacing so feedback stays quick.
+        paced = time.monotonic() >= self._fast_poll_until
+        try:
+            async with self.fleet.async_refresh_slot(paced=paced):
+                profile = await self._async_fetch()
         except RemoteRelayApiError as err:
+            self._consecutive_failures += 1
+            if self._outage_started is None:
+                self._outage_started = time.monotonic()
+            self.update_interval = self._next_update_interval()
             raise UpdateFailed(str(err)) from err
 
+        self._consecutive_failures = 0
+        # A poll proves the daemon is up: open the command channel too if it is not connected.
+        if self.api.needs_warm_up:
+            self._async_schedule_warm_up()
+        if self._outage_started is not None:
+            self._last_outage_seconds = round(time.monotonic() - self._outage_started, 1)
+            self._outage_started = None
+            self.logger.debug("%s: daemon reachable again after %.1fs", self.entry.title, self._last_outage_seconds)
+        # Returning the previous object lets the coordinator skip notifying entities.
+        if profile is None:
+            self.update_interval = self._next_update_interval()
+            if self._optimistic and self._confirmed is not None:
+                return self._resolve_optimistic(self._confirmed)
+            return self.data
+        self.update_interval = self._next_update_interval(profile)
+        return profile
+
+    @property
+    def uses_state_endpoint(self) -> bool:
+        """Return True if ticks fetch the lightweight state instead of the full profile."""
+        return not self._state_endpoint_missing and self.api.supports(PROTO_VERSION_STATE_ENDPOINT)
+
+    async def _async_fetch(self) -> RemoteRelayProfile | None:
+        """Fetch what changed since the last tick; None means nothing did.
+
+        Ticks read ``/ha/v1/state`` and only fall through to the full profile when its
+        ``profileRevision`` moves, nothing is confirmed yet, or the periodic full refresh is due.
+        """
+        state: dict[str, Any] | None = None
+        if self.uses_state_endpoint and self._confirmed is not None and time.monotonic() < self._full_profile_due:
+            try:
+                state = await self.api.async_get_device_state()
+            except RemoteRelayNotSupportedError:
+                self._state_endpoint_missing = True
+            else:
+                if state.get("profileRevision") == self._profile_revision:
+                    return self._accept_state(state)
+                self._profile_revision = state.get("profileRevision")
+
+        raw = await self.api.async_get_device_profile(conditional=self._confirmed is not None)
+        self._full_profile_due = time.monotonic() + FULL_PROFILE_REFRESH_SECONDS
+        if raw is None or self._is_unchanged(raw):
+            # The profile is unchanged, but the live state read on the way here may not be.
+            return self._accept_state(state) if state is not None else None
+        return await self._async_accept_profile(raw)
+
+    def _accept_state(self, state: dict[str, Any]) -> RemoteRelayProfile | None:
+        """Overlay live state on the confirmed profile without re-parsing sources or MACs."""
+        if self._confirmed is None:
+            return None
+        confirmed = self._confirmed.with_live_state(state)
+        if confirmed is self._confirmed:
+            return None
+        self._set_confirmed(confirmed)
+        return self._resolve_optimistic(confirmed)
+
+    async def _async_accept_profile(self, raw: dict[str, Any]) -> RemoteRelayProfile:
+        """Parse a changed daemon profile once and record it as the confirmed state."""
+        await self._async_maybe_sync_config_entry(raw)
+        self._set_confirmed(RemoteRelayProfile.from_api(raw, self._confirmed or self.data))
+        return self._resolve_optimistic(self._confirmed)
+
+    def _set_confirmed(self, profile: RemoteRelayProfile) -> None:
+        if profile != self._confirmed:
+            self.store.async_schedule_save(profile)
+        self._confirmed = profile
+
+    def _is_unchanged(self, raw: dict[str, Any]) -> bool:
+        if self._confirmed is None:
+            return False
+        revision = raw.get("revision")
+        return revision is not None and revision == self._confirmed.revision
+
     async def _async_maybe_sync_config_entry(self, profile: dict[str, Any]) -> None:
         if not isinstance(profile, dict):
             return
 
-        current_data = dict(self.entry.data)
+        if "protoVersion" in profile:
+            self.api.set_proto_version(profile.get("protoVersion"))
+
+        fingerprint = self._profile_fingerprint(profile)
+        if fingerprint == self._synced_fingerprint:
+            return
+        self._synced_fingerprint = fingerprint
+        self._pending_sync_profile = profile
+        await self._config_entry_sync_debouncer.async_call()
+
+    async def async_shutdown(self) -> None:
+        """Flush a pending config entry sync and stop scheduled work."""
+        self._config_entry_sync_debouncer.async_cancel()
+        self._async_write_config_entry()
+        await super().async_shutdown()
+
+    @staticmethod
+    def _profile_fingerprint(profile: dict[str, Any]) -> int:
+        return hash(repr(tuple((key in profile, profile.get(key)) for key in _SYNCED_PROFILE_KEYS)))
+
+    @callback
+    def _async_write_config_entry(self) -> None:
+        """Persist the latest profile subset to the config entry if it differs."""
+        profile = self._pending_sync_profile
+        self._pending_sync_profile = None
+        if profile is None:
+            return
+
+        current_data = self.entry.data
         next_data = dict(current_data)
         changed = False
 
@@ -61,82 +558,31 @@ class RemoteRelayCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             changed = True
 
         if "macAddresses" in profile:
-            profile_macs = self._normalize_profile_macs(profile.get("macAddresses"))
-            current_macs = self._normalize_profile_macs(current_data.get(CONF_MAC_ADDRESSES, []))
+            profile_macs = normalize_mac_addresses(profile.get("macAddresses"))
+            current_macs = normalize_mac_addresses(current_data.get(CONF_MAC_ADDRESSES, []))
             if profile_macs != current_macs:
                 next_data[CONF_MAC_ADDRESSES] = profile_macs
                 changed = True
 
         if "inputSources" in profile:
-            profile_sources = self._normalize_profile_sources(profile.get("inputSources"))
-            current_sources = self._normalize_profile_sources(current_data.get(CONF_INPUT_SOURCES, []))
+            profile_sources = normalize_input_sources(profile.get("inputSources"))
+            current_sources = normalize_input_sources(current_data.get(CONF_INPUT_SOURCES, []))
             if profile_sources != current_sources:
                 next_data[CONF_INPUT_SOURCES] = profile_sources
                 changed = True
 
         if "selectedSourceId" in profile:
-            profile_selected_source = self._normalize_selected_source_id(profile.get("selectedSourceId"))
-            current_selected_source = self._normalize_selected_source_id(current_data.get(CONF_SELECTED_SOURCE_ID))
+            profile_selected_source = normalize_selected_source_id(profile.get("selectedSourceId"))
+            current_selected_source = normalize_selected_source_id(current_data.get(CONF_SELECTED_SOURCE_ID))
             if profile_selected_source != current_selected_source:
                 next_data[CONF_SELECTED_SOURCE_ID] = profile_selected_source
                 changed = True
 
+        if "protoVersion" in profile:
+            profile_proto_version = str(profile.get("protoVersion") or "").strip()
+            if profile_proto_version and profile_proto_version != str(current_data.get(CONF_PROTO_VERSION) or ""):
+                next_data[CONF_PROTO_VERSION] = profile_proto_version
+                changed = True
+
         if changed:
             self.hass.config_entries.async_update_entry(self.entry, data=next_data)
-
-    @staticmethod
-    def _normalize_profile_macs(value: Any) -> list[str]:
-        if not isinstance(value, list):
-            return []
-
-        normalized: list[str] = []
-        seen: set[str] = set()
-        for item in value:
-            if isinstance(item, dict):
-                candidate = str(item.get("value") or "").strip()
-            else:
-                candidate = str(item or "").strip()
-            if not candidate:
-                continue
-            upper = candidate.upper()
-            if upper in seen:
-                continue
-            seen.add(upper)
-            normalized.append(candidate)
-        return normalized
-
-    @staticmethod
-    def _normalize_profile_sources(value: Any) -> list[dict[str, str]]:
-        if not isinstance(value, list):
-            return []
-
-        normalized: list[dict[str, str]] = []
-        seen_ids: set[str] = set()
-        for item in value:
-            if not isinstance(item, dict):
-                continue
-
-            source_id = str(item.get("id") or "").strip()
-            if not source_id:
-                continue
-
-            source_id_key = source_id.lower()
-            if source_id_key in seen_ids:
-                continue
-            seen_ids.add(source_id_key)
-
-            source_name = str(item.get("name") or "").strip() or "Unknown"
-            source_type = str(item.get("type") or "").strip()
-            normalized.append(
-                {
-                    "id": source_id,
-                    "name": source_name,
-                    "type": source_type,
-                }
-            )
-
-        return normalized
-
-    @staticmethod
-    def _normalize_selected_source_id(value: Any) -> str:
-        return str(value or "").strip()
@@ -0,0 +1,51 @@
+"""Diagnostics support for RemoteRelay."""
+
+from __future__ import annotations
+
+from dataclasses import asdict
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.core import HomeAssistant
+
+from .const import CONF_ACCESS_TOKEN
+from .models import RemoteRelayConfigEntry
+
+TO_REDACT = {CONF_ACCESS_TOKEN}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: RemoteRelayConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    runtime = entry.runtime_data
+    coordinator = runtime.coordinator
+    profile = asdict(coordinator.data)
+    profile.pop("source_index", None)
+    update_interval = coordinator.update_interval
+
+    return {
+        "entry": {
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": dict(entry.options),
+        },
+        "profile": profile,
+        "coordinator": {
+            "last_update_success": coordinator.last_update_success,
+            "stream_connected": coordinator.stream_connected,
+            "uses_state_endpoint": coordinator.uses_state_endpoint,
+            "update_interval_seconds": update_interval.total_seconds() if update_interval else None,
+            "waking": coordinator.waking,
+            "time_to_ready_seconds": coordinator.time_to_ready,
+        },
+        "api": {
+            "base_url": runtime.api.base_url,
+            "proto_version": runtime.api.proto_version,
+            "metrics": runtime.api.metrics.as_dict() if runtime.api.metrics else None,
+            "circuit_breaker": runtime.api.breaker.as_dict(),
+        },
+        "command_queue": runtime.dispatcher.as_dict(),
+        "endpoint": runtime.endpoint.as_dict(),
+        "token": runtime.token.as_dict(),
+        "fleet": coordinator.fleet.as_dict(),
+    }
@@ -0,0 +1,352 @@
+"""Ordered per-device command dispatch for RemoteRelay."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+
+from .api import RemoteRelayApiError, RemoteRelayLocalApiClient
+from .const import (
+    COALESCIBLE_COMMANDS,
+    COALESCIBLE_NAV_KEYS,
+    COMMAND_COALESCE_MAX_COUNT,
+    COMMAND_QUEUE_MAX_DEPTH,
+    CONF_BUFFER_OFFLINE_COMMANDS,
+    CONF_MACROS,
+    CONF_OFFLINE_COMMAND_TTL,
+    DEFAULT_BUFFER_OFFLINE_COMMANDS,
+    DEFAULT_OFFLINE_COMMAND_TTL_SECONDS,
+    DOMAIN,
+    OFFLINE_BUFFER_MAX_DEPTH,
+    OFFLINE_IDEMPOTENT_COMMANDS,
+    OFFLINE_UNBUFFERED_COMMANDS,
+    PROTO_VERSION_COMMAND_COUNT,
+)
+from .coordinator import RemoteRelayCoordinator
+from .macros import compile_macro
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class _QueuedCommand:
+    """A command waiting to be sent, shared by every caller merged into it."""
+
+    __slots__ = ("payload", "batch", "count", "future")
+
+    def __init__(self, payload: dict[str, Any], batch: list[dict[str, Any]] | None, future: asyncio.Future) -> None:
+        self.payload = payload
+        self.batch = batch
+        self.count = 1
+        self.future = future
+
+
+class _BufferedCommand:
+    """A command issued while the daemon was unreachable, replayed until it expires."""
+
+    __slots__ = ("payload", "batch", "count", "expires_at")
+
+    def __init__(self, payload: dict[str, Any], batch: list[dict[str, Any]] | None, expires_at: float) -> None:
+        self.payload = payload
+        self.batch = batch
+        self.count = 1
+        self.expires_at = expires_at
+
+
+class RemoteRelayCommandDispatcher:
+    """Serialize commands to one daemon in submission order.
+
+    Consecutive repeatable commands (volume steps, arrow keys) still waiting in the queue
+    are merged into a single command with a ``count`` when the daemon supports it.
+
+    With the offline buffer option enabled, commands issued while the device is unreachable
+    or waking return at once and are replayed in order when the daemon answers again.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        api: RemoteRelayLocalApiClient,
+        coordinator: RemoteRelayCoordinator,
+    ) -> None:
+        self.hass = hass
+        self.entry = entry
+        self._api = api
+        self._coordinator = coordinator
+        self._queue: deque[_QueuedCommand] = deque()
+        self._in_flight: _QueuedCommand | None = None
+        self._wakeup = asyncio.Event()
+        self._sent_count = 0
+        self._coalesced_count = 0
+        self._dropped_count = 0
+        self._offline: deque[_BufferedCommand] = deque()
+        self._replay_task: asyncio.Task[None] | None = None
+        self._buffered_count = 0
+        self._replayed_count = 0
+        self._expired_count = 0
+        self._macros: dict[str, list[dict[str, Any]]] = {}
+        self.async_apply_options()
+
+    @property
+    def api(self) -> RemoteRelayLocalApiClient:
+        return self._api
+
+    @property
+    def queue_depth(self) -> int:
+        return len(self._queue) + (self._in_flight is not None)
+
+    @property
+    def sent_count(self) -> int:
+        return self._sent_count
+
+    @property
+    def coalesced_count(self) -> int:
+        return self._coalesced_count
+
+    @property
+    def dropped_count(self) -> int:
+        return self._dropped_count
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "queue_depth": self.queue_depth,
+            "sent": self._sent_count,
+            "coalesced": self._coalesced_count,
+            "dropped": self._dropped_count,
+            "offline_buffer_depth": len(self._offline),
+            "buffered": self._buffered_count,
+            "replayed": self._replayed_count,
+            "expired": self._expired_count,
+            "macros": sorted(self._macros),
+        }
+
+    @callback
+    def async_apply_options(self) -> None:
+        """Load offline buffer settings and compile macros from the config entry options."""
+        options = self.entry.options
+        self._buffer_offline = bool(options.get(CONF_BUFFER_OFFLINE_COMMANDS, DEFAULT_BUFFER_OFFLINE_COMMANDS))
+        self._offline_ttl = float(options.get(CONF_OFFLINE_COMMAND_TTL, DEFAULT_OFFLINE_COMMAND_TTL_SECONDS))
+        if not self._buffer_offline:
+            self._offline.clear()
+        self._macros = {}
+        for name, steps in (options.get(CONF_MACROS) or {}).items():
+            try:
+                self._macros[name] = compile_macro(steps)
+            except ValueError as err:
+                _LOGGER.warning("%s: ignoring invalid macro %s: %s", self.entry.title, name, err)
+
+    def get_macro(self, name: str) -> list[dict[str, Any]] | None:
+        """Return a copy of the compiled command plan of a stored macro."""
+        plan = self._macros.get(name)
+        return [dict(step) for step in plan] if plan is not None else None
+
+    @callback
+    def async_start(self) -> None:
+        """Start the worker that drains the queue for the lifetime of the config entry."""
+        self.entry.async_create_background_task(
+            self.hass,
+            self._async_run(),
+            name=f"{DOMAIN}_command_dispatcher_{self.entry.entry_id}",
+        )
+        self.entry.async_on_unload(self._coordinator.async_add_listener(self._async_coordinator_updated))
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Fail commands that will never be sent."""
+        pending = [*self._queue, self._in_flight] if self._in_flight else list(self._queue)
+        self._queue.clear()
+        self._offline.clear()
+        self._in_flight = None
+        for item in pending:
+            if not item.future.done():
+                item.future.set_exception(RemoteRelayApiError("RemoteRelay integration is unloading."))
+
+    async def async_send_command(
+        self,
+        payload: dict[str, Any],
+        optimistic: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """Queue one command and wait until the daemon has accepted it.
+
+        ``optimistic`` holds profile fields the command is expected to change; they are shown
+        immediately and rolled back if the command fails.
+        """
+        if self._should_buffer(payload, None):
+            return self._buffer(payload, None)
+        applied = bool(optimistic) and self._coordinator.async_set_optimistic(optimistic)
+        try:
+            result = await self._async_submit(payload)
+        except RemoteRelayApiError:
+            if applied:
+                self._coordinator.async_rollback_optimistic(optimistic)
+            raise
+        self._coordinator.async_confirm_from_response(result)
+        return result
+
+    async def _async_submit(self, payload: dict[str, Any]) -> dict[str, Any]:
+        tail = self._queue[-1] if self._queue else None
+        if tail is not None and self._can_merge(tail, payload):
+            tail.count += 1
+            self._coalesced_count += 1
+            return await asyncio.shield(tail.future)
+        return await self._enqueue(dict(payload), None)
+
+    async def async_send_commands(self, commands: list[dict[str, Any]]) -> dict[str, Any]:
+        """Queue a command sequence that is sent as one batch request."""
+        if self._should_buffer(None, commands):
+            return self._buffer({}, commands)
+        return await self._enqueue({}, commands)
+
+    def _should_buffer(self, payload: dict[str, Any] | None, batch: list[dict[str, Any]] | None) -> bool:
+        if not self._buffer_offline:
+            return False
+        if self._coordinator.last_update_success and not self._coordinator.waking:
+            return False
+        steps = batch if batch is not None else [payload or {}]
+        # A replayed hold would start auto-repeating long after the user let go.
+        return not any(step.get("command") in OFFLINE_UNBUFFERED_COMMANDS or "hold" in step for step in steps)
+
+    def _buffer(self, payload: dict[str, Any], batch: list[dict[str, Any]] | None) -> dict[str, Any]:
+        """Hold a command for replay, in order.
+
+        A repeatable key pressed again right after itself bumps the count of the previous
+        entry, the same merge the live queue does. A setting command that repeats the last
+        buffered one of its kind (the same source again) is dropped. Every other command,
+        including toggles, is kept as issued.
+        """
+        now = time.monotonic()
+        self._expire_buffered(now)
+        self._buffered_count += 1
+        tail = self._offline[-1] if self._offline else None
+        if (
+            batch is None
+            and tail is not None
+            and tail.batch is None
+            and tail.payload == payload
+            and tail.count < COMMAND_COALESCE_MAX_COUNT
+            and self._api.supports(PROTO_VERSION_COMMAND_COUNT)
+            and self._is_coalescible(payload)
+        ):
+            tail.count += 1
+            tail.expires_at = now + self._offline_ttl
+            return {"buffered": True}
+        previous = self._last_buffered_setting(payload) if batch is None else None
+        if previous is not None and previous.payload == payload:
+            previous.expires_at = now + self._offline_ttl
+            return {"buffered": True}
+        if len(self._offline) >= OFFLINE_BUFFER_MAX_DEPTH:
+            self._offline.popleft()
+            self._dropped_count += 1
+        self._offline.append(_BufferedCommand(dict(payload), batch, now + self._offline_ttl))
+        return {"buffered": True}
+
+    def _last_buffered_setting(self, payload: dict[str, Any]) -> _BufferedCommand | None:
+        """Return the newest buffered command of the same idempotent kind as ``payload``."""
+        command = payload.get("command")
+        if command not in OFFLINE_IDEMPOTENT_COMMANDS:
+            return None
+        for item in reversed(self._offline):
+            if item.batch is None and item.payload.get("command") == command:
+                return item
+        return None
+
+    def _expire_buffered(self, now: float) -> None:
+        while self._offline and self._offline[0].expires_at <= now:
+            self._offline.popleft()
+            self._expired_count += 1
+
+    @callback
+    def _async_coordinator_updated(self) -> None:
+        if not self._offline or self._replay_task is not None:
+            return
+        if not self._coordinator.last_update_success or self._coordinator.waking:
+            return
+        self._replay_task = self.entry.async_create_background_task(
+            self.hass,
+            self._async_replay(),
+            name=f"{DOMAIN}_command_replay_{self.entry.entry_id}",
+        )
+
+    async def _async_replay(self) -> None:
+        """Send buffered commands in order, skipping any whose time-to-live ran out meanwhile."""
+        try:
+            while self._offline:
+                self._expire_buffered(time.monotonic())
+                if not self._offline:
+                    break
+                item = self._offline.popleft()
+                try:
+                    if item.batch is not None:
+                        await self._enqueue({}, item.batch)
+                    elif item.count > 1:
+                        await self._enqueue({**item.payload, "count": item.count}, None)
+                    else:
+                        await self._async_submit(item.payload)
+                except RemoteRelayApiError as err:
+                    _LOGGER.debug("%s: dropping buffered command after replay failed: %s", self.entry.title, err)
+                else:
+                    self._replayed_count += 1
+        finally:
+            self._replay_task = None
+
+    async def _enqueue(self, payload: dict[str, Any], batch: list[dict[str, Any]] | None) -> dict[str, Any]:
+        if len(self._queue) >= COMMAND_QUEUE_MAX_DEPTH:
+            self._dropped_count += 1
+            raise RemoteRelayApiError("RemoteRelay command queue is full.")
+
+        item = _QueuedCommand(payload, batch, self.hass.loop.create_future())
+        self._queue.append(item)
+        self._wakeup.set()
+        return await asyncio.shield(item.future)
+
+    def _can_merge(self, tail: _QueuedCommand, payload: dict[str, Any]) -> bool:
+        if tail.batch is not None or tail.count >= COMMAND_COALESCE_MAX_COUNT:
+            return False
+        if not self._api.supports(PROTO_VERSION_COMMAND_COUNT):
+            return False
+        return payload == tail.payload and self._is_coalescible(payload)
+
+    @staticmethod
+    def _is_coalescible(payload: dict[str, Any]) -> bool:
+        """Return True for a plain repeatable key press (volume step or arrow key)."""
+        command = payload.get("command")
+        if command == "navigate":
+            return payload.get("key") in COALESCIBLE_NAV_KEYS and len(payload) == 2
+        return command in COALESCIBLE_COMMANDS and len(payload) == 1
+
+    async def _async_run(self) -> None:
+        while True:
+            while not self._queue:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+
+            await self._coordinator.async_wait_until_ready()
+            if not self._queue:
+                continue
+            item = self._in_flight = self._queue.popleft()
+            try:
+                result = await self._async_send(item)
+            except Exception as err:  # noqa: BLE001 - delivered to the waiting callers
+                if not item.future.done():
+                    item.future.set_exception(err)
+            else:
+                self._sent_count += 1
+                self._coordinator.async_note_activity()
+                if not item.future.done():
+                    item.future.set_result(result)
+            finally:
+                self._in_flight = None
+
+    async def _async_send(self, item: _QueuedCommand) -> dict[str, Any]:
+        if item.batch is not None:
+            return await self._api.async_send_commands(item.batch)
+        payload = item.payload
+        if item.count > 1:
+            payload = {**payload, "count": item.count}
+        return await self._api.async_send_command(payload)
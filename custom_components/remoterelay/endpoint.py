@@ -0,0 +1,211 @@
+"""Live tracking of the RemoteRelay daemon address."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from datetime import timedelta
+from itertools import zip_longest
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_PORT
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.util import dt as dt_util
+
+from .api import RemoteRelayLocalApiClient, format_base_url, usable_addresses
+from .const import (
+    CONF_API_BASE_URL,
+    CONF_HOST_ADDRESSES,
+    CONF_MDNS_RERESOLVE,
+    CONF_ZEROCONF_NAME,
+    DEFAULT_MDNS_RERESOLVE,
+    DOMAIN,
+    ENDPOINT_RACE_MIN_INTERVAL_SECONDS,
+    ENDPOINT_RECHECK_INTERVAL_SECONDS,
+    MDNS_RESOLVE_TIMEOUT_MS,
+    ZEROCONF_SERVICE_TYPE,
+)
+from .coordinator import RemoteRelayCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class RemoteRelayEndpointTracker:
+    """Keep the running client on a working daemon address without reloading the entry.
+
+    All addresses advertised over zeroconf are raced happy-eyeballs style at setup, when the
+    advertised set changes and when the daemon stops answering; the winner is remembered in
+    the config entry and kept until it fails. While the daemon is unreachable it is re-raced
+    periodically and, with the ``mdns_reresolve`` option, its service is resolved again.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        api: RemoteRelayLocalApiClient,
+        coordinator: RemoteRelayCoordinator,
+    ) -> None:
+        self.hass = hass
+        self.entry = entry
+        self._api = api
+        self._coordinator = coordinator
+        self._addresses: tuple[str, ...] = tuple(entry.data.get(CONF_HOST_ADDRESSES) or ())
+        self._mdns_reresolve = False
+        self._rebinds = 0
+        self._last_rebind: dict[str, Any] | None = None
+        self._race_task: asyncio.Task[None] | None = None
+        self._next_race_at = 0.0
+        self._last_race: dict[str, Any] | None = None
+
+    @callback
+    def async_start(self) -> None:
+        self.async_apply_options()
+        self.entry.async_on_unload(
+            async_track_time_interval(
+                self.hass,
+                self._async_recheck,
+                timedelta(seconds=ENDPOINT_RECHECK_INTERVAL_SECONDS),
+                name=f"{DOMAIN}_endpoint_recheck_{self.entry.entry_id}",
+                cancel_on_shutdown=True,
+            )
+        )
+        self.entry.async_on_unload(self._coordinator.async_add_listener(self._async_coordinator_updated))
+        self.async_request_race("setup")
+
+    @callback
+    def async_apply_options(self) -> None:
+        self._mdns_reresolve = bool(self.entry.options.get(CONF_MDNS_RERESOLVE, DEFAULT_MDNS_RERESOLVE))
+
+    async def async_apply_entry(self) -> None:
+        """Follow address changes written to the config entry, e.g. by zeroconf."""
+        base_url = self.entry.data.get(CONF_API_BASE_URL)
+        if base_url:
+            await self._async_rebind(str(base_url), "zeroconf")
+        addresses = tuple(self.entry.data.get(CONF_HOST_ADDRESSES) or ())
+        if addresses != self._addresses:
+            self._addresses = addresses
+            self._next_race_at = 0.0
+            self.async_request_race("addresses changed")
+
+    @callback
+    def async_request_race(self, reason: str) -> None:
+        """Race the known addresses in the background unless a race ran recently."""
+        if self._race_task is not None or time.monotonic() < self._next_race_at:
+            return
+        candidates = self._candidate_urls()
+        if not candidates or candidates == [self._api.base_url]:
+            return
+        self._next_race_at = time.monotonic() + ENDPOINT_RACE_MIN_INTERVAL_SECONDS
+        self._race_task = self.entry.async_create_background_task(
+            self.hass,
+            self._async_race(candidates, reason),
+            name=f"{DOMAIN}_endpoint_race_{self.entry.entry_id}",
+        )
+
+    def _candidate_urls(self) -> list[str]:
+        """Return base URLs to race: the current one first, then IPv6 and IPv4 interleaved."""
+        port = self.entry.data.get(CONF_PORT)
+        if not port or not self._addresses:
+            return []
+        current = self._api.base_url
+        urls = [format_base_url(address, int(port)) for address in self._addresses]
+        ipv6 = [url for url in urls if url.startswith("http://[") and url != current]
+        ipv4 = [url for url in urls if not url.startswith("http://[") and url != current]
+        ordered = [current] if current in urls else []
+        for pair in zip_longest(ipv6, ipv4):
+            ordered.extend(url for url in pair if url)
+        return ordered
+
+    async def _async_race(self, candidates: list[str], reason: str) -> None:
+        try:
+            started = time.perf_counter()
+            winner = await self._api.async_race(candidates)
+            self._last_race = {
+                "reason": reason,
+                "candidates": candidates,
+                "winner": winner,
+                "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+                "at": dt_util.utcnow().isoformat(),
+            }
+            if winner is not None and await self._async_rebind(winner, "race"):
+                self._async_store_base_url(winner)
+        finally:
+            self._race_task = None
+
+    @callback
+    def _async_coordinator_updated(self) -> None:
+        if not self._coordinator.last_update_success:
+            self.async_request_race("unreachable")
+
+    async def _async_rebind(self, base_url: str, source: str) -> bool:
+        previous = self._api.base_url
+        if not await self._api.async_rebind(base_url):
+            return False
+        self._rebinds += 1
+        self._last_rebind = {
+            "from": previous,
+            "to": self._api.base_url,
+            "source": source,
+            "at": dt_util.utcnow().isoformat(),
+        }
+        _LOGGER.info("%s: RemoteRelay daemon moved from %s to %s", self.entry.title, previous, self._api.base_url)
+        self._coordinator.async_endpoint_changed()
+        return True
+
+    @callback
+    def _async_store_base_url(self, base_url: str) -> None:
+        """Remember the winning address so the next setup starts with it."""
+        if self.entry.data.get(CONF_API_BASE_URL) == base_url:
+            return
+        self.hass.config_entries.async_update_entry(self.entry, data={**self.entry.data, CONF_API_BASE_URL: base_url})
+
+    async def _async_recheck(self, _now: Any = None) -> None:
+        """While the daemon is unreachable, refresh its addresses and race them again."""
+        if self._coordinator.last_update_success:
+            return
+        if self._mdns_reresolve:
+            await self._async_reresolve()
+        self.async_request_race("unreachable")
+
+    async def _async_reresolve(self) -> None:
+        """Resolve the daemon's mDNS service instance and adopt its current addresses."""
+        name = self.entry.data.get(CONF_ZEROCONF_NAME)
+        if not name:
+            return
+        # Not a manifest dependency: entries added by hand must not pull in zeroconf.
+        if "zeroconf" not in self.hass.config.components:
+            _LOGGER.debug("%s: zeroconf is not loaded; skipping mDNS re-resolution", self.entry.title)
+            return
+
+        from homeassistant.components import zeroconf
+        from zeroconf.asyncio import AsyncServiceInfo
+
+        aiozc = await zeroconf.async_get_async_instance(self.hass)
+        info = AsyncServiceInfo(ZEROCONF_SERVICE_TYPE, str(name))
+        if not await info.async_request(aiozc.zeroconf, MDNS_RESOLVE_TIMEOUT_MS):
+            return
+        addresses = usable_addresses(info.parsed_addresses())
+        if not addresses or not info.port:
+            return
+
+        data = {**self.entry.data, CONF_HOST_ADDRESSES: addresses, CONF_PORT: info.port}
+        if data == dict(self.entry.data):
+            return
+        self._addresses = tuple(addresses)
+        self._next_race_at = 0.0
+        self.hass.config_entries.async_update_entry(self.entry, data=data)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "base_url": self._api.base_url,
+            "addresses": list(self._addresses),
+            "rebinds": self._rebinds,
+            "last_rebind": self._last_rebind,
+            "last_race": self._last_race,
+            "last_outage_seconds": self._coordinator.last_outage_seconds,
+            "mdns_reresolve": self._mdns_reresolve,
+        }
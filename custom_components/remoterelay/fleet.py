@@ -0,0 +1,116 @@
+"""Domain-wide refresh pacing for RemoteRelay devices."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+
+from .const import (
+    DOMAIN,
+    FLEET_LATENCY_SAMPLES,
+    FLEET_MAX_CONCURRENT_REFRESHES,
+)
+
+if TYPE_CHECKING:
+    from .coordinator import RemoteRelayCoordinator
+
+_FLEET_KEY = "fleet"
+
+
+@callback
+def async_get_fleet(hass: HomeAssistant) -> RemoteRelayFleetScheduler:
+    """Return the fleet scheduler shared by all config entries."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    fleet = domain_data.get(_FLEET_KEY)
+    if fleet is None:
+        fleet = domain_data[_FLEET_KEY] = RemoteRelayFleetScheduler()
+    return fleet
+
+
+class RemoteRelayFleetScheduler:
+    """Spread device refreshes evenly over the poll interval and cap requests in flight.
+
+    Each paced refresh reserves the next free slot; slots are ``interval / devices`` apart,
+    so a growing fleet polls at a steady rate instead of in bursts. ``interval`` is the
+    shortest update interval currently in use among the devices that are polling.
+    """
+
+    def __init__(self) -> None:
+        self._coordinators: dict[str, RemoteRelayCoordinator] = {}
+        self._semaphore = asyncio.Semaphore(FLEET_MAX_CONCURRENT_REFRESHES)
+        self._in_flight = 0
+        self._next_slot = 0.0
+        self._latencies: deque[float] = deque(maxlen=FLEET_LATENCY_SAMPLES)
+
+    @callback
+    def async_register(self, coordinator: RemoteRelayCoordinator) -> CALLBACK_TYPE:
+        """Add a device to the fleet; returns a callback that removes it."""
+        entry_id = coordinator.entry.entry_id
+        self._coordinators[entry_id] = coordinator
+
+        @callback
+        def _unregister() -> None:
+            self._coordinators.pop(entry_id, None)
+
+        return _unregister
+
+    @asynccontextmanager
+    async def async_refresh_slot(self, *, paced: bool = True) -> AsyncIterator[None]:
+        """Wait for this device's turn, then hold one of the in-flight request slots."""
+        if paced:
+            delay = self._reserve_slot()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+        async with self._semaphore:
+            self._in_flight += 1
+            started = time.monotonic()
+            try:
+                yield
+            finally:
+                self._in_flight -= 1
+                self._latencies.append(time.monotonic() - started)
+
+    def _reserve_slot(self) -> float:
+        intervals = [
+            coordinator.update_interval.total_seconds()
+            for coordinator in self._coordinators.values()
+            if coordinator.update_interval is not None
+        ]
+        if not intervals:
+            # Nobody is polling (all streaming); a one-off refresh needs no pacing.
+            return 0.0
+        interval = min(intervals)
+        now = time.monotonic()
+        # Never queue a device further out than one interval, even after a stall.
+        slot = min(max(now, self._next_slot), now + interval)
+        self._next_slot = slot + interval / len(intervals)
+        return slot - now
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return fleet-wide statistics."""
+        coordinators = list(self._coordinators.values())
+        up = sum(1 for coordinator in coordinators if coordinator.last_update_success)
+        latencies = sorted(self._latencies)
+        return {
+            "devices": len(coordinators),
+            "devices_up": up,
+            "devices_down": len(coordinators) - up,
+            "devices_streaming": sum(1 for coordinator in coordinators if coordinator.stream_connected),
+            "refreshes_in_flight": self._in_flight,
+            "refresh_latency_p50_ms": _percentile_ms(latencies, 0.50),
+            "refresh_latency_p95_ms": _percentile_ms(latencies, 0.95),
+        }
+
+
+def _percentile_ms(samples: list[float], quantile: float) -> float | None:
+    if not samples:
+        return None
+    index = min(len(samples) - 1, max(0, round(quantile * len(samples)) - 1))
+    return round(samples[index] * 1000, 1)
@@ -0,0 +1,106 @@
+"""Named command macros for RemoteRelay."""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable, Mapping
+from typing import Any
+
+from .const import (
+    MACRO_MAX_REPEAT,
+    MACRO_MAX_STEPS,
+    MACRO_MAX_WAIT_MS,
+    REMOTE_COMMAND_ALIASES,
+    REMOTE_DIRECT_COMMANDS,
+    REMOTE_NAV_KEYS,
+)
+
+_MACRO_NAME = re.compile(r"^[a-z0-9_]+$")
+_REPEAT_STEP = re.compile(r"^(?P<command>\S+)\s*[x*]\s*(?P<count>\d+)$")
+_WAIT_STEP = re.compile(r"^(?:wait|delay)\s+(?P<ms>\d+)\s*(?:ms)?$")
+
+
+def normalize_command(value: Any) -> str:
+    """Return the canonical command name for ``value``, resolving aliases."""
+    normalized = str(value or "").strip().lower()
+    return REMOTE_COMMAND_ALIASES.get(normalized, normalized)
+
+
+def command_payload(command: str) -> dict[str, Any]:
+    """Return the daemon payload for a canonical command name."""
+    if command in REMOTE_NAV_KEYS:
+        return {"command": "navigate", "key": command}
+    if command in REMOTE_DIRECT_COMMANDS:
+        return {"command": command}
+    raise ValueError(f"Unsupported remote command: {command}")
+
+
+def normalize_macro_name(value: Any) -> str:
+    name = str(value or "").strip().lower().replace(" ", "_").replace("-", "_")
+    if not _MACRO_NAME.match(name):
+        raise ValueError(f"Invalid macro name: {value!r}")
+    return name
+
+
+def compile_macro(steps: Iterable[Any]) -> list[dict[str, Any]]:
+    """Compile macro steps into a validated batch plan.
+
+    A step is a command or alias, optionally repeated (``up x3``), or a pause
+    (``wait 500``, in milliseconds) that becomes ``delayMs`` on the preceding command.
+    """
+    plan: list[dict[str, Any]] = []
+    for raw in steps:
+        step = " ".join(str(raw or "").strip().lower().split())
+        if not step:
+            continue
+        if wait := _WAIT_STEP.match(step):
+            if not plan:
+                raise ValueError("A macro cannot start with a wait.")
+            delay_ms = plan[-1].get("delayMs", 0) + int(wait["ms"])
+            if delay_ms > MACRO_MAX_WAIT_MS:
+                raise ValueError(f"Waits are limited to {MACRO_MAX_WAIT_MS} ms.")
+            plan[-1]["delayMs"] = delay_ms
+            continue
+        count = 1
+        if repeat := _REPEAT_STEP.match(step):
+            step, count = repeat["command"], int(repeat["count"])
+            if not 1 <= count <= MACRO_MAX_REPEAT:
+                raise ValueError(f"Repeat counts must be between 1 and {MACRO_MAX_REPEAT}.")
+        payload = command_payload(normalize_command(step))
+        plan.extend(dict(payload) for _ in range(count))
+        if len(plan) > MACRO_MAX_STEPS:
+            raise ValueError(f"Macros are limited to {MACRO_MAX_STEPS} commands.")
+    if not plan:
+        raise ValueError("A macro needs at least one command.")
+    # A pause after the last command would only hold up the daemon's reply.
+    plan[-1].pop("delayMs", None)
+    return plan
+
+
+def compile_macros(macros: Mapping[str, Any]) -> dict[str, list[dict[str, Any]]]:
+    """Compile stored macros by name; raises ValueError naming the first invalid one."""
+    compiled: dict[str, list[dict[str, Any]]] = {}
+    for name, steps in macros.items():
+        try:
+            compiled[name] = compile_macro(steps)
+        except ValueError as err:
+            raise ValueError(f"Macro {name}: {err}") from err
+    return compiled
+
+
+def parse_macros_text(text: str) -> dict[str, list[str]]:
+    """Parse the options flow format: one ``name: step, step, ...`` macro per line."""
+    macros: dict[str, list[str]] = {}
+    for line in text.splitlines():
+        if not line.strip() or line.lstrip().startswith("#"):
+            continue
+        name, separator, body = line.partition(":")
+        if not separator:
+            raise ValueError(f"Expected 'name: step, step' in {line.strip()!r}")
+        macros[normalize_macro_name(name)] = [step.strip() for step in body.split(",") if step.strip()]
+    compile_macros(macros)
+    return macros
+
+
+def format_macros_text(macros: Mapping[str, Iterable[str]]) -> str:
+    return "\n".join(f"{name}: {', '.join(steps)}" for name, steps in macros.items())
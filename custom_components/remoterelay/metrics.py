@@ -0,0 +1,89 @@
+"""Request instrumentation for the RemoteRelay local API client."""
+
+from __future__ import annotations
+
+import time
+from bisect import bisect_left
+from collections import deque
+from typing import Any
+
+from .const import METRICS_FAILURE_WINDOW, METRICS_HISTOGRAM_BUCKETS_MS
+
+COMMAND_ENDPOINTS = ("/ha/v1/commands", "/ha/v1/commands/batch", "/ha/v1/commands/ws")
+REFRESH_ENDPOINTS = ("/ha/v1/state", "/ha/v1/device")
+
+
+class RemoteRelayEndpointStats:
+    """Counters and a fixed-bucket latency histogram for one endpoint."""
+
+    __slots__ = ("requests", "errors", "timeouts", "last_rtt_ms", "last_at", "total_ms", "buckets")
+
+    def __init__(self) -> None:
+        self.requests = 0
+        self.errors = 0
+        self.timeouts = 0
+        self.last_rtt_ms: float | None = None
+        self.last_at = 0.0
+        self.total_ms = 0.0
+        # One bucket per upper bound plus an overflow bucket.
+        self.buckets = [0] * (len(METRICS_HISTOGRAM_BUCKETS_MS) + 1)
+
+    def as_dict(self) -> dict[str, Any]:
+        bounds = [f"le_{bound}" for bound in METRICS_HISTOGRAM_BUCKETS_MS] + ["le_inf"]
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "timeouts": self.timeouts,
+            "last_rtt_ms": self.last_rtt_ms,
+            "mean_rtt_ms": round(self.total_ms / self.requests, 2) if self.requests else None,
+            "histogram_ms": dict(zip(bounds, self.buckets, strict=True)),
+        }
+
+
+class RemoteRelayApiMetrics:
+    """Per-endpoint timings, error counters and a recent failure window."""
+
+    def __init__(self) -> None:
+        self._endpoints: dict[str, RemoteRelayEndpointStats] = {}
+        self._recent_failures: deque[bool] = deque(maxlen=METRICS_FAILURE_WINDOW)
+
+    def record(self, endpoint: str, elapsed: float, *, error: bool = False, timeout: bool = False) -> None:
+        stats = self._endpoints.get(endpoint)
+        if stats is None:
+            stats = self._endpoints[endpoint] = RemoteRelayEndpointStats()
+        rtt_ms = round(elapsed * 1000, 2)
+        stats.requests += 1
+        stats.total_ms += rtt_ms
+        stats.buckets[bisect_left(METRICS_HISTOGRAM_BUCKETS_MS, rtt_ms)] += 1
+        if error:
+            stats.errors += 1
+            if timeout:
+                stats.timeouts += 1
+        else:
+            stats.last_rtt_ms = rtt_ms
+            stats.last_at = time.monotonic()
+        self._recent_failures.append(error)
+
+    def last_rtt_ms(self, endpoints: tuple[str, ...]) -> float | None:
+        """Return the most recent successful RTT among ``endpoints``."""
+        latest: RemoteRelayEndpointStats | None = None
+        for endpoint in endpoints:
+            stats = self._endpoints.get(endpoint)
+            if stats is None or stats.last_rtt_ms is None:
+                continue
+            if latest is None or stats.last_at > latest.last_at:
+                latest = stats
+        return latest.last_rtt_ms if latest is not None else None
+
+    @property
+    def failure_rate(self) -> float | None:
+        """Return the failure percentage over the most recent requests."""
+        if not self._recent_failures:
+            return None
+        return round(100 * sum(self._recent_failures) / len(self._recent_failures), 1)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "failure_rate_pct": self.failure_rate,
+            "endpoints": {endpoint: stats.as_dict() for endpoint, stats in self._endpoints.items()},
+        }
@@ -0,0 +1,271 @@
+"""Data models shared by RemoteRelay platforms."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass, field, replace
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.config_entries import ConfigEntry
+
+from .const import (
+    CONF_DEVICE_ID,
+    CONF_DISPLAY_NAME,
+    CONF_INPUT_SOURCES,
+    CONF_MAC_ADDRESSES,
+    CONF_PROTO_VERSION,
+    CONF_SELECTED_SOURCE_ID,
+)
+
+if TYPE_CHECKING:
+    from .api import RemoteRelayLocalApiClient
+    from .coordinator import RemoteRelayCoordinator
+    from .dispatcher import RemoteRelayCommandDispatcher
+    from .endpoint import RemoteRelayEndpointTracker
+    from .auth import RemoteRelayTokenManager
+
+
+@dataclass(slots=True)
+class RemoteRelayRuntimeData:
+    """Objects owned by one loaded config entry."""
+
+    api: RemoteRelayLocalApiClient
+    coordinator: RemoteRelayCoordinator
+    dispatcher: RemoteRelayCommandDispatcher
+    endpoint: RemoteRelayEndpointTracker
+    token: RemoteRelayTokenManager
+
+
+RemoteRelayConfigEntry = ConfigEntry[RemoteRelayRuntimeData]
+
+
+@dataclass(frozen=True, slots=True)
+class RemoteRelaySource:
+    """One input source advertised by the daemon."""
+
+    id: str
+    name: str
+    type: str
+
+
+class RemoteRelaySourceIndex:
+    """Input source lookup tables for one device, built once per profile change."""
+
+    __slots__ = ("names", "name_to_id", "id_to_name", "selected_id", "selected_name")
+
+    def __init__(
+        self,
+        names: tuple[str, ...],
+        name_to_id: dict[str, str],
+        id_to_name: dict[str, str],
+        selected_id: str,
+    ) -> None:
+        self.names = names
+        self.name_to_id = name_to_id
+        self.id_to_name = id_to_name
+        self.selected_id = selected_id
+        self.selected_name = id_to_name.get(selected_id) if selected_id else None
+
+    @classmethod
+    def build(cls, sources: tuple[RemoteRelaySource, ...], selected_id: str) -> RemoteRelaySourceIndex:
+        name_to_id: dict[str, str] = {}
+        id_to_name: dict[str, str] = {}
+        for src in sources:
+            name_to_id.setdefault(src.name, src.id)
+            id_to_name.setdefault(src.id, src.name)
+        return cls(tuple(src.name for src in sources), name_to_id, id_to_name, selected_id)
+
+    def with_selected(self, selected_id: str) -> RemoteRelaySourceIndex:
+        """Return an index sharing these tables with a different selected source."""
+        return RemoteRelaySourceIndex(self.names, self.name_to_id, self.id_to_name, selected_id)
+
+
+@dataclass(frozen=True, slots=True)
+class RemoteRelayProfile:
+    """Parsed, immutable snapshot of a daemon device profile."""
+
+    device_id: str
+    display_name: str
+    power_state: str
+    mac_addresses: tuple[str, ...]
+    sources: tuple[RemoteRelaySource, ...]
+    selected_source_id: str
+    proto_version: str
+    revision: Any = None
+    volume: int | None = None
+    muted: bool | None = None
+    source_index: RemoteRelaySourceIndex = field(compare=False, repr=False, default=None)  # type: ignore[assignment]
+
+    def __post_init__(self) -> None:
+        if self.source_index is None:
+            source_index = RemoteRelaySourceIndex.build(self.sources, self.selected_source_id)
+            object.__setattr__(self, "source_index", source_index)
+
+    @classmethod
+    def from_entry_data(cls, data: Mapping[str, Any]) -> RemoteRelayProfile:
+        """Build the profile last stored in the config entry."""
+        return cls(
+            device_id=str(data.get(CONF_DEVICE_ID) or "").strip(),
+            display_name=str(data.get(CONF_DISPLAY_NAME) or "").strip(),
+            power_state="unknown",
+            mac_addresses=tuple(normalize_mac_addresses(data.get(CONF_MAC_ADDRESSES, []))),
+            sources=_to_sources(normalize_input_sources(data.get(CONF_INPUT_SOURCES, []))),
+            selected_source_id=normalize_selected_source_id(data.get(CONF_SELECTED_SOURCE_ID)),
+            proto_version=str(data.get(CONF_PROTO_VERSION) or "").strip(),
+        )
+
+    @classmethod
+    def from_storage(cls, data: Mapping[str, Any]) -> RemoteRelayProfile:
+        """Rebuild a profile written by ``as_storage``."""
+        return cls(
+            device_id=str(data["device_id"]),
+            display_name=str(data["display_name"]),
+            power_state=str(data.get("power_state") or "unknown"),
+            mac_addresses=tuple(normalize_mac_addresses(data.get("mac_addresses"))),
+            sources=_to_sources(normalize_input_sources(data.get("sources"))),
+            selected_source_id=normalize_selected_source_id(data.get("selected_source_id")),
+            proto_version=str(data.get("proto_version") or ""),
+            volume=_parse_volume(data.get("volume")),
+            muted=_parse_muted(data.get("muted")),
+        )
+
+    def as_storage(self) -> dict[str, Any]:
+        """Return a JSON-serializable copy for the last-known profile cache."""
+        return {
+            "device_id": self.device_id,
+            "display_name": self.display_name,
+            "power_state": self.power_state,
+            "mac_addresses": list(self.mac_addresses),
+            "sources": [{"id": src.id, "name": src.name, "type": src.type} for src in self.sources],
+            "selected_source_id": self.selected_source_id,
+            "proto_version": self.proto_version,
+            "volume": self.volume,
+            "muted": self.muted,
+        }
+
+    @classmethod
+    def from_api(cls, raw: Mapping[str, Any], fallback: RemoteRelayProfile) -> RemoteRelayProfile:
+        """Parse a daemon profile; fields the daemon omits keep their ``fallback`` values."""
+        sources = fallback.sources
+        if isinstance(raw.get("inputSources"), list):
+            sources = _to_sources(normalize_input_sources(raw["inputSources"]))
+        selected_source_id = fallback.selected_source_id
+        if raw.get("selectedSourceId") is not None:
+            selected_source_id = normalize_selected_source_id(raw["selectedSourceId"])
+        if sources == fallback.sources and selected_source_id == fallback.selected_source_id:
+            source_index = fallback.source_index
+        elif sources == fallback.sources:
+            source_index = fallback.source_index.with_selected(selected_source_id)
+        else:
+            source_index = None
+
+        return cls(
+            device_id=str(raw.get("deviceId") or "").strip() or fallback.device_id,
+            display_name=str(raw.get("displayName") or "").strip() or fallback.display_name,
+            power_state=str(raw.get("powerState") or "unknown"),
+            mac_addresses=(
+                tuple(normalize_mac_addresses(raw["macAddresses"]))
+                if "macAddresses" in raw
+                else fallback.mac_addresses
+            ),
+            sources=sources,
+            selected_source_id=selected_source_id,
+            proto_version=str(raw.get("protoVersion") or "").strip() or fallback.proto_version,
+            revision=raw.get("revision"),
+            volume=_parse_volume(raw["volume"]) if "volume" in raw else fallback.volume,
+            muted=_parse_muted(raw["muted"]) if "muted" in raw else fallback.muted,
+            source_index=source_index,  # type: ignore[arg-type]
+        )
+
+    def with_live_state(self, raw: Mapping[str, Any]) -> RemoteRelayProfile:
+        """Apply a ``/ha/v1/state`` response; names, MACs and sources are left untouched."""
+        changes: dict[str, Any] = {}
+        if raw.get("powerState") is not None:
+            changes["power_state"] = str(raw["powerState"])
+        if raw.get("selectedSourceId") is not None:
+            changes["selected_source_id"] = normalize_selected_source_id(raw["selectedSourceId"])
+        if "volume" in raw:
+            changes["volume"] = _parse_volume(raw["volume"])
+        if "muted" in raw:
+            changes["muted"] = _parse_muted(raw["muted"])
+        changes = {key: value for key, value in changes.items() if getattr(self, key) != value}
+        return self.with_state(**changes) if changes else self
+
+    def with_state(self, **changes: Any) -> RemoteRelayProfile:
+        """Return a copy with the given fields replaced, keeping the source index in step."""
+        if "selected_source_id" in changes and "source_index" not in changes:
+            changes["source_index"] = self.source_index.with_selected(changes["selected_source_id"])
+        return replace(self, **changes)
+
+
+def _parse_volume(value: Any) -> int | None:
+    """Return the daemon volume as a 0-100 integer, or None if it is not reported."""
+    try:
+        return max(0, min(100, int(value)))
+    except (TypeError, ValueError):
+        return None
+
+
+def _parse_muted(value: Any) -> bool | None:
+    return value if isinstance(value, bool) else None
+
+
+def _to_sources(sources: list[dict[str, str]]) -> tuple[RemoteRelaySource, ...]:
+    return tuple(RemoteRelaySource(src["id"], src["name"], src["type"]) for src in sources)
+
+
+def normalize_mac_addresses(value: Any) -> list[str]:
+    if not isinstance(value, list):
+        return []
+
+    normalized: list[str] = []
+    seen: set[str] = set()
+    for item in value:
+        if isinstance(item, dict):
+            candidate = str(item.get("value") or "").strip()
+        else:
+            candidate = str(item or "").strip()
+        if not candidate:
+            continue
+        upper = candidate.upper()
+        if upper in seen:
+            continue
+        seen.add(upper)
+        normalized.append(candidate)
+    return normalized
+
+
+def normalize_input_sources(value: Any) -> list[dict[str, str]]:
+    if not isinstance(value, list):
+        return []
+
+    normalized: list[dict[str, str]] = []
+    seen_ids: set[str] = set()
+    for item in value:
+        if not isinstance(item, dict):
+            continue
+
+        source_id = str(item.get("id") or "").strip()
+        if not source_id:
+            continue
+
+        source_id_key = source_id.lower()
+        if source_id_key in seen_ids:
+            continue
+        seen_ids.add(source_id_key)
+
+        source_name = str(item.get("name") or "").strip() or "Unknown"
+        source_type = str(item.get("type") or "").strip()
+        normalized.append(
+            {
+                "id": source_id,
+                "name": source_name,
+                "type": source_type,
+            }
+        )
+
+    return normalized
+
+
+def normalize_selected_source_id(value: Any) -> str:
+    return str(value or "").strip()
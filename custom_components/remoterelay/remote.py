@@ -5,27 +5,66 @@ from __future__ import annotations
 import asyncio
 from typing import Any
 
-from homeassistant.components.remote import RemoteEntity
+import voluptuous as vol
+
+from homeassistant.components.remote import ATTR_HOLD_SECS, RemoteEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import config_validation as cv, entity_platform
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import CONF_BROADCAST_ADDRESS, CONF_DEVICE_ID, CONF_DISPLAY_NAME, CONF_MAC_ADDRESSES, DOMAIN
-from .const import REMOTE_DIRECT_COMMANDS, REMOTE_NAV_KEYS
-
-NAV_KEYS = set(REMOTE_NAV_KEYS)
-DIRECT_COMMANDS = set(REMOTE_DIRECT_COMMANDS)
+from .const import (
+    CONF_DEVICE_ID,
+    CONF_DISPLAY_NAME,
+    CONF_MACROS,
+    DOMAIN,
+    HOLD_REPEAT_INTERVAL_MS,
+    HOLD_SAFETY_TIMEOUT_SECONDS,
+    HOLD_START,
+    HOLD_STOP,
+    HOLDABLE_COMMANDS,
+    HOLDABLE_NAV_KEYS,
+    PROTO_VERSION_BATCH_COMMANDS,
+    PROTO_VERSION_HOLD_KEYS,
+)
+from .macros import command_payload, compile_macro, normalize_command, normalize_macro_name
+from .models import RemoteRelayConfigEntry
+
+HOLDABLE_KEYS = (*HOLDABLE_NAV_KEYS, *HOLDABLE_COMMANDS)
 
 
 async def async_setup_entry(
     hass: HomeAssistant,
-    entry: ConfigEntry,
+    entry: RemoteRelayConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up RemoteRelay remote entity from a config entry."""
-    runtime = hass.data[DOMAIN][entry.entry_id]
-    async_add_entities([RemoteRelayRemoteEntity(entry, runtime["coordinator"], runtime["api"])])
+    runtime = entry.runtime_data
+    platform = entity_platform.async_get_current_platform()
+    platform.async_register_entity_service(
+        "hold_key",
+        {
+            vol.Required("key"): vol.In(HOLDABLE_KEYS),
+            vol.Required("action"): vol.In((HOLD_START, HOLD_STOP)),
+        },
+        "async_hold_key",
+    )
+    platform.async_register_entity_service(
+        "run_macro",
+        {vol.Required("name"): cv.string},
+        "async_run_macro",
+    )
+    platform.async_register_entity_service(
+        "set_macro",
+        {
+            vol.Required("name"): cv.string,
+            vol.Optional("commands", default=[]): vol.All(cv.ensure_list, [cv.string]),
+        },
+        "async_set_macro",
+    )
+    async_add_entities([RemoteRelayRemoteEntity(entry, runtime.coordinator, runtime.dispatcher)])
 
 
 class RemoteRelayRemoteEntity(CoordinatorEntity, RemoteEntity):
@@ -33,21 +72,18 @@ class RemoteRelayRemoteEntity(CoordinatorEntity, RemoteEntity):
 
     _attr_should_poll = False
 
-    def __init__(self, entry: ConfigEntry, coordinator, api) -> None:
+    def __init__(self, entry: ConfigEntry, coordinator, dispatcher) -> None:
         super().__init__(coordinator)
         self.hass = coordinator.hass
         self._entry = entry
-        self._api = api
+        self._dispatcher = dispatcher
         device_id = entry.data.get(CONF_DEVICE_ID)
         self._attr_unique_id = f"{device_id}-remote" if device_id else None
 
     @property
     def name(self) -> str | None:
         """Return entity name."""
-        data = self.coordinator.data or {}
-        profile_name = str(data.get("displayName") or "").strip()
-        base_name = profile_name or str(self._entry.data.get(CONF_DISPLAY_NAME, "RemoteRelay")).strip() or "RemoteRelay"
-        return f"{base_name} Remote"
+        return f"{self.coordinator.data.display_name or 'RemoteRelay'} Remote"
 
     @property
     def available(self) -> bool:
@@ -59,18 +95,6 @@ class RemoteRelayRemoteEntity(CoordinatorEntity, RemoteEntity):
         """Remote entity logical power mirrors daemon availability."""
         return bool(self.coordinator.last_update_success)
 
-    @property
-    def _mac_addresses(self) -> list[str]:
-        return [str(mac).strip() for mac in self._entry.data.get(CONF_MAC_ADDRESSES, []) if str(mac).strip()]
-
-    @property
-    def _broadcast_address(self) -> str | None:
-        value = self._entry.data.get(CONF_BROADCAST_ADDRESS)
-        if value is None:
-            return None
-        normalized = str(value).strip()
-        return normalized or None
-
     @property
     def device_info(self) -> dict[str, Any]:
         """Attach to the same HA device as media_player entity."""
@@ -82,26 +106,12 @@ class RemoteRelayRemoteEntity(CoordinatorEntity, RemoteEntity):
         }
 
     async def async_turn_on(self, **kwargs: Any) -> None:
-        """Send Wake-on-LAN packets for all configured MAC addresses."""
-        if not self._mac_addresses:
-            raise ValueError("No MAC addresses configured for Wake-on-LAN.")
-
-        unique_macs = list(dict.fromkeys(str(mac).strip() for mac in self._mac_addresses if str(mac).strip()))
-        for mac in unique_macs:
-            service_data: dict[str, Any] = {"mac": mac}
-            if self._broadcast_address:
-                service_data["broadcast_address"] = self._broadcast_address
-            await self.hass.services.async_call(
-                "wake_on_lan",
-                "send_magic_packet",
-                service_data,
-                blocking=True,
-            )
+        """Send Wake-on-LAN bursts for all known MAC addresses."""
+        await self.coordinator.async_wake_on_lan()
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Map remote off to daemon power-off."""
-        await self._api.async_send_command({"command": "power_off"})
-        await self.coordinator.async_request_refresh()
+        await self._dispatcher.async_send_command({"command": "power_off"}, optimistic={"power_state": "off"})
 
     async def async_send_command(self, command: list[str] | str, **kwargs: Any) -> None:
         """Send one or more commands to RemoteRelay daemon.
@@ -118,51 +128,90 @@ class RemoteRelayRemoteEntity(CoordinatorEntity, RemoteEntity):
         - playpause -> play_pause
         - vol_up / vol_down
         - next / previous
+
+        Sequences (lists or ``num_repeats``) are sent in a single batch request when the
+        daemon supports it, with ``delay_secs`` applied daemon-side between steps.
+
+        ``hold_secs`` on a single arrow or volume key makes the daemon auto-repeat it for
+        that long; the service call returns as soon as the hold has started.
         """
 
         commands = command if isinstance(command, list) else [command]
-        normalized_commands = [self._normalize_command(item) for item in commands]
+        normalized_commands = [normalize_command(item) for item in commands]
+
+        hold_secs = float(kwargs.get(ATTR_HOLD_SECS, 0) or 0)
+        if hold_secs > 0:
+            if len(normalized_commands) != 1:
+                raise ValueError("hold_secs supports exactly one command.")
+            await self._async_send_hold(normalized_commands[0], HOLD_START, hold_secs)
+            return
 
         repeats = max(1, int(kwargs.get("num_repeats", 1) or 1))
         delay_secs = float(kwargs.get("delay_secs", 0) or 0)
 
-        for repeat_index in range(repeats):
-            for item in normalized_commands:
-                await self._dispatch_command(item)
-                if delay_secs > 0:
-                    await asyncio.sleep(delay_secs)
-            # Avoid an extra sleep after the last repeat if delay was provided.
-            if repeat_index == repeats - 1:
-                continue
-
-    async def _dispatch_command(self, command: str) -> None:
-        if command in NAV_KEYS:
-            await self._api.async_send_command({"command": "navigate", "key": command})
-            return
+        steps = [command_payload(item) for _ in range(repeats) for item in normalized_commands]
+        if delay_secs > 0:
+            delay_ms = int(delay_secs * 1000)
+            for step in steps[:-1]:
+                step["delayMs"] = delay_ms
+        await self._async_send_steps(steps)
 
-        if command in DIRECT_COMMANDS:
-            await self._api.async_send_command({"command": command})
-            if command == "power_off":
-                await self.coordinator.async_request_refresh()
-            return
+    async def async_run_macro(self, name: str) -> None:
+        """Send a stored macro to the daemon as one batch.
 
-        raise ValueError(f"Unsupported remote command: {command}")
-
-    @staticmethod
-    def _normalize_command(value: Any) -> str:
-        normalized = str(value or "").strip().lower()
-        aliases = {
-            "enter": "ok",
-            "select": "ok",
-            "return": "back",
-            "playpause": "play_pause",
-            "play-pause": "play_pause",
-            "next": "next_track",
-            "previous": "previous_track",
-            "prev": "previous_track",
-            "vol_up": "volume_up",
-            "vol_down": "volume_down",
-            "mute": "mute_toggle",
-            "off": "power_off",
-        }
-        return aliases.get(normalized, normalized)
+        Returns once the daemon has accepted the plan; pauses run daemon-side.
+        """
+        plan = self._dispatcher.get_macro(normalize_macro_name(name))
+        if plan is None:
+            raise HomeAssistantError(f"Unknown RemoteRelay macro: {name}")
+        await self._async_send_steps(plan)
+
+    async def async_set_macro(self, name: str, commands: list[str]) -> None:
+        """Store a macro for this device, or delete it when ``commands`` is empty."""
+        name = normalize_macro_name(name)
+        macros = dict(self._entry.options.get(CONF_MACROS) or {})
+        if commands:
+            compile_macro(commands)
+            macros[name] = [str(step).strip() for step in commands]
+        elif macros.pop(name, None) is None:
+            return
+        self.hass.config_entries.async_update_entry(self._entry, options={**self._entry.options, CONF_MACROS: macros})
+        # Apply now rather than from the update listener so a following run_macro sees it.
+        self._dispatcher.async_apply_options()
+
+    async def _async_send_steps(self, steps: list[dict[str, Any]]) -> None:
+        """Send steps as one batch when supported, otherwise one by one honouring ``delayMs``."""
+        powers_off = any(step["command"] == "power_off" for step in steps)
+
+        if len(steps) > 1 and self._dispatcher.api.supports(PROTO_VERSION_BATCH_COMMANDS):
+            await self._dispatcher.async_send_commands(steps)
+        else:
+            for index, step in enumerate(steps):
+                step = dict(step)
+                delay_ms = step.pop("delayMs", 0)
+                await self._dispatcher.async_send_command(step)
+                if delay_ms and index < len(steps) - 1:
+                    await asyncio.sleep(delay_ms / 1000)
+
+        if powers_off:
+            self.coordinator.async_set_optimistic({"power_state": "off"})
+
+    async def async_hold_key(self, key: str, action: str) -> None:
+        """Start or stop daemon-side auto-repeat of an arrow or volume key.
+
+        A started hold ends on its own after ``HOLD_SAFETY_TIMEOUT_SECONDS`` if no stop arrives.
+        """
+        await self._async_send_hold(normalize_command(key), action, HOLD_SAFETY_TIMEOUT_SECONDS)
+
+    async def _async_send_hold(self, command: str, action: str, hold_secs: float) -> None:
+        if command not in HOLDABLE_KEYS:
+            raise ValueError(f"Command cannot be held: {command}")
+        if not self._dispatcher.api.supports(PROTO_VERSION_HOLD_KEYS):
+            raise HomeAssistantError("This RemoteRelay daemon does not support holding keys.")
+
+        payload = command_payload(command)
+        payload["hold"] = action
+        if action == HOLD_START:
+            payload["holdMs"] = int(hold_secs * 1000)
+            payload["repeatMs"] = HOLD_REPEAT_INTERVAL_MS
+        await self._dispatcher.async_send_command(payload)
@@ -0,0 +1,159 @@
+"""Diagnostic sensors for RemoteRelay API health."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Any
+
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import PERCENTAGE, EntityCategory, UnitOfTime
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .api import RemoteRelayLocalApiClient
+from .const import (
+    BREAKER_CLOSED,
+    BREAKER_HALF_OPEN,
+    BREAKER_OPEN,
+    CONF_DEVICE_ID,
+    CONF_DISPLAY_NAME,
+    DOMAIN,
+    TOKEN_STATE_EXPIRED,
+    TOKEN_STATE_EXPIRING,
+    TOKEN_STATE_NO_EXPIRY,
+    TOKEN_STATE_REJECTED,
+    TOKEN_STATE_VALID,
+)
+from .metrics import COMMAND_ENDPOINTS, REFRESH_ENDPOINTS
+from .models import RemoteRelayConfigEntry
+
+# Metrics change with every request; sample them instead of writing state per request.
+SCAN_INTERVAL = timedelta(seconds=30)
+
+
+@dataclass(frozen=True, kw_only=True)
+class RemoteRelaySensorDescription(SensorEntityDescription):
+    """Describes a RemoteRelay diagnostic sensor."""
+
+    value_fn: Callable[[RemoteRelayLocalApiClient], float | str | None]
+    requires_metrics: bool = True
+
+
+SENSORS = (
+    RemoteRelaySensorDescription(
+        key="command_rtt",
+        name="Command RTT",
+        icon="mdi:timer-outline",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_registry_enabled_default=False,
+        value_fn=lambda api: api.metrics.last_rtt_ms(COMMAND_ENDPOINTS),
+    ),
+    RemoteRelaySensorDescription(
+        key="refresh_rtt",
+        name="Refresh RTT",
+        icon="mdi:timer-refresh-outline",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_registry_enabled_default=False,
+        value_fn=lambda api: api.metrics.last_rtt_ms(REFRESH_ENDPOINTS),
+    ),
+    RemoteRelaySensorDescription(
+        key="api_failure_rate",
+        name="API failure rate",
+        icon="mdi:alert-circle-outline",
+        native_unit_of_measurement=PERCENTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_registry_enabled_default=False,
+        value_fn=lambda api: api.metrics.failure_rate,
+    ),
+    RemoteRelaySensorDescription(
+        key="api_circuit",
+        name="API circuit",
+        icon="mdi:electric-switch",
+        device_class=SensorDeviceClass.ENUM,
+        options=[BREAKER_CLOSED, BREAKER_OPEN, BREAKER_HALF_OPEN],
+        requires_metrics=False,
+        value_fn=lambda api: api.breaker.state,
+    ),
+    RemoteRelaySensorDescription(
+        key="access_token",
+        name="Access token",
+        icon="mdi:key-chain-variant",
+        device_class=SensorDeviceClass.ENUM,
+        options=[
+            TOKEN_STATE_VALID,
+            TOKEN_STATE_EXPIRING,
+            TOKEN_STATE_EXPIRED,
+            TOKEN_STATE_REJECTED,
+            TOKEN_STATE_NO_EXPIRY,
+        ],
+        requires_metrics=False,
+        value_fn=lambda api: api.token_state,
+    ),
+    RemoteRelaySensorDescription(
+        key="token_renewal_latency",
+        name="Token renewal latency",
+        icon="mdi:key-change",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        requires_metrics=False,
+        value_fn=lambda api: api.last_token_refresh_ms,
+    ),
+)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: RemoteRelayConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up RemoteRelay diagnostic sensors from config entry."""
+    api = entry.runtime_data.api
+    async_add_entities(RemoteRelayDiagnosticSensor(entry, api, description) for description in SENSORS)
+
+
+class RemoteRelayDiagnosticSensor(SensorEntity):
+    """Sensor exposing one request metric, the circuit breaker or the access token state of the API client."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    entity_description: RemoteRelaySensorDescription
+
+    def __init__(
+        self,
+        entry: ConfigEntry,
+        api: RemoteRelayLocalApiClient,
+        description: RemoteRelaySensorDescription,
+    ) -> None:
+        self.entity_description = description
+        self._entry = entry
+        self._api = api
+        device_id = str(entry.data.get(CONF_DEVICE_ID) or "remoterelay").strip() or "remoterelay"
+        self._attr_unique_id = f"{device_id}-{description.key}"
+
+    @property
+    def available(self) -> bool:
+        return not self.entity_description.requires_metrics or self._api.metrics is not None
+
+    @property
+    def native_value(self) -> float | str | None:
+        if not self.available:
+            return None
+        return self.entity_description.value_fn(self._api)
+
+    @property
+    def device_info(self) -> dict[str, Any]:
+        return {
+            "identifiers": {(DOMAIN, self._entry.data.get(CONF_DEVICE_ID))},
+            "name": str(self._entry.data.get(CONF_DISPLAY_NAME, "RemoteRelay")),
+            "manufacturer": "RemoteRelay",
+            "model": "RemoteRelay PC Bridge",
+        }
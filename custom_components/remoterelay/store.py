@@ -0,0 +1,36 @@
+"""Last-known profile cache for RemoteRelay config entries."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN, PROFILE_STORE_SAVE_DELAY_SECONDS, PROFILE_STORE_VERSION
+from .models import RemoteRelayProfile
+
+
+class RemoteRelayProfileStore:
+    """Persist the last confirmed profile of one config entry in ``.storage``."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        self._store: Store[dict[str, Any]] = Store(hass, PROFILE_STORE_VERSION, f"{DOMAIN}.{entry_id}.profile")
+
+    async def async_load(self) -> RemoteRelayProfile | None:
+        """Return the cached profile, or None if there is none or it cannot be read."""
+        data = await self._store.async_load()
+        if not isinstance(data, dict):
+            return None
+        try:
+            return RemoteRelayProfile.from_storage(data)
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    @callback
+    def async_schedule_save(self, profile: RemoteRelayProfile) -> None:
+        """Write ``profile`` after a short delay; later calls replace the pending write."""
+        self._store.async_delay_save(profile.as_storage, PROFILE_STORE_SAVE_DELAY_SECONDS)
+
+    async def async_remove(self) -> None:
+        await self._store.async_remove()
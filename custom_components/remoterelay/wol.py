@@ -0,0 +1,78 @@
+"""Asyncio Wake-on-LAN sender."""
+
+from __future__ import annotations
+
+import asyncio
+import socket
+from collections.abc import Sequence
+from typing import Any
+
+from .const import DEFAULT_WOL_BROADCAST_ADDRESS, DEFAULT_WOL_PORT
+
+_MAC_SEPARATORS = str.maketrans("", "", ":-. ")
+
+
+def split_address_list(value: Any) -> list[str]:
+    """Split a comma or whitespace separated address option into a list."""
+    if not value:
+        return []
+    if isinstance(value, str):
+        value = value.replace(",", " ").split()
+    return [item for item in (str(part).strip() for part in value) if item]
+
+
+def build_magic_packet(mac: str) -> bytes:
+    """Return the magic packet for ``mac`` (any of ``:``, ``-`` or ``.`` separators)."""
+    digits = mac.translate(_MAC_SEPARATORS)
+    if len(digits) != 12:
+        raise ValueError(f"Invalid MAC address: {mac}")
+    try:
+        mac_bytes = bytes.fromhex(digits)
+    except ValueError as err:
+        raise ValueError(f"Invalid MAC address: {mac}") from err
+    return b"\xff" * 6 + mac_bytes * 16
+
+
+async def async_send_magic_packets(
+    macs: Sequence[str],
+    broadcast_addresses: Sequence[str] = (DEFAULT_WOL_BROADCAST_ADDRESS,),
+    *,
+    interface_addresses: Sequence[str] = (),
+    port: int = DEFAULT_WOL_PORT,
+    burst_count: int = 1,
+    burst_spacing: float = 0.0,
+) -> int:
+    """Send magic packets for every MAC to every broadcast address, ``burst_count`` times.
+
+    Each burst goes out in one pass without awaiting between packets. With
+    ``interface_addresses`` one socket is bound per local address so the packets leave
+    through each of those interfaces. Returns the number of datagrams sent.
+    """
+    packets = [build_magic_packet(mac) for mac in dict.fromkeys(macs)]
+    targets = list(dict.fromkeys(broadcast_addresses)) or [DEFAULT_WOL_BROADCAST_ADDRESS]
+    loop = asyncio.get_running_loop()
+
+    transports: list[asyncio.DatagramTransport] = []
+    try:
+        for local_address in interface_addresses or ("0.0.0.0",):
+            transport, _ = await loop.create_datagram_endpoint(
+                asyncio.DatagramProtocol,
+                local_addr=(local_address, 0),
+                family=socket.AF_INET,
+                allow_broadcast=True,
+            )
+            transports.append(transport)
+
+        sent = 0
+        for burst_index in range(max(1, burst_count)):
+            if burst_index and burst_spacing > 0:
+                await asyncio.sleep(burst_spacing)
+            for transport in transports:
+                for target in targets:
+                    for packet in packets:
+                        transport.sendto(packet, (target, port))
+                        sent += 1
+        return sent
+    finally:
+        for transport in transports:
+            transport.close()
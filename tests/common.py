@@ -0,0 +1,13 @@
+"""Helpers shared by the RemoteRelay tests."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+
+
+async def async_wait_for(condition: Callable[[], bool], timeout: float = 2) -> None:
+    """Yield to the event loop until ``condition`` holds, failing after ``timeout`` seconds."""
+    async with asyncio.timeout(timeout):
+        while not condition():
+            await asyncio.sleep(0)
@@ -0,0 +1,76 @@
+"""Fixtures for RemoteRelay tests; requires pytest-homeassistant-custom-component."""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator, Awaitable, Callable
+from typing import Any
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.core import HomeAssistant
+
+from benchmarks.fake_daemon import ACCESS_TOKEN, FakeDaemon
+from custom_components.remoterelay.const import (
+    CONF_ACCESS_TOKEN,
+    CONF_API_BASE_URL,
+    CONF_DEVICE_ID,
+    CONF_DISPLAY_NAME,
+    CONF_PROTO_VERSION,
+    DOMAIN,
+)
+
+from .common import async_wait_for
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations):
+    """Make custom_components/remoterelay loadable in every test."""
+    yield
+
+
+@pytest.fixture
+async def daemon(socket_enabled: None) -> AsyncIterator[FakeDaemon]:
+    """The benchmark stand-in for the daemon API, serving one device on loopback."""
+    daemon = FakeDaemon()
+    await daemon.start()
+    yield daemon
+    await daemon.stop()
+
+
+@pytest.fixture
+async def setup_entry(
+    hass: HomeAssistant, daemon: FakeDaemon
+) -> AsyncIterator[Callable[..., Awaitable[MockConfigEntry]]]:
+    """Set up config entries for the fake daemon's first device; unloaded after the test.
+
+    Returns once the first refresh in the background has loaded the daemon profile.
+    """
+    entries: list[MockConfigEntry] = []
+
+    async def _setup(options: dict[str, Any] | None = None) -> MockConfigEntry:
+        device = daemon.devices[0]
+        entry = MockConfigEntry(
+            domain=DOMAIN,
+            unique_id=device.device_id,
+            title="Test PC",
+            data={
+                CONF_API_BASE_URL: daemon.base_url(0),
+                CONF_ACCESS_TOKEN: ACCESS_TOKEN,
+                CONF_DEVICE_ID: device.device_id,
+                CONF_DISPLAY_NAME: "Test PC",
+                CONF_PROTO_VERSION: device.proto_version,
+            },
+            options=options or {},
+        )
+        entry.add_to_hass(hass)
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+        entries.append(entry)
+        await async_wait_for(lambda: entry.runtime_data.coordinator.data.revision is not None)
+        return entry
+
+    yield _setup
+    for entry in entries:
+        await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
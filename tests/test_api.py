@@ -0,0 +1,84 @@
+"""Tests for the local API client against loopback servers."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+
+import aiohttp
+import pytest
+
+from benchmarks.fake_daemon import ACCESS_TOKEN, FakeDaemon
+from custom_components.remoterelay import api as api_module
+from custom_components.remoterelay.api import RemoteRelayLocalApiClient, RemoteRelayTimeoutError
+from custom_components.remoterelay.const import API_WARM_UP_IDLE_SECONDS
+from custom_components.remoterelay.metrics import RemoteRelayApiMetrics
+
+# The Home Assistant test plugin blocks sockets; these tests talk to servers on loopback.
+pytestmark = pytest.mark.usefixtures("socket_enabled")
+
+
+@pytest.fixture
+async def stalled_server() -> AsyncIterator[str]:
+    """A server that accepts connections and reads requests but never answers."""
+    connections: list[asyncio.StreamWriter] = []
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        connections.append(writer)
+        await reader.read()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    yield f"http://127.0.0.1:{port}"
+    for writer in connections:
+        writer.close()
+    server.close()
+    await server.wait_closed()
+
+
+@pytest.mark.parametrize(
+    "timeout",
+    [
+        aiohttp.ClientTimeout(total=5, sock_read=0.2),
+        aiohttp.ClientTimeout(total=0.2),
+    ],
+    ids=["read_timeout", "total_timeout"],
+)
+async def test_stalled_daemon_counts_as_timeout(
+    stalled_server: str, timeout: aiohttp.ClientTimeout, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(api_module, "_REQUEST_TIMEOUT", timeout)
+    async with aiohttp.ClientSession() as session:
+        api = RemoteRelayLocalApiClient(session, stalled_server, "token")
+        api.metrics = RemoteRelayApiMetrics()
+
+        with pytest.raises(RemoteRelayTimeoutError):
+            await api.async_get_device_state()
+
+    stats = api.metrics.as_dict()["endpoints"]["/ha/v1/state"]
+    assert stats["errors"] == 1
+    assert stats["timeouts"] == 1
+    assert api.breaker.as_dict()["consecutive_failures"] == 1
+
+
+async def test_warm_up_skips_the_health_check_while_the_pool_is_fresh(daemon: FakeDaemon) -> None:
+    async with aiohttp.ClientSession() as session:
+        api = RemoteRelayLocalApiClient(session, daemon.base_url(0), ACCESS_TOKEN)
+        api.metrics = RemoteRelayApiMetrics()
+        assert api.needs_warm_up
+
+        await api.async_warm_up()
+        assert api.channel_connected
+        assert not api.needs_warm_up
+
+        # A fresh answer shows the pooled connection is live; only the channel would be reopened.
+        await api.async_get_device_state()
+        await api.async_warm_up()
+        health = api.metrics.as_dict()["endpoints"]["/ha/v1/health"]
+        assert health["requests"] == 1
+
+        api._last_answer_at -= API_WARM_UP_IDLE_SECONDS  # noqa: SLF001
+        assert api.needs_warm_up
+        await api.async_warm_up()
+        assert api.metrics.as_dict()["endpoints"]["/ha/v1/health"]["requests"] == 2
+        await api.async_close()
@@ -0,0 +1,160 @@
+"""Tests for access token renewal: 401 retries, the shared refresh and the renewal schedule."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import AsyncIterator
+from datetime import timedelta
+
+import aiohttp
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from pytest_homeassistant_custom_component.common import MockConfigEntry, async_fire_time_changed
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from custom_components.remoterelay.api import (
+    RemoteRelayApiError,
+    RemoteRelayAuthError,
+    RemoteRelayLocalApiClient,
+)
+from custom_components.remoterelay.auth import RemoteRelayTokenManager
+from custom_components.remoterelay.const import CONF_ACCESS_TOKEN, DOMAIN, TOKEN_STATE_REJECTED
+
+from .common import async_wait_for
+
+OLD_TOKEN = "old-token"
+NEW_TOKEN = "new-token"
+
+
+class TokenDaemon:
+    """Accepts only ``valid_token``; ``/pairing/refresh`` answers ``refresh_status``."""
+
+    def __init__(self) -> None:
+        self.valid_token = NEW_TOKEN
+        self.refresh_status = 200
+        self.refresh_delay = 0.05
+        self.refresh_calls = 0
+        self.state_calls = 0
+
+    def app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_get("/ha/v1/state", self._state)
+        app.router.add_post("/ha/v1/pairing/refresh", self._refresh)
+        return app
+
+    async def _state(self, request: web.Request) -> web.Response:
+        self.state_calls += 1
+        if request.headers.get("Authorization") != f"Bearer {self.valid_token}":
+            return web.json_response({"message": "Unauthorized"}, status=401)
+        return web.json_response({"powerState": "on"})
+
+    async def _refresh(self, request: web.Request) -> web.Response:
+        self.refresh_calls += 1
+        # Held open so concurrent 401s arrive while the refresh is still in flight.
+        await asyncio.sleep(self.refresh_delay)
+        if self.refresh_status != 200:
+            return web.json_response({"message": "Refresh failed"}, status=self.refresh_status)
+        return web.json_response({"accessToken": NEW_TOKEN, "expiresIn": 3600})
+
+
+@pytest.fixture
+async def token_daemon(socket_enabled: None) -> AsyncIterator[tuple[TokenDaemon, str]]:
+    daemon = TokenDaemon()
+    server = TestServer(daemon.app(), host="127.0.0.1")
+    await server.start_server()
+    yield daemon, str(server.make_url("")).rstrip("/")
+    await server.close()
+
+
+@pytest.fixture
+async def session() -> AsyncIterator[aiohttp.ClientSession]:
+    async with aiohttp.ClientSession() as session:
+        yield session
+
+
+async def test_concurrent_401s_share_one_refresh(
+    token_daemon: tuple[TokenDaemon, str], session: aiohttp.ClientSession
+) -> None:
+    daemon, base_url = token_daemon
+    api = RemoteRelayLocalApiClient(session, base_url, OLD_TOKEN)
+    renewed: list[str] = []
+    api.token_listener = lambda token, issued_at, expires_at: renewed.append(token)
+
+    results = await asyncio.gather(*(api.async_get_device_state() for _ in range(2)))
+
+    assert results == [{"powerState": "on"}] * 2
+    assert daemon.refresh_calls == 1
+    assert renewed == [NEW_TOKEN]
+    # Each request: one 401, then one retry with the new token.
+    assert daemon.state_calls == 4
+
+
+@pytest.mark.parametrize(
+    ("refresh_status", "error"),
+    [(401, RemoteRelayAuthError), (404, RemoteRelayAuthError), (500, RemoteRelayApiError)],
+)
+async def test_failed_refresh_is_not_retried(
+    token_daemon: tuple[TokenDaemon, str],
+    session: aiohttp.ClientSession,
+    refresh_status: int,
+    error: type[Exception],
+) -> None:
+    daemon, base_url = token_daemon
+    daemon.refresh_status = refresh_status
+    api = RemoteRelayLocalApiClient(session, base_url, OLD_TOKEN)
+
+    with pytest.raises(error):
+        await api.async_get_device_state()
+
+    assert daemon.refresh_calls == 1
+    assert daemon.state_calls == 1
+    if error is RemoteRelayAuthError:
+        assert api.token_state == TOKEN_STATE_REJECTED
+
+
+async def test_renewed_token_rejected_again_is_not_retried(
+    token_daemon: tuple[TokenDaemon, str], session: aiohttp.ClientSession
+) -> None:
+    daemon, base_url = token_daemon
+    daemon.valid_token = "some-other-token"
+    api = RemoteRelayLocalApiClient(session, base_url, OLD_TOKEN)
+
+    with pytest.raises(RemoteRelayAuthError):
+        await api.async_get_device_state()
+
+    assert daemon.refresh_calls == 1
+    assert daemon.state_calls == 2
+
+
+async def test_renewal_fires_at_the_renew_margin(
+    hass: HomeAssistant, token_daemon: tuple[TokenDaemon, str], session: aiohttp.ClientSession
+) -> None:
+    daemon, base_url = token_daemon
+    issued_at = time.time()
+    api = RemoteRelayLocalApiClient(
+        session, base_url, OLD_TOKEN, token_issued_at=issued_at, token_expires_at=issued_at + 3600
+    )
+    # A one-hour token is renewed at half its lifetime, not TOKEN_RENEW_MARGIN_SECONDS before expiry.
+    assert api.token_renew_margin == 1800
+    entry = MockConfigEntry(domain=DOMAIN, data={CONF_ACCESS_TOKEN: OLD_TOKEN})
+    entry.add_to_hass(hass)
+    manager = RemoteRelayTokenManager(hass, entry, api)
+    manager.async_start()
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1790))
+    await hass.async_block_till_done()
+    assert daemon.refresh_calls == 0
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1810))
+    await async_wait_for(lambda: entry.data[CONF_ACCESS_TOKEN] == NEW_TOKEN)
+
+    assert daemon.refresh_calls == 1
+    assert manager.as_dict()["refreshes"] == 1
+    # The renewed token is scheduled for renewal in turn, halfway through its hour.
+    next_renewal = dt_util.parse_datetime(manager.as_dict()["next_renewal"]).timestamp()
+    assert next_renewal == pytest.approx(time.time() + 1800, abs=5)
+    manager._async_cancel_renew()  # noqa: SLF001 - the entry was never set up, so it is not unloaded
@@ -0,0 +1,104 @@
+"""Tests for the API circuit breaker."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+from custom_components.remoterelay import breaker as breaker_module
+from custom_components.remoterelay.breaker import RemoteRelayCircuitBreaker
+from custom_components.remoterelay.const import (
+    BREAKER_CLOSED,
+    BREAKER_COOLDOWN_SECONDS,
+    BREAKER_FAILURE_THRESHOLD,
+    BREAKER_HALF_OPEN,
+    BREAKER_MAX_COOLDOWN_SECONDS,
+    BREAKER_OPEN,
+)
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> _Clock:
+    clock = _Clock()
+    monkeypatch.setattr(breaker_module, "time", SimpleNamespace(monotonic=clock.monotonic))
+    return clock
+
+
+def _trip(breaker: RemoteRelayCircuitBreaker) -> None:
+    for _ in range(BREAKER_FAILURE_THRESHOLD):
+        assert breaker.allow()
+        breaker.record_failure()
+
+
+def test_opens_after_consecutive_failures(clock: _Clock) -> None:
+    breaker = RemoteRelayCircuitBreaker()
+    for _ in range(BREAKER_FAILURE_THRESHOLD - 1):
+        breaker.record_failure()
+    assert breaker.state == BREAKER_CLOSED
+
+    breaker.record_failure()
+    assert breaker.state == BREAKER_OPEN
+    assert not breaker.allow()
+    assert breaker.retry_in == BREAKER_COOLDOWN_SECONDS
+
+
+def test_success_resets_the_failure_count(clock: _Clock) -> None:
+    breaker = RemoteRelayCircuitBreaker()
+    for _ in range(BREAKER_FAILURE_THRESHOLD - 1):
+        breaker.record_failure()
+    breaker.record_success()
+    for _ in range(BREAKER_FAILURE_THRESHOLD - 1):
+        breaker.record_failure()
+    assert breaker.closed
+
+
+def test_half_open_lets_one_request_through(clock: _Clock) -> None:
+    breaker = RemoteRelayCircuitBreaker()
+    _trip(breaker)
+
+    clock.now += BREAKER_COOLDOWN_SECONDS
+    assert breaker.state == BREAKER_HALF_OPEN
+    assert breaker.allow()
+    assert not breaker.allow()
+
+    breaker.record_success()
+    assert breaker.closed
+    assert breaker.allow()
+
+
+def test_half_open_failure_doubles_the_cooldown(clock: _Clock) -> None:
+    breaker = RemoteRelayCircuitBreaker()
+    _trip(breaker)
+
+    cooldown = BREAKER_COOLDOWN_SECONDS
+    while cooldown < BREAKER_MAX_COOLDOWN_SECONDS:
+        clock.now += cooldown
+        assert breaker.allow()
+        breaker.record_failure()
+        cooldown = min(cooldown * 2, BREAKER_MAX_COOLDOWN_SECONDS)
+        assert breaker.retry_in == cooldown
+
+    clock.now += cooldown
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.retry_in == BREAKER_MAX_COOLDOWN_SECONDS
+    assert breaker.as_dict()["trips"] > 1
+
+
+def test_release_returns_the_half_open_slot(clock: _Clock) -> None:
+    breaker = RemoteRelayCircuitBreaker()
+    _trip(breaker)
+    clock.now += BREAKER_COOLDOWN_SECONDS
+
+    assert breaker.allow()
+    breaker.release()
+    assert breaker.allow()
@@ -0,0 +1,158 @@
+"""Tests for the coordinator's polling path against the fake daemon."""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Awaitable, Callable
+from types import SimpleNamespace
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from benchmarks.fake_daemon import FakeDaemon
+from custom_components.remoterelay import coordinator as coordinator_module
+from custom_components.remoterelay.api import RemoteRelayApiError
+from custom_components.remoterelay.const import OPTIMISTIC_STATE_GRACE_SECONDS
+from custom_components.remoterelay.coordinator import RemoteRelayCoordinator
+
+SetupEntry = Callable[..., Awaitable[MockConfigEntry]]
+
+
+async def _refresh(coordinator: RemoteRelayCoordinator) -> None:
+    # Inside the post-command window refreshes skip fleet pacing and run at once.
+    coordinator.async_note_activity()
+    await coordinator.async_refresh()
+    assert coordinator.last_update_success
+
+
+def _polls(daemon: FakeDaemon) -> list[tuple[str, int]]:
+    """Return the state and profile requests since the log was last cleared."""
+    return [request for request in daemon.request_log if request[0] in ("/state", "/device")]
+
+
+async def test_unchanged_profile_is_not_parsed_again(daemon: FakeDaemon, setup_entry: SetupEntry) -> None:
+    device = daemon.devices[0]
+    device.proto_version = "2"
+    coordinator = (await setup_entry()).runtime_data.coordinator
+    profile = coordinator.data
+    daemon.request_log.clear()
+
+    await _refresh(coordinator)
+
+    # The daemon answers the conditional request with 304 and nothing is rebuilt.
+    assert _polls(daemon) == [("/device", 304)]
+    assert coordinator.data is profile
+
+    device.volume = 30
+    device.revision += 1
+    daemon.request_log.clear()
+    await _refresh(coordinator)
+
+    assert _polls(daemon) == [("/device", 200)]
+    assert coordinator.data.volume == 30
+
+
+async def test_state_ticks_fetch_the_profile_only_when_its_revision_moves(
+    daemon: FakeDaemon, setup_entry: SetupEntry
+) -> None:
+    device = daemon.devices[0]
+    coordinator = (await setup_entry()).runtime_data.coordinator
+    assert coordinator.uses_state_endpoint
+    daemon.request_log.clear()
+
+    # The first tick learns the profileRevision; the conditional profile request costs a 304.
+    await _refresh(coordinator)
+    assert _polls(daemon) == [("/state", 200), ("/device", 304)]
+
+    # A live state change bumps the profile ETag but not profileRevision.
+    device.volume = 20
+    device.revision += 1
+    daemon.request_log.clear()
+    await _refresh(coordinator)
+
+    assert _polls(daemon) == [("/state", 200)]
+    assert coordinator.data.volume == 20
+
+    device.source_count += 1
+    device.revision += 1
+    device.profile_revision += 1
+    daemon.request_log.clear()
+    await _refresh(coordinator)
+
+    assert _polls(daemon) == [("/state", 200), ("/device", 200)]
+    assert len(coordinator.data.sources) == device.source_count
+
+
+async def test_missing_state_endpoint_falls_back_to_the_profile(daemon: FakeDaemon, setup_entry: SetupEntry) -> None:
+    daemon.state_endpoint = False
+    coordinator = (await setup_entry()).runtime_data.coordinator
+    daemon.request_log.clear()
+
+    await _refresh(coordinator)
+
+    assert _polls(daemon) == [("/state", 404), ("/device", 304)]
+    assert not coordinator.uses_state_endpoint
+
+    daemon.request_log.clear()
+    await _refresh(coordinator)
+
+    assert _polls(daemon) == [("/device", 304)]
+
+
+async def test_first_state_tick_applies_the_live_state(daemon: FakeDaemon, setup_entry: SetupEntry) -> None:
+    device = daemon.devices[0]
+    coordinator = (await setup_entry()).runtime_data.coordinator
+    device.volume = 40
+    daemon.request_log.clear()
+
+    await _refresh(coordinator)
+
+    # profileRevision is not known yet, so the tick falls through to a 304 profile request.
+    assert _polls(daemon) == [("/state", 200), ("/device", 304)]
+    assert coordinator.data.volume == 40
+
+
+async def test_failed_command_rolls_back_the_optimistic_source(daemon: FakeDaemon, setup_entry: SetupEntry) -> None:
+    entry = await setup_entry()
+    coordinator = entry.runtime_data.coordinator
+    shown: list[str] = []
+    entry.async_on_unload(coordinator.async_add_listener(lambda: shown.append(coordinator.data.selected_source_id)))
+    daemon.fail_commands = True
+
+    with pytest.raises(RemoteRelayApiError):
+        await entry.runtime_data.dispatcher.async_send_command(
+            {"command": "select_source", "sourceId": "src-3"},
+            optimistic={"selected_source_id": "src-3"},
+        )
+
+    assert shown == ["src-3", "src-0"]
+    assert coordinator.data.selected_source_id == "src-0"
+
+
+async def test_refresh_clears_the_optimistic_overlay(
+    daemon: FakeDaemon, setup_entry: SetupEntry, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    device = daemon.devices[0]
+    coordinator = (await setup_entry()).runtime_data.coordinator
+
+    # Confirmed by the daemon: later refreshes follow the daemon again.
+    assert coordinator.async_set_optimistic({"selected_source_id": "src-5"})
+    device.selected_source_id = "src-5"
+    await _refresh(coordinator)
+    assert coordinator.data.selected_source_id == "src-5"
+    device.selected_source_id = "src-1"
+    await _refresh(coordinator)
+    assert coordinator.data.selected_source_id == "src-1"
+
+    # Never confirmed: shown through the grace period, then dropped by the next refresh.
+    assert coordinator.async_set_optimistic({"selected_source_id": "src-6"})
+    await _refresh(coordinator)
+    assert coordinator.data.selected_source_id == "src-6"
+
+    monkeypatch.setattr(
+        coordinator_module,
+        "time",
+        SimpleNamespace(monotonic=lambda: time.monotonic() + OPTIMISTIC_STATE_GRACE_SECONDS),
+    )
+    await _refresh(coordinator)
+    assert coordinator.data.selected_source_id == "src-1"
@@ -0,0 +1,197 @@
+"""Tests for command coalescing and the offline buffer of the dispatcher."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.remoterelay.const import (
+    CONF_BUFFER_OFFLINE_COMMANDS,
+    CONF_OFFLINE_COMMAND_TTL,
+    DOMAIN,
+    PROTO_VERSION_COMMAND_COUNT,
+)
+from custom_components.remoterelay.dispatcher import RemoteRelayCommandDispatcher
+
+from .common import async_wait_for
+
+VOLUME_UP = {"command": "volume_up"}
+
+
+def _nav(key: str) -> dict[str, Any]:
+    return {"command": "navigate", "key": key}
+
+
+class FakeApi:
+    """Records what reaches the daemon; ``gate`` holds each send until it is set."""
+
+    def __init__(self, proto_version: int) -> None:
+        self.proto_version = proto_version
+        self.sent: list[dict[str, Any]] = []
+        self.gate = asyncio.Event()
+        self.gate.set()
+
+    def supports(self, proto_version: int) -> bool:
+        return self.proto_version >= proto_version
+
+    async def async_send_command(self, payload: dict[str, Any]) -> dict[str, Any]:
+        self.sent.append(payload)
+        await self.gate.wait()
+        return {"ok": True, "sent": len(self.sent)}
+
+    async def async_send_commands(self, commands: list[dict[str, Any]]) -> dict[str, Any]:
+        self.sent.append({"batch": commands})
+        await self.gate.wait()
+        return {"ok": True, "sent": len(self.sent)}
+
+
+class FakeCoordinator:
+    """Just enough of RemoteRelayCoordinator for the dispatcher."""
+
+    def __init__(self) -> None:
+        self.last_update_success = True
+        self.waking = False
+        self.listeners: list = []
+
+    def async_add_listener(self, listener):
+        self.listeners.append(listener)
+        return lambda: self.listeners.remove(listener)
+
+    def async_set_optimistic(self, fields: dict[str, Any]) -> bool:
+        return False
+
+    def async_rollback_optimistic(self, fields: dict[str, Any]) -> None:
+        pass
+
+    def async_confirm_from_response(self, result: dict[str, Any]) -> None:
+        pass
+
+    def async_note_activity(self) -> None:
+        pass
+
+    async def async_wait_until_ready(self) -> None:
+        pass
+
+    def async_update_listeners(self) -> None:
+        for listener in list(self.listeners):
+            listener()
+
+
+async def _setup_dispatcher(
+    hass: HomeAssistant, proto_version: int, options: dict[str, Any] | None = None
+) -> tuple[RemoteRelayCommandDispatcher, FakeApi, FakeCoordinator]:
+    entry = MockConfigEntry(domain=DOMAIN, title="Living room PC", options=options or {})
+    entry.add_to_hass(hass)
+    api = FakeApi(proto_version)
+    coordinator = FakeCoordinator()
+    dispatcher = RemoteRelayCommandDispatcher(hass, entry, api, coordinator)
+    dispatcher.async_start()
+    return dispatcher, api, coordinator
+
+
+async def test_coalesces_repeated_keys_waiting_in_the_queue(hass: HomeAssistant) -> None:
+    dispatcher, api, _ = await _setup_dispatcher(hass, PROTO_VERSION_COMMAND_COUNT)
+    api.gate.clear()
+
+    first = asyncio.create_task(dispatcher.async_send_command(_nav("ok")))
+    await async_wait_for(lambda: len(api.sent) == 1)
+    queued = [
+        asyncio.create_task(dispatcher.async_send_command(payload))
+        for payload in (VOLUME_UP, VOLUME_UP, VOLUME_UP, _nav("up"), VOLUME_UP)
+    ]
+    await async_wait_for(lambda: dispatcher.queue_depth == 4)
+    api.gate.set()
+    results = await asyncio.gather(first, *queued)
+
+    assert api.sent == [_nav("ok"), {**VOLUME_UP, "count": 3}, _nav("up"), VOLUME_UP]
+    # Every caller merged into a command gets that command's result.
+    assert results[1] == results[2] == results[3]
+    assert dispatcher.coalesced_count == 2
+    assert dispatcher.sent_count == 4
+
+
+async def test_does_not_coalesce_without_count_support(hass: HomeAssistant) -> None:
+    dispatcher, api, _ = await _setup_dispatcher(hass, PROTO_VERSION_COMMAND_COUNT - 1)
+    api.gate.clear()
+
+    first = asyncio.create_task(dispatcher.async_send_command(_nav("ok")))
+    await async_wait_for(lambda: len(api.sent) == 1)
+    queued = [asyncio.create_task(dispatcher.async_send_command(VOLUME_UP)) for _ in range(3)]
+    await async_wait_for(lambda: dispatcher.queue_depth == 4)
+    api.gate.set()
+    await asyncio.gather(first, *queued)
+
+    assert api.sent == [_nav("ok"), VOLUME_UP, VOLUME_UP, VOLUME_UP]
+    assert dispatcher.coalesced_count == 0
+
+
+@pytest.mark.parametrize(
+    ("proto_version", "expected"),
+    [
+        (
+            PROTO_VERSION_COMMAND_COUNT,
+            [{**_nav("down"), "count": 2}, _nav("ok"), _nav("up"), _nav("down"), _nav("up")],
+        ),
+        (
+            PROTO_VERSION_COMMAND_COUNT - 1,
+            [_nav("down"), _nav("down"), _nav("ok"), _nav("up"), _nav("down"), _nav("up")],
+        ),
+    ],
+)
+async def test_offline_buffer_replays_in_order(
+    hass: HomeAssistant, proto_version: int, expected: list[dict[str, Any]]
+) -> None:
+    dispatcher, api, coordinator = await _setup_dispatcher(
+        hass,
+        proto_version,
+        {CONF_BUFFER_OFFLINE_COMMANDS: True, CONF_OFFLINE_COMMAND_TTL: 30},
+    )
+    coordinator.last_update_success = False
+
+    for key in ("down", "down", "ok", "up", "down", "up"):
+        assert await dispatcher.async_send_command(_nav(key)) == {"buffered": True}
+    assert api.sent == []
+
+    coordinator.last_update_success = True
+    coordinator.async_update_listeners()
+    await async_wait_for(lambda: dispatcher.as_dict()["replayed"] == len(expected))
+
+    assert api.sent == expected
+    assert dispatcher.as_dict()["buffered"] == 6
+    assert dispatcher.as_dict()["offline_buffer_depth"] == 0
+
+
+async def test_offline_buffer_keeps_power_off_live(hass: HomeAssistant) -> None:
+    dispatcher, api, coordinator = await _setup_dispatcher(
+        hass, PROTO_VERSION_COMMAND_COUNT, {CONF_BUFFER_OFFLINE_COMMANDS: True}
+    )
+    coordinator.last_update_success = False
+
+    await dispatcher.async_send_command({"command": "power_off"})
+
+    assert api.sent == [{"command": "power_off"}]
+    assert dispatcher.as_dict()["buffered"] == 0
+
+
+async def test_offline_buffer_drops_repeated_settings(hass: HomeAssistant) -> None:
+    dispatcher, api, coordinator = await _setup_dispatcher(
+        hass, PROTO_VERSION_COMMAND_COUNT, {CONF_BUFFER_OFFLINE_COMMANDS: True}
+    )
+    coordinator.last_update_success = False
+    hdmi, dp = ({"command": "select_source", "sourceId": source} for source in ("hdmi", "dp"))
+    play_pause = {"command": "play_pause"}
+
+    for payload in (hdmi, _nav("ok"), hdmi, play_pause, play_pause, dp, hdmi, hdmi):
+        await dispatcher.async_send_command(payload)
+
+    coordinator.last_update_success = True
+    coordinator.async_update_listeners()
+    await async_wait_for(lambda: dispatcher.as_dict()["replayed"] == 6)
+
+    # Toggles are not idempotent and are replayed as issued.
+    assert api.sent == [hdmi, _nav("ok"), play_pause, play_pause, dp, hdmi]
@@ -0,0 +1,72 @@
+"""Tests for macro parsing and compilation."""
+
+from __future__ import annotations
+
+import pytest
+
+from custom_components.remoterelay.const import MACRO_MAX_REPEAT, MACRO_MAX_WAIT_MS
+from custom_components.remoterelay.macros import (
+    compile_macro,
+    format_macros_text,
+    normalize_command,
+    parse_macros_text,
+)
+
+
+def test_normalize_command_resolves_aliases() -> None:
+    assert normalize_command(" Enter ") == "ok"
+    assert normalize_command("vol_up") == "volume_up"
+    assert normalize_command("home") == "home"
+
+
+def test_compile_macro_builds_a_batch_plan() -> None:
+    plan = compile_macro(["home", "Down x2", "wait 500", "wait 250", "enter", "vol_up*2", "wait 100"])
+
+    assert plan == [
+        {"command": "navigate", "key": "home"},
+        {"command": "navigate", "key": "down"},
+        {"command": "navigate", "key": "down", "delayMs": 750},
+        {"command": "navigate", "key": "ok"},
+        {"command": "volume_up"},
+        # A trailing wait is dropped.
+        {"command": "volume_up"},
+    ]
+
+
+def test_compiled_steps_are_independent() -> None:
+    plan = compile_macro(["up x2", "wait 100"])
+    plan[0]["delayMs"] = 1
+    assert "delayMs" not in plan[1]
+
+
+@pytest.mark.parametrize(
+    "steps",
+    [
+        [],
+        [" "],
+        ["wait 100", "ok"],
+        ["launch_rocket"],
+        ["up x0"],
+        [f"up x{MACRO_MAX_REPEAT + 1}"],
+        ["up", f"wait {MACRO_MAX_WAIT_MS + 1}"],
+        [f"up x{MACRO_MAX_REPEAT}", f"down x{MACRO_MAX_REPEAT}", "ok"],
+    ],
+)
+def test_compile_macro_rejects_invalid_steps(steps: list[str]) -> None:
+    with pytest.raises(ValueError):
+        compile_macro(steps)
+
+
+def test_parse_and_format_round_trip() -> None:
+    text = "open_menu: home, down x2, wait 500, ok\n\n# comment\nMute It: mute\n"
+
+    macros = parse_macros_text(text)
+
+    assert macros == {"open_menu": ["home", "down x2", "wait 500", "ok"], "mute_it": ["mute"]}
+    assert parse_macros_text(format_macros_text(macros)) == macros
+
+
+@pytest.mark.parametrize("text", ["no separator here", "bad name!: ok", "menu: home, nope"])
+def test_parse_macros_text_rejects_invalid_lines(text: str) -> None:
+    with pytest.raises(ValueError):
+        parse_macros_text(text)
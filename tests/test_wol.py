@@ -0,0 +1,107 @@
+"""Tests for the Wake-on-LAN sender, capturing packets on a local socket."""
+
+from __future__ import annotations
+
+import asyncio
+import socket
+from collections import Counter
+
+import pytest
+
+from custom_components.remoterelay.wol import async_send_magic_packets, build_magic_packet, split_address_list
+
+# The Home Assistant test plugin blocks sockets; these tests need real UDP on loopback.
+pytestmark = pytest.mark.usefixtures("socket_enabled")
+
+MAC_A = "aa:bb:cc:dd:ee:ff"
+MAC_B = "11-22-33-44-55-66"
+
+
+@pytest.fixture
+def receiver():
+    """A UDP socket on loopback standing in for the sleeping PC."""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sock.bind(("127.0.0.1", 0))
+    sock.setblocking(False)
+    yield sock
+    sock.close()
+
+
+async def _receive(sock: socket.socket, count: int) -> list[tuple[bytes, str]]:
+    loop = asyncio.get_running_loop()
+    received = []
+    async with asyncio.timeout(2):
+        while len(received) < count:
+            data, (address, _) = await loop.sock_recvfrom(sock, 1024)
+            received.append((data, address))
+    return received
+
+
+def test_build_magic_packet() -> None:
+    packet = build_magic_packet(MAC_A)
+    assert len(packet) == 102
+    assert packet[:6] == b"\xff" * 6
+    assert packet[6:] == bytes.fromhex("aabbccddeeff") * 16
+    assert build_magic_packet("AA-BB-CC-DD-EE-FF") == packet
+    assert build_magic_packet("aabb.ccdd.eeff") == packet
+
+
+@pytest.mark.parametrize("mac", ["", "aa:bb:cc:dd:ee", "aa:bb:cc:dd:ee:zz"])
+def test_build_magic_packet_rejects_invalid_mac(mac: str) -> None:
+    with pytest.raises(ValueError):
+        build_magic_packet(mac)
+
+
+def test_split_address_list() -> None:
+    assert split_address_list("192.168.1.255, 10.0.0.255  10.0.1.255") == ["192.168.1.255", "10.0.0.255", "10.0.1.255"]
+    assert split_address_list(None) == []
+    assert split_address_list(["a", " ", "b"]) == ["a", "b"]
+
+
+async def test_sends_every_burst_for_every_mac(receiver: socket.socket) -> None:
+    port = receiver.getsockname()[1]
+
+    sent = await async_send_magic_packets(
+        [MAC_A, MAC_B, MAC_A],
+        ["127.0.0.1", "127.0.0.1"],
+        port=port,
+        burst_count=3,
+        burst_spacing=0.01,
+    )
+
+    # Duplicate MACs and targets are sent once per burst.
+    assert sent == 6
+    packets = Counter(data for data, _ in await _receive(receiver, 6))
+    assert packets == {build_magic_packet(MAC_A): 3, build_magic_packet(MAC_B): 3}
+    assert all(len(data) == 102 for data in packets)
+
+
+async def test_binds_one_socket_per_interface(receiver: socket.socket) -> None:
+    port = receiver.getsockname()[1]
+
+    sent = await async_send_magic_packets(
+        [MAC_A],
+        ["127.0.0.1"],
+        interface_addresses=["127.0.0.1", "127.0.0.2"],
+        port=port,
+    )
+
+    assert sent == 2
+    sources = {address for _, address in await _receive(receiver, 2)}
+    assert sources == {"127.0.0.1", "127.0.0.2"}
+
+
+async def test_empty_target_list_falls_back_to_broadcast(monkeypatch: pytest.MonkeyPatch) -> None:
+    targets: list[tuple[str, int]] = []
+    loop = asyncio.get_running_loop()
+    create_endpoint = loop.create_datagram_endpoint
+
+    async def recording_endpoint(*args, **kwargs):
+        transport, protocol = await create_endpoint(*args, **kwargs)
+        monkeypatch.setattr(transport, "sendto", lambda data, addr: targets.append(addr))
+        return transport, protocol
+
+    monkeypatch.setattr(loop, "create_datagram_endpoint", recording_endpoint)
+
+    assert await async_send_magic_packets([MAC_A], [], port=9) == 1
+    assert targets == [("255.255.255.255", 9)]